@@ -4,9 +4,13 @@ CaptureCard 模組
 """
 
 import cv2
+import threading
+import time
 import numpy as np
 from typing import Tuple, Optional, List
 
+from utils.latest_slot import LatestSlot
+
 
 class CaptureCardCamera:
     """
@@ -25,6 +29,7 @@ class CaptureCardCamera:
                 - capture_fps: 目標幀率（默認 240）
                 - capture_device_index: 設備索引（默認 0）
                 - capture_fourcc_preference: FourCC 格式偏好列表（默認 ["NV12", "YUY2", "MJPG"]）
+                - capture_buffer_size: 驅動幀緩衝深度（默認 1，0 表示使用驅動默認值）
             region: 可選的區域元組 (left, top, right, bottom)，用於裁剪
         """
         # 從 config 獲取捕獲卡參數
@@ -33,6 +38,7 @@ class CaptureCardCamera:
         self.target_fps = float(getattr(config, "capture_fps", 240))
         self.device_index = int(getattr(config, "capture_device_index", 0))
         self.fourcc_pref = list(getattr(config, "capture_fourcc_preference", ["NV12", "YUY2", "MJPG"]))
+        self.buffer_size = int(getattr(config, "capture_buffer_size", 1))
         self.config = config  # 保存 config 引用以便動態讀取
         
         # 不存儲靜態區域 - 將在 get_latest_frame 中動態計算
@@ -48,6 +54,9 @@ class CaptureCardCamera:
                 self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, float(self.frame_width))
                 self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, float(self.frame_height))
                 self.cap.set(cv2.CAP_PROP_FPS, float(self.target_fps))
+                # 縮小驅動緩衝，避免讀到排隊中的舊幀（部分後端不支持，設置失敗時忽略）
+                if self.buffer_size > 0 and not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, float(self.buffer_size)):
+                    print(f"[CaptureCard] Backend {backend} does not support CAP_PROP_BUFFERSIZE")
                 
                 # 嘗試設置首選的 fourcc 格式
                 for fourcc in self.fourcc_pref:
@@ -69,6 +78,25 @@ class CaptureCardCamera:
         
         if self.cap is None or not self.cap.isOpened():
             raise RuntimeError(f"Failed to open capture card at device index {self.device_index}")
+        
+        # 抓取線程持續 grab() 以清空驅動緩衝，只有在被請求時才 retrieve() 解碼
+        self._frame_requested = threading.Event()
+        self._frame_slot = LatestSlot()
+        self._grab_thread = threading.Thread(target=self._grab_loop, daemon=True, name="CaptureCardGrab")
+        self._grab_thread.start()
+
+    def _grab_loop(self):
+        """抓取線程：持續 grab() 丟棄舊幀，有請求時解碼最新一幀放入槽位"""
+        while self.running:
+            cap = self.cap
+            if cap is None or not cap.grab():
+                time.sleep(0.001)
+                continue
+            if self._frame_requested.is_set():
+                self._frame_requested.clear()
+                ret, frame = cap.retrieve()
+                if ret and frame is not None:
+                    self._frame_slot.put(frame)
 
     def get_latest_frame(self):
         """
@@ -80,8 +108,13 @@ class CaptureCardCamera:
         if not self.cap or not self.cap.isOpened():
             return None
         
-        ret, frame = self.cap.read()
-        if not ret or frame is None:
+        # 請求抓取線程解碼下一次 grab 到的幀（阻塞至新幀到達）
+        # 先清空槽位：上一次請求超時後才放入的舊幀不應被本次請求取走
+        self._frame_slot.clear()
+        self._frame_requested.set()
+        try:
+            frame = self._frame_slot.get(timeout=0.5)
+        except TimeoutError:
             return None
         
         # 動態計算區域基於當前 config 值
@@ -122,6 +155,10 @@ class CaptureCardCamera:
     def stop(self):
         """停止捕獲卡相機"""
         self.running = False
+        # 先等待抓取線程退出，避免 release 時仍在 grab()
+        grab_thread = getattr(self, "_grab_thread", None)
+        if grab_thread and grab_thread.is_alive() and grab_thread is not threading.current_thread():
+            grab_thread.join(timeout=1.0)
         if self.cap:
             self.cap.release()
             self.cap = None
@@ -248,6 +285,7 @@ def get_default_capture_card_config() -> dict:
         "capture_fps": 240,
         "capture_device_index": 0,
         "capture_fourcc_preference": ["NV12", "YUY2", "MJPG"],
+        "capture_buffer_size": 1,
         "capture_range_x": 0,
         "capture_range_y": 0,
         "capture_offset_x": 0,
@@ -347,80 +347,70 @@ class OBS_SRT_Receiver:
             receive_time: Timestamp when data was received
         """
         try:
-            # Add data to buffer with lock for thread safety
+            jpeg_frames = []
+            max_frames_per_packet = 5  # Prevent infinite loops
+            
+            # Scan the reassembly buffer in place with offsets instead of copying it per packet
             with self.buffer_lock:
-                self.mjpeg_buffer.extend(data)
+                buffer = self.mjpeg_buffer
+                buffer.extend(data)
                 
                 # Prevent buffer from growing too large
-                buffer_len = len(self.mjpeg_buffer)
+                buffer_len = len(buffer)
                 if buffer_len > self.max_buffer_size:
                     logger.debug(f"MJPEG buffer too large ({buffer_len} bytes), clearing")
-                    self.mjpeg_buffer.clear()
+                    buffer.clear()
                     return
                 
-                # Work with local copy of buffer for processing
-                buffer = bytes(self.mjpeg_buffer)
-            
-            # Look for complete JPEG frames
-            frames_processed = 0
-            max_frames_per_packet = 5  # Prevent infinite loops
-            bytes_removed_from_start = 0  # Track how much we've removed from buffer start
-            
-            while frames_processed < max_frames_per_packet:
-                start_pos = buffer.find(self.mjpeg_start_marker)
-                if start_pos == -1:
-                    # No start marker found, keep only last part of buffer
-                    if len(buffer) > 2048:
-                        with self.buffer_lock:
-                            # Keep last 1024 bytes
-                            if len(self.mjpeg_buffer) > 1024:
-                                self.mjpeg_buffer = self.mjpeg_buffer[-1024:]
-                    break
-                
-                # Remove data before start marker from buffer
-                if start_pos > 0:
-                    bytes_removed_from_start += start_pos
-                    buffer = buffer[start_pos:]
-                
-                # Find end marker
-                end_pos = buffer.find(self.mjpeg_end_marker, 2)
-                if end_pos == -1:
-                    # No complete frame yet, wait for more data
-                    break
-                
-                # Extract complete JPEG frame
-                jpeg_data = buffer[:end_pos + 2]
-                frame_end_pos = end_pos + 2
-                
-                # Update buffer - remove processed data
-                bytes_removed_from_start += frame_end_pos
-                buffer = buffer[frame_end_pos:]
-                
-                # Validate JPEG data size and content
-                if len(jpeg_data) < 100:  # Skip very small frames
-                    continue
-                
-                # Additional validation: check for reasonable JPEG size
-                if len(jpeg_data) > 10 * 1024 * 1024:  # 10MB limit per frame
-                    logger.debug(f"JPEG frame too large: {len(jpeg_data)} bytes, skipping")
-                    continue
+                # Look for complete JPEG frames
+                pos = 0  # Everything before pos has been consumed
+                while len(jpeg_frames) < max_frames_per_packet:
+                    start_pos = buffer.find(self.mjpeg_start_marker, pos)
+                    if start_pos == -1:
+                        # No start marker found, keep only last part of buffer
+                        if buffer_len - pos > 2048:
+                            pos = buffer_len - 1024
+                        break
+                    
+                    # Data before start marker is discarded
+                    pos = start_pos
+                    
+                    # Find end marker
+                    end_pos = buffer.find(self.mjpeg_end_marker, start_pos + 2)
+                    if end_pos == -1:
+                        # No complete frame yet, wait for more data
+                        break
+                    
+                    frame_end_pos = end_pos + 2
+                    frame_size = frame_end_pos - start_pos
+                    pos = frame_end_pos
+                    
+                    # Validate JPEG data size
+                    if frame_size < 100:  # Skip very small frames
+                        continue
+                    if frame_size > 10 * 1024 * 1024:  # 10MB limit per frame
+                        logger.debug(f"JPEG frame too large: {frame_size} bytes, skipping")
+                        continue
+                    
+                    # Single copy of the complete JPEG frame (decoded on another thread)
+                    with memoryview(buffer) as view:
+                        jpeg_frames.append(bytes(view[start_pos:frame_end_pos]))
                 
-                # Submit frame decoding to thread pool for parallel processing
-                if self.executor and not self.stop_event.is_set():
-                    future = self.executor.submit(self._decode_jpeg_frame, jpeg_data, receive_time)
-                    # Store future with timestamp for processing
-                    try:
-                        self.frame_queue.put_nowait((future, receive_time))
-                    except Exception:
-                        # Queue full, skip this frame to maintain real-time performance
-                        pass
-                    frames_processed += 1
+                # Remove all processed data at once, in place
+                if pos > 0:
+                    del buffer[:pos]
             
-            # Update actual buffer in lock - remove all processed data at once
-            if bytes_removed_from_start > 0:
-                with self.buffer_lock:
-                    if bytes_removed_from_start <= len(self.mjpeg_buffer):
-                        self.mjpeg_buffer = self.mjpeg_buffer[bytes_removed_from_start:]
+            # Submit frame decoding to thread pool for parallel processing
+            for jpeg_data in jpeg_frames:
+                if not self.executor or self.stop_event.is_set():
+                    break
+                future = self.executor.submit(self._decode_jpeg_frame, jpeg_data, receive_time)
+                # Store future with timestamp for processing
+                try:
+                    self.frame_queue.put_nowait((future, receive_time))
+                except Exception:
+                    # Queue full, skip this frame to maintain real-time performance
+                    pass
                 
         except Exception as e:
             logger.error(f"Error processing MJPEG data: {e}", exc_info=True)
@@ -531,8 +521,11 @@ class OBS_SRT_Receiver:
             receive_time: Timestamp when frame was received
         """
         try:
+            # The decoded frame is owned by this receiver and shared read-only
+            # with the current-frame slot and callbacks instead of copied per consumer
+            frame.flags.writeable = False
             with self.frame_lock:
-                self.current_frame = frame.copy()
+                self.current_frame = frame
             
             # Update decoding FPS counter
             with self.processing_lock:
@@ -550,16 +543,16 @@ class OBS_SRT_Receiver:
             processing_start = time.time()
             if self.frame_callback_async and self._loop:
                 try:
-                    asyncio.run_coroutine_threadsafe(self.frame_callback_async(frame.copy()), self._loop)
+                    asyncio.run_coroutine_threadsafe(self.frame_callback_async(frame), self._loop)
                 except Exception as e:
                     logger.error(f"Error scheduling async frame callback: {e}")
             if self.frame_callback:
                 try:
                     # Callback in separate thread to avoid blocking
                     if self.executor:
-                        self.executor.submit(self.frame_callback, frame.copy())
+                        self.executor.submit(self.frame_callback, frame)
                     else:
-                        self.frame_callback(frame.copy())
+                        self.frame_callback(frame)
                 except Exception as e:
                     logger.error(f"Frame callback error: {e}", exc_info=True)
             processing_end = time.time()
@@ -1,5 +1,6 @@
 import cv2
 import socket
+import select
 import threading
 import time
 import asyncio
@@ -85,6 +86,9 @@ class OBS_UDP_Receiver:
         self.mjpeg_end_marker = b'\xff\xd9'    # JPEG end marker
         self.max_buffer_size = 2 * 1024 * 1024  # 2MB limit
         
+        # Batched receive: drain up to this many queued datagrams per wakeup
+        self.max_batch_packets = 64
+        
         logger.info(f"OBS_UDP_Receiver initialized: {ip}:{port}, max_workers={self.max_workers}")
     
     def set_frame_callback(self, callback: Callable[[np.ndarray], None]):
@@ -118,8 +122,9 @@ class OBS_UDP_Receiver:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             # Increase receive buffer size for high FPS streams
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1024 * 1024)
-            self.socket.settimeout(5.0)  # 5 second timeout
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+            # Non-blocking: the receive loop waits with select() and then drains all queued packets
+            self.socket.setblocking(False)
             
             # Bind to receive UDP packets
             self.socket.bind((self.ip, self.port))
@@ -302,21 +307,44 @@ class OBS_UDP_Receiver:
             logger.error(f"Error during disconnect: {e}", exc_info=True)
     
     def _receive_loop(self):
-        """Main receiving loop for UDP packets"""
+        """
+        Main receiving loop for UDP packets
+        
+        Waits for readability once, then drains every queued datagram into a single
+        batch (one select + N recv_into calls instead of a poll + recv per packet),
+        using a preallocated receive buffer to avoid per-packet allocations.
+        """
         self.is_receiving = True
         logger.info("Started UDP receive loop")
         
+        sock = self.socket
+        recv_buffer = bytearray(65536)  # Max UDP packet size
+        recv_view = memoryview(recv_buffer)
+        batch = bytearray()
+        
         while not self.stop_event.is_set() and self.is_connected:
             try:
-                # Receive UDP packet
-                data, addr = self.socket.recvfrom(65536)  # Max UDP packet size
+                readable, _, _ = select.select([sock], [], [], 0.5)
+                if not readable:
+                    continue
                 receive_time = time.time()
                 
+                # Drain queued packets
+                for _ in range(self.max_batch_packets):
+                    try:
+                        nbytes = sock.recv_into(recv_buffer)
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    batch += recv_view[:nbytes]
+                
                 # Process MJPEG data
-                self._process_mjpeg_data(data, receive_time)
+                if batch:
+                    self._process_mjpeg_data(batch, receive_time)
+                    batch.clear()
                 
-            except socket.timeout:
-                continue
+            except ValueError:
+                # Socket closed while waiting in select()
+                break
             except OSError as e:
                 if self.is_connected:
                     logger.error(f"Socket error in receive loop: {e}")
@@ -361,80 +389,70 @@ class OBS_UDP_Receiver:
             receive_time: Timestamp when data was received
         """
         try:
-            # Add data to buffer with lock for thread safety
+            jpeg_frames = []
+            max_frames_per_packet = 5  # Prevent infinite loops
+            
+            # Scan the reassembly buffer in place with offsets instead of copying it per packet
             with self.buffer_lock:
-                self.mjpeg_buffer.extend(data)
+                buffer = self.mjpeg_buffer
+                buffer.extend(data)
                 
                 # Prevent buffer from growing too large
-                buffer_len = len(self.mjpeg_buffer)
+                buffer_len = len(buffer)
                 if buffer_len > self.max_buffer_size:
                     logger.debug(f"MJPEG buffer too large ({buffer_len} bytes), clearing")
-                    self.mjpeg_buffer.clear()
+                    buffer.clear()
                     return
                 
-                # Work with local copy of buffer for processing
-                buffer = bytes(self.mjpeg_buffer)
-            
-            # Look for complete JPEG frames
-            frames_processed = 0
-            max_frames_per_packet = 5  # Prevent infinite loops
-            bytes_removed_from_start = 0  # Track how much we've removed from buffer start
-            
-            while frames_processed < max_frames_per_packet:
-                start_pos = buffer.find(self.mjpeg_start_marker)
-                if start_pos == -1:
-                    # No start marker found, keep only last part of buffer
-                    if len(buffer) > 2048:
-                        with self.buffer_lock:
-                            # Keep last 1024 bytes
-                            if len(self.mjpeg_buffer) > 1024:
-                                self.mjpeg_buffer = self.mjpeg_buffer[-1024:]
-                    break
-                
-                # Remove data before start marker from buffer
-                if start_pos > 0:
-                    bytes_removed_from_start += start_pos
-                    buffer = buffer[start_pos:]
+                # Look for complete JPEG frames
+                pos = 0  # Everything before pos has been consumed
+                while len(jpeg_frames) < max_frames_per_packet:
+                    start_pos = buffer.find(self.mjpeg_start_marker, pos)
+                    if start_pos == -1:
+                        # No start marker found, keep only last part of buffer
+                        if buffer_len - pos > 2048:
+                            pos = buffer_len - 1024
+                        break
+                    
+                    # Data before start marker is discarded
+                    pos = start_pos
+                    
+                    # Find end marker
+                    end_pos = buffer.find(self.mjpeg_end_marker, start_pos + 2)
+                    if end_pos == -1:
+                        # No complete frame yet, wait for more data
+                        break
+                    
+                    frame_end_pos = end_pos + 2
+                    frame_size = frame_end_pos - start_pos
+                    pos = frame_end_pos
+                    
+                    # Validate JPEG data size
+                    if frame_size < 100:  # Skip very small frames
+                        continue
+                    if frame_size > 10 * 1024 * 1024:  # 10MB limit per frame
+                        logger.debug(f"JPEG frame too large: {frame_size} bytes, skipping")
+                        continue
+                    
+                    # Single copy of the complete JPEG frame (decoded on another thread)
+                    with memoryview(buffer) as view:
+                        jpeg_frames.append(bytes(view[start_pos:frame_end_pos]))
                 
-                # Find end marker
-                end_pos = buffer.find(self.mjpeg_end_marker, 2)
-                if end_pos == -1:
-                    # No complete frame yet, wait for more data
+                # Remove all processed data at once, in place
+                if pos > 0:
+                    del buffer[:pos]
+            
+            # Submit frame decoding to thread pool for parallel processing
+            for jpeg_data in jpeg_frames:
+                if not self.executor or self.stop_event.is_set():
                     break
-                
-                # Extract complete JPEG frame
-                jpeg_data = buffer[:end_pos + 2]
-                frame_end_pos = end_pos + 2
-                
-                # Update buffer - remove processed data
-                bytes_removed_from_start += frame_end_pos
-                buffer = buffer[frame_end_pos:]
-                
-                # Validate JPEG data size and content
-                if len(jpeg_data) < 100:  # Skip very small frames
-                    continue
-                
-                # Additional validation: check for reasonable JPEG size
-                if len(jpeg_data) > 10 * 1024 * 1024:  # 10MB limit per frame
-                    logger.debug(f"JPEG frame too large: {len(jpeg_data)} bytes, skipping")
-                    continue
-                
-                # Submit frame decoding to thread pool for parallel processing
-                if self.executor and not self.stop_event.is_set():
-                    future = self.executor.submit(self._decode_jpeg_frame, jpeg_data, receive_time)
-                    # Store future with timestamp for processing
-                    try:
-                        self.frame_queue.put_nowait((future, receive_time))
-                    except Exception:
-                        # Queue full, skip this frame to maintain real-time performance
-                        pass
-                    frames_processed += 1
-            
-            # Update actual buffer in lock - remove all processed data at once
-            if bytes_removed_from_start > 0:
-                with self.buffer_lock:
-                    if bytes_removed_from_start <= len(self.mjpeg_buffer):
-                        self.mjpeg_buffer = self.mjpeg_buffer[bytes_removed_from_start:]
+                future = self.executor.submit(self._decode_jpeg_frame, jpeg_data, receive_time)
+                # Store future with timestamp for processing
+                try:
+                    self.frame_queue.put_nowait((future, receive_time))
+                except Exception:
+                    # Queue full, skip this frame to maintain real-time performance
+                    pass
                 
         except Exception as e:
             logger.error(f"Error processing MJPEG data: {e}", exc_info=True)
@@ -545,8 +563,11 @@ class OBS_UDP_Receiver:
             receive_time: Timestamp when frame was received
         """
         try:
+            # The decoded frame is owned by this receiver and shared read-only
+            # with the current-frame slot and callbacks instead of copied per consumer
+            frame.flags.writeable = False
             with self.frame_lock:
-                self.current_frame = frame.copy()
+                self.current_frame = frame
             
             # Update decoding FPS counter
             with self.processing_lock:
@@ -564,16 +585,16 @@ class OBS_UDP_Receiver:
             processing_start = time.time()
             if self.frame_callback_async and self._loop:
                 try:
-                    asyncio.run_coroutine_threadsafe(self.frame_callback_async(frame.copy()), self._loop)
+                    asyncio.run_coroutine_threadsafe(self.frame_callback_async(frame), self._loop)
                 except Exception as e:
                     logger.error(f"Error scheduling async frame callback: {e}")
             if self.frame_callback:
                 try:
                     # Callback in separate thread to avoid blocking
                     if self.executor:
-                        self.executor.submit(self.frame_callback, frame.copy())
+                        self.executor.submit(self.frame_callback, frame)
                     else:
-                        self.frame_callback(frame.copy())
+                        self.frame_callback(frame)
                 except Exception as e:
                     logger.error(f"Frame callback error: {e}", exc_info=True)
             processing_end = time.time()
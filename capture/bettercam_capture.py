@@ -43,6 +43,7 @@ class BetterCamCapture:
         self.camera = None
         self.running = False
         self._gpu_bgra_mode = False  # GPU 模式是否使用 BGRA（需要手動轉換）
+        self._region = None  # 當前擷取區域 (left, top, right, bottom)
         
         # 從 config 獲取設置（如果提供）
         if config:
@@ -151,41 +152,15 @@ class BetterCamCapture:
                     self.screen_width = 1920
                     self.screen_height = 1080
             
-            # 計算擷取區域（範圍至少為 1x1）
-            capture_width = max(1, self.range_x) if self.range_x > 0 else self.screen_width
-            capture_height = max(1, self.range_y) if self.range_y > 0 else self.screen_height
-            
-            # 計算中心點並應用偏移
-            center_x = self.screen_width // 2
-            center_y = self.screen_height // 2
-            
-            # 計算左上角座標（基於中心點偏移）
-            left = center_x - capture_width // 2 + self.offset_x
-            top = center_y - capture_height // 2 + self.offset_y
-            
-            # 確保區域在屏幕範圍內
-            left = max(0, min(left, self.screen_width - 1))
-            top = max(0, min(top, self.screen_height - 1))
-            right = min(left + capture_width, self.screen_width)
-            bottom = min(top + capture_height, self.screen_height)
-            
-            # 調整實際擷取尺寸
-            actual_width = right - left
-            actual_height = bottom - top
-            
-            if actual_width <= 0 or actual_height <= 0:
-                logger.error(f"無效的擷取區域: {left}, {top}, {right}, {bottom}, 屏幕: {self.screen_width}x{self.screen_height}")
-                return False
-            
-            # 確保 region 參數有效（BetterCam 要求 right > left 且 bottom > top）
-            if right <= left or bottom <= top:
-                logger.error(f"無效的擷取區域尺寸: width={actual_width}, height={actual_height}")
+            region_tuple = self._compute_region()
+            if region_tuple is None:
                 return False
+            left, top, right, bottom = region_tuple
             
             # 創建 BetterCam 實例
             # 增加緩衝區大小以支持高 FPS（默認 64，增加到 128）
             # 注意：BetterCam 的 region 參數格式是 (left, top, right, bottom)
-            region_tuple = (left, top, right, bottom)
+            self._region = region_tuple
             
             if self.use_gpu:
                 try:
@@ -254,6 +229,79 @@ class BetterCamCapture:
             self.running = False
             return False
     
+    def _compute_region(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        按當前範圍和偏移計算擷取區域
+        
+        Returns:
+            (left, top, right, bottom)，區域無效時返回 None
+        """
+        # 計算擷取區域（範圍至少為 1x1）
+        capture_width = max(1, self.range_x) if self.range_x > 0 else self.screen_width
+        capture_height = max(1, self.range_y) if self.range_y > 0 else self.screen_height
+        
+        # 計算中心點並應用偏移
+        center_x = self.screen_width // 2
+        center_y = self.screen_height // 2
+        
+        # 計算左上角座標（基於中心點偏移）
+        left = center_x - capture_width // 2 + self.offset_x
+        top = center_y - capture_height // 2 + self.offset_y
+        
+        # 確保區域在屏幕範圍內
+        left = max(0, min(left, self.screen_width - 1))
+        top = max(0, min(top, self.screen_height - 1))
+        right = min(left + capture_width, self.screen_width)
+        bottom = min(top + capture_height, self.screen_height)
+        
+        # 確保 region 參數有效（BetterCam 要求 right > left 且 bottom > top）
+        if right <= left or bottom <= top:
+            logger.error(f"無效的擷取區域: {left}, {top}, {right}, {bottom}, 屏幕: {self.screen_width}x{self.screen_height}")
+            return None
+        return (left, top, right, bottom)
+    
+    def set_region(self, range_x: int, range_y: int, offset_x: int = 0, offset_y: int = 0) -> bool:
+        """
+        就地更新擷取範圍和偏移（不釋放 BetterCam 實例）
+        
+        GPU 模式下一次 grab() 即使用新區域；CPU 模式只重啟內部擷取線程。
+        
+        Args:
+            range_x: 擷取寬度
+            range_y: 擷取高度
+            offset_x: X 軸偏移
+            offset_y: Y 軸偏移
+        
+        Returns:
+            bool: 是否已更新（失敗時調用方應退回 restart()）
+        """
+        self.range_x = int(range_x)
+        self.range_y = int(range_y)
+        self.offset_x = int(offset_x)
+        self.offset_y = int(offset_y)
+        if self.config:
+            self.config.bettercam_range_x = self.range_x
+            self.config.bettercam_range_y = self.range_y
+            self.config.bettercam_offset_x = self.offset_x
+            self.config.bettercam_offset_y = self.offset_y
+        if not self.camera or not self.running:
+            return False
+        region = self._compute_region()
+        if region is None:
+            return False
+        if region == self._region:
+            return True
+        try:
+            if not self.use_gpu:
+                self.camera.stop()
+                self.camera.start(region=region, target_fps=self.target_fps if self.target_fps > 0 else 300)
+            self._region = region
+        except Exception as e:
+            logger.warning(f"就地更新 BetterCam 區域失敗: {e}")
+            return False
+        logger.info(f"BetterCam 區域已更新: {region}")
+        return True
+    
     def get_latest_frame(self) -> Optional[np.ndarray]:
         """
         獲取最新的屏幕截圖
@@ -269,7 +317,7 @@ class BetterCamCapture:
             # 因為 GPU 模式的 frame_buffer 是 numpy 數組，無法存儲 cupy 數組
             if self.use_gpu:
                 # 直接使用 grab()，不經過 frame_buffer
-                frame = self.camera.grab()
+                frame = self.camera.grab(region=self._region)
                 if frame is None or frame.size == 0:
                     return None
                 
@@ -74,12 +74,28 @@ class MSSCapture:
         self.config = config  # 保存 config 引用以便動態讀取
         self.running = True
         
+        # 兩個輪流使用的 BGR 輸出緩衝（擷取區域尺寸改變時才重新分配）
+        self._frame_buffers = [None, None]
+        self._frame_buffer_index = 0
+        
         logger.info(f"MSS 初始化完成: {self.screen_width}x{self.screen_height}")
     
+    def _next_frame_buffer(self, height: int, width: int) -> np.ndarray:
+        """返回下一個 BGR 輸出緩衝（兩個緩衝輪流使用，尺寸不符時重新分配）"""
+        self._frame_buffer_index ^= 1
+        buffer = self._frame_buffers[self._frame_buffer_index]
+        if buffer is None or buffer.shape[0] != height or buffer.shape[1] != width:
+            buffer = np.empty((height, width, 3), dtype=np.uint8)
+            self._frame_buffers[self._frame_buffer_index] = buffer
+        return buffer
+    
     def get_latest_frame(self) -> Optional[np.ndarray]:
         """
         獲取最新的屏幕截圖
         
+        返回的幀寫入內部預先分配的緩衝，在下下次調用時會被覆蓋；
+        需要長期保存時請自行 copy()
+        
         Returns:
             numpy.ndarray or None: 截圖幀（BGR 格式）
         """
@@ -164,7 +180,6 @@ class MSSCapture:
             # 確保在當前線程中使用 MSS（MSS 使用線程本地存儲）
             try:
                 screenshot = self.mss_monitor.grab(monitor)
-                frame = np.array(screenshot)
             except AttributeError as e:
                 # 如果遇到線程本地存儲錯誤，重新創建 MSS 對象
                 if "'_thread._local' object has no attribute" in str(e):
@@ -172,24 +187,16 @@ class MSSCapture:
                     try:
                         self.mss_monitor = mss.mss()
                         screenshot = self.mss_monitor.grab(monitor)
-                        frame = np.array(screenshot)
                     except Exception as e2:
                         logger.error(f"重新創建 MSS monitor 後仍失敗: {e2}")
                         return None
                 else:
                     raise
             
-            # MSS 返回 BGRA，轉換為 BGR
-            if frame.shape[2] == 4:
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
-            elif frame.shape[2] == 3:
-                # 已經是 BGR
-                pass
-            else:
-                logger.warning(f"意外的幀格式: {frame.shape}")
-                return None
-            
-            return frame
+            # MSS 返回 BGRA 原始數據：以 numpy 視圖讀取（不複製），轉換為 BGR 時直接寫入預先分配的緩衝
+            height, width = screenshot.height, screenshot.width
+            bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(height, width, 4)
+            return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=self._next_frame_buffer(height, width))
             
         except Exception as e:
             logger.error(f"MSS 擷取錯誤: {e}")
@@ -1,18 +1,28 @@
 import sys
 import os
+
+# 各處理階段各自使用一個線程，避免 OpenCV / OpenMP 內部線程池與之爭用 CPU（須在導入 numpy 前設置）
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 import cv2
 import numpy as np
 import time
 import logging
 import threading
 import socket
-from concurrent.futures import ThreadPoolExecutor
-from queue import Queue, Empty
+import functools
+import importlib
+import importlib.util
+from collections import deque
+from types import SimpleNamespace
+from typing import NamedTuple, Optional
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QHBoxLayout, QLabel, QPushButton, QSpinBox, 
+                            QHBoxLayout, QLabel, QPushButton, 
                             QGroupBox, QRadioButton, QButtonGroup, QLineEdit,
-                            QFormLayout, QTextEdit, QCheckBox, QFrame, QGridLayout, QSlider, QComboBox)
-from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal, QObject
+                            QFormLayout, QPlainTextEdit, QCheckBox, QFrame, QGridLayout, QSlider, QComboBox,
+                            QStackedWidget)
+from PyQt5.QtCore import (QTimer, Qt, QThread, pyqtSignal, QObject, QSignalBlocker,
+                          QThreadPool, QRunnable, QEvent)
 from PyQt5.QtGui import QImage, QPixmap, QFont
 
 # 導入詳細的日誌系統
@@ -21,6 +31,8 @@ from utils.debugLog import get_logger, log_exception, log_connection_event, log_
 # 初始化 logger - 使用新的日誌系統
 logger = get_logger(__name__)
 
+cv2.setNumThreads(1)
+
 # 導入自定義模組 - 直接使用 OBS_UDP.py
 try:
     from capture.OBS_UDP import OBS_UDP_Receiver
@@ -31,91 +43,399 @@ except Exception as e:
     })
     raise  # 如果無法載入 OBS_UDP.py，應該報錯
 
-# 導入 OBS_TCP 模組
-try:
-    from capture.OBS_TCP import OBS_TCP_Receiver
-    TCP_AVAILABLE = True
-    logger.info("成功載入 OBS_TCP.py")
-except Exception as e:
-    TCP_AVAILABLE = False
-    log_exception(e, context="載入 OBS_TCP 模組", additional_info={
-        "模組": "OBS_TCP.py",
-        "影響": "TCP 擷取模式不可用"
-    })
-    logger.warning(f"OBS_TCP 未安裝或載入失敗，TCP 擷取模式不可用: {e}")
-
-# 導入 OBS_SRT 模組
-try:
-    from capture.OBS_SRT import OBS_SRT_Receiver
-    SRT_AVAILABLE = True
-    logger.info("成功載入 OBS_SRT.py")
-except Exception as e:
-    SRT_AVAILABLE = False
-    log_exception(e, context="載入 OBS_SRT 模組", additional_info={
-        "模組": "OBS_SRT.py",
-        "影響": "SRT 擷取模式不可用"
-    })
-    logger.warning(f"OBS_SRT 未安裝或載入失敗，SRT 擷取模式不可用: {e}")
 from utils.mouse import Mouse
 import utils.mouse as mouse_module
-from ui.debug_window import DebugWindowManager
+from ui.debug_window import (DebugWindowManager, INFO_FPS, INFO_RESOLUTION, INFO_DETECTION_SIZE,
+                             INFO_STATE, INFO_HOTKEYS, INFO_ALL)
+from ui.range_input import RangeInput, make_spin_box, set_value_silently
 from utils.color_detector import ColorDetector
 from utils.click_controller import ClickController
 from utils.config_manager import ConfigManager
+from utils.latest_slot import LatestSlot
+from utils.frame_counter import FrameCounter
 from capture.CaptureCard import create_capture_card_camera, CaptureCardCamera
 from ui.language_manager import get_language_manager, t
 
-# 嘗試導入可選的擷取庫
-try:
-    from capture.mss_capture import create_mss_capture, MSSCapture
-    MSS_AVAILABLE = True
-    logger.info("MSS 擷取庫載入成功")
-except ImportError as e:
-    MSS_AVAILABLE = False
-    log_exception(e, context="載入 MSS 擷取庫", additional_info={
-        "模組": "mss_capture",
-        "影響": "MSS 擷取模式不可用"
-    })
-    logger.warning(f"mss 未安裝或載入失敗，MSS 擷取模式不可用: {e}")
+# 可選擷取後端：啟動時只用 find_spec 檢查是否存在，首次使用時才真正導入
+# 名稱 -> (擷取模組, 必需的第三方套件, 顯示名稱)
+_BACKENDS = {
+    "tcp": ("capture.OBS_TCP", None, "OBS_TCP"),
+    "srt": ("capture.OBS_SRT", None, "OBS_SRT"),
+    "mss": ("capture.mss_capture", "mss", "MSS"),
+    "bettercam": ("capture.bettercam_capture", "bettercam", "BetterCam"),
+    "dxgi": ("capture.dxgi_capture", "dxcam", "DXGI"),
+    "ndi": ("capture.ndi_capture", "cyndilib", "NDI"),
+}
+_loaded_backends = {}
 
-try:
-    from capture.bettercam_capture import create_bettercam_capture, BetterCamCapture
-    BETTERCAM_AVAILABLE = True
-    logger.info("BetterCam 擷取庫載入成功")
-except ImportError as e:
-    BETTERCAM_AVAILABLE = False
-    log_exception(e, context="載入 BetterCam 擷取庫", additional_info={
-        "模組": "bettercam_capture",
-        "影響": "BetterCam 擷取模式不可用"
-    })
-    logger.warning(f"bettercam 未安裝或載入失敗，BetterCam 擷取模式不可用: {e}")
 
-try:
-    from capture.dxgi_capture import create_dxgi_capture, DXGICapture
-    DXGI_AVAILABLE = True
-    logger.info("DXGI 擷取庫載入成功")
-except ImportError as e:
-    DXGI_AVAILABLE = False
-    log_exception(e, context="載入 DXGI 擷取庫", additional_info={
-        "模組": "dxgi_capture",
-        "影響": "DXGI 擷取模式不可用"
-    })
-    logger.warning(f"dxcam 未安裝或載入失敗，DXGI 擷取模式不可用: {e}")
+def _backend_available(name):
+    """不導入模組，僅檢查擷取後端及其依賴是否可找到"""
+    module_name, package, _ = _BACKENDS[name]
+    try:
+        if importlib.util.find_spec(module_name) is None:
+            return False
+        return package is None or importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
 
-try:
-    from capture.ndi_capture import create_ndi_capture, NDICapture
-    NDI_AVAILABLE = True
-    logger.info("NDI 擷取庫載入成功")
-except ImportError as e:
-    NDI_AVAILABLE = False
-    log_exception(e, context="載入 NDI 擷取庫", additional_info={
-        "模組": "ndi_capture",
-        "影響": "NDI 擷取模式不可用"
-    })
-    logger.warning(f"NDI 未安裝或載入失敗，NDI 擷取模式不可用: {e}")
+
+def _load_backend(name):
+    """首次使用時導入擷取後端模組（結果會被緩存），失敗返回 None"""
+    if name in _loaded_backends:
+        return _loaded_backends[name]
+    module_name, package, label = _BACKENDS[name]
+    try:
+        module = importlib.import_module(module_name)
+        logger.info(f"成功載入 {label} 擷取模組")
+    except Exception as e:
+        module = None
+        log_exception(e, context=f"載入 {label} 擷取模組", additional_info={
+            "模組": module_name,
+            "影響": f"{label} 擷取模式不可用"
+        })
+        logger.warning(f"{label} 未安裝或載入失敗，{label} 擷取模式不可用: {e}")
+    _loaded_backends[name] = module
+    return module
+
+
+_BACKEND_AVAILABLE = {name: _backend_available(name) for name in _BACKENDS}
+for _name, _available in _BACKEND_AVAILABLE.items():
+    if not _available:
+        _module_name, _package, _label = _BACKENDS[_name]
+        logger.warning(f"{_package or _module_name} 未安裝，{_label} 擷取模式不可用")
+
+TCP_AVAILABLE = _BACKEND_AVAILABLE["tcp"]
+SRT_AVAILABLE = _BACKEND_AVAILABLE["srt"]
+MSS_AVAILABLE = _BACKEND_AVAILABLE["mss"]
+BETTERCAM_AVAILABLE = _BACKEND_AVAILABLE["bettercam"]
+DXGI_AVAILABLE = _BACKEND_AVAILABLE["dxgi"]
+NDI_AVAILABLE = _BACKEND_AVAILABLE["ndi"]
 
 CONFIG_FILE = "config.json"
 
+# 螢幕擷取（MSS / BetterCam / DXGI）共用的範圍與偏移欄位：
+# (欄位名, 翻譯鍵, 預設標籤, 數值範圍, 是否觸發範圍更新)
+SCREEN_REGION_FIELDS = [
+    ("range_x", "range_x", "範圍 X (0=全屏)", (1, 7680), True),
+    ("range_y", "range_y", "範圍 Y (0=全屏)", (1, 4320), True),
+    ("offset_x", "offset_x", "偏移 X (中心點)", (-3840, 3840), True),
+    ("offset_y", "offset_y", "偏移 Y (中心點)", (-2160, 2160), True),
+    ("trigger_offset_x", "trigger_offset_x", "觸發中心偏移 X", (-3840, 3840), False),
+    ("trigger_offset_y", "trigger_offset_y", "觸發中心偏移 Y", (-2160, 2160), False),
+]
+
+
+def _region_fields(prefix: str) -> list:
+    """為指定擷取模式生成欄位表（屬性名為 {prefix}_{欄位名}_input）"""
+    return [(f"{prefix}_{name}_input", label_key, label_default, value_range, notify)
+            for name, label_key, label_default, value_range, notify in SCREEN_REGION_FIELDS]
+
+
+MSS_FIELDS = _region_fields("mss")
+BETTERCAM_FIELDS = _region_fields("bettercam")
+DXGI_FIELDS = _region_fields("dxgi")
+# DXGI 重新啟動時需要同步到擷取對象的配置鍵
+DXGI_CONFIG_KEYS = tuple(attr_name[:-len("_input")] for attr_name, *_ in DXGI_FIELDS) + ("dxgi_target_fps",)
+
+# NDI 擷取線程的輪詢間隔（秒）
+NDI_POLL_INTERVAL = 0.001
+
+# 本機 IP 快取有效期（秒）
+LOCAL_IPS_TTL = 60.0
+# 網路串流模式面板中顯示本機 IP 的標籤屬性名
+_LOCAL_IP_LABELS = {"udp": "local_ip_label", "tcp": "tcp_local_ip_label", "srt": "srt_local_ip_label"}
+
+# 日誌框保留的最大行數
+LOG_MAX_LINES = 500
+
+# 屏幕擷取模式共用的屏幕分辨率配置鍵（<= 0 表示自動檢測）
+SCREEN_SIZE_KEYS = ("screen_width", "screen_height")
+
+# Capture Card 設置面板欄位：(屬性名, 翻譯鍵, 預設標籤, 數值範圍, 是否觸發回調)
+CAPTURE_CARD_FIELDS = [
+    ("capture_device_index_input", "device_index", "設備索引", (0, 10), False),
+    ("capture_width_input", "width", "寬度", (320, 7680), False),
+    ("capture_height_input", "height", "高度", (240, 4320), False),
+    ("capture_fps_input", "fps", "FPS", (1, 300), False),
+    ("capture_range_x_input", "range_x", "範圍 X (0=自動)", (0, 7680), False),
+    ("capture_range_y_input", "range_y", "範圍 Y (0=自動)", (0, 4320), False),
+    ("capture_offset_x_input", "offset_x", "偏移 X", (-3840, 3840), False),
+    ("capture_offset_y_input", "offset_y", "偏移 Y", (-2160, 2160), False),
+]
+
+class ConfigWidget(NamedTuple):
+    """保存配置時讀取的控件"""
+    key: str     # 配置鍵
+    attr: str    # 屬性名
+    getter: str  # 讀取方法
+
+
+CONFIG_WIDGETS = (
+    ConfigWidget("udp_ip", "ip_input", "text"),
+    ConfigWidget("udp_port", "port_input", "value"),
+    ConfigWidget("target_fps", "udp_fps_input", "value"),
+    ConfigWidget("tcp_ip", "tcp_ip_input", "text"),
+    ConfigWidget("tcp_port", "tcp_port_input", "value"),
+    ConfigWidget("tcp_fps", "tcp_fps_input", "value"),
+    ConfigWidget("tcp_server_mode", "tcp_server_mode_checkbox", "isChecked"),
+    ConfigWidget("srt_ip", "srt_ip_input", "text"),
+    ConfigWidget("srt_port", "srt_port_input", "value"),
+    ConfigWidget("srt_fps", "srt_fps_input", "value"),
+    ConfigWidget("srt_listener_mode", "srt_listener_mode_checkbox", "isChecked"),
+    ConfigWidget("capture_low_latency", "capture_low_latency_checkbox", "isChecked"),
+    ConfigWidget("bettercam_target_fps", "bettercam_fps_input", "value"),
+    ConfigWidget("dxgi_target_fps", "dxgi_fps_input", "value"),
+    ConfigWidget("color_from_r", "color_from_r", "value"),
+    ConfigWidget("color_from_g", "color_from_g", "value"),
+    ConfigWidget("color_from_b", "color_from_b", "value"),
+    ConfigWidget("color_to_r", "color_to_r", "value"),
+    ConfigWidget("color_to_g", "color_to_g", "value"),
+    ConfigWidget("color_to_b", "color_to_b", "value"),
+    ConfigWidget("target_color_r", "target_color_r", "value"),
+    ConfigWidget("target_color_g", "target_color_g", "value"),
+    ConfigWidget("target_color_b", "target_color_b", "value"),
+    ConfigWidget("tolerance", "tolerance_input", "value"),
+    ConfigWidget("detection_size", "detection_size_input", "value"),
+) + tuple(
+    # 欄位表中的輸入框：配置鍵為屬性名去掉 _input 後綴
+    ConfigWidget(field[0][:-len("_input")], field[0], "value")
+    for fields in (CAPTURE_CARD_FIELDS, MSS_FIELDS, BETTERCAM_FIELDS, DXGI_FIELDS)
+    for field in fields
+)
+
+# 擷取模式選項：(模式數據/翻譯鍵, 預設名稱, 所需後端；None 表示內建)
+CAPTURE_MODE_ITEMS = (
+    ("udp", "UDP", None),
+    ("tcp", "TCP", "tcp"),
+    ("srt", "SRT", "srt"),
+    ("capture_card", "Capture Card", None),
+    ("bettercam_cpu", "BetterCam (CPU)", "bettercam"),
+    ("bettercam_gpu", "BetterCam (GPU)", "bettercam"),
+    ("mss", "MSS", "mss"),
+    ("dxgi", "DXGI", "dxgi"),
+    ("ndi", "OBS NDI", "ndi"),
+)
+
+# 選擇器數據 -> (擷取模式, BetterCam 模式)；不在表中的模式對應 (模式本身, "cpu")
+_MODE_PARSE = {
+    "bettercam_cpu": ("bettercam", "cpu"),
+    "bettercam_gpu": ("bettercam", "gpu"),
+}
+_BETTERCAM_MODES = frozenset(_MODE_PARSE)
+
+# update_display 顯示畫面的擷取模式
+_DISPLAY_MODES = frozenset({"udp", "capture_card", "mss", "dxgi"}) | _BETTERCAM_MODES
+# 以幀計數器統計擷取 FPS 的本地擷取模式
+_FRAME_COUNTER_MODES = frozenset({"capture_card", "mss", "dxgi"}) | _BETTERCAM_MODES
+
+# 各擷取模式的連接狀態檢查（參數為主窗口）
+_CONN_CHECKERS = {
+    "udp": lambda window: window.udp_receiver is not None and window.udp_receiver.is_connected,
+    "tcp": lambda window: window.tcp_receiver is not None and window.tcp_receiver.is_connected,
+    "srt": lambda window: window.srt_receiver is not None and window.srt_receiver.is_connected,
+    "capture_card": lambda window: (window.capture_card_camera is not None
+                                    and window.capture_card_camera.cap is not None
+                                    and window.capture_card_camera.cap.isOpened()),
+    "bettercam_cpu": lambda window: window.bettercam_camera is not None and window.bettercam_camera.running,
+    "bettercam_gpu": lambda window: window.bettercam_camera is not None and window.bettercam_camera.running,
+    "mss": lambda window: window.mss_capture is not None and window.mss_capture.running,
+    "dxgi": lambda window: window.dxgi_capture is not None and window.dxgi_capture.running,
+    "ndi": lambda window: window.ndi_capture is not None and window.ndi_capture.is_connected(),
+}
+
+
+def _not_connected(_window) -> bool:
+    """未知擷取模式視為未連接"""
+    return False
+
+
+class CaptureSource(NamedTuple):
+    """擷取源停止表項"""
+    attr: str             # 屬性名
+    label: str            # 顯示名稱
+    log_key: str          # 日誌翻譯鍵
+    stop_method: str      # 停止方法
+    connected_only: bool  # 是否僅在已連接時停止
+
+
+CAPTURE_SOURCES = (
+    CaptureSource("udp_receiver", "UDP", "udp_disconnected", "disconnect", True),
+    CaptureSource("tcp_receiver", "TCP", "tcp_disconnected", "disconnect", True),
+    CaptureSource("srt_receiver", "SRT", "srt_disconnected", "disconnect", True),
+    CaptureSource("capture_card_camera", "Capture Card", "capture_card_disconnected", "stop", False),
+    CaptureSource("bettercam_camera", "BetterCam", "bettercam_disconnected", "stop", False),
+    CaptureSource("mss_capture", "MSS", "mss_disconnected", "stop", False),
+    CaptureSource("dxgi_capture", "DXGI", "dxgi_disconnected", "stop", False),
+    CaptureSource("ndi_capture", "NDI", "ndi_disconnected", "stop", False),
+)
+# 停止失敗時日誌附加信息的固定部分（按屬性名預先建立）
+_CAPTURE_SOURCE_LOG_INFO = {source.attr: {"擷取模式": source.label} for source in CAPTURE_SOURCES}
+_CAPTURE_SOURCE_BY_ATTR = {source.attr: source for source in CAPTURE_SOURCES}
+
+
+class CaptureConnector(NamedTuple):
+    """擷取模式連接處理（文字欄位為 (翻譯鍵, 預設文字)）"""
+    attr: str                   # 擷取對象屬性名
+    backend: Optional[str]      # 所需的可選後端（None 表示內建）
+    not_installed: tuple        # 後端未安裝時的提示
+    opener: str                 # 創建並啟動擷取對象的方法名，啟動失敗返回 None（讀取的參數寫入 info 供異常日誌使用）
+    success: tuple              # 連接成功日誌（可含 {mode}）
+    failed: tuple               # 啟動失敗日誌
+    error: tuple                # 連接異常日誌（含 {error}）
+    status: Optional[tuple]     # 連接後的狀態文字（None 表示等待網路串流畫面）
+    thread_starter: Optional[str]  # 啟動幀獲取線程的方法名（網路串流由接收器回調推送）
+    context: str                # 異常日誌上下文
+
+
+_CONNECTION_FAILED = ("connection_failed", "✗ 連接失敗")
+_CONNECTION_ERROR = ("connection_failed_error", "✗ 連接失敗: {error}")
+
+# 擷取模式（已解析）-> 連接處理
+CAPTURE_CONNECTORS = {
+    "udp": CaptureConnector(
+        "udp_receiver", None, None, "_open_udp",
+        ("udp_connected_success", "✓ 成功連接到 OBS UDP 流"), _CONNECTION_FAILED, _CONNECTION_ERROR,
+        None, None, "UDP 連接"),
+    "tcp": CaptureConnector(
+        "tcp_receiver", "tcp", ("tcp_not_installed", "✗ TCP 模組未安裝"), "_open_tcp",
+        ("tcp_connected_success", "✓ 成功連接到 OBS TCP 流"), _CONNECTION_FAILED, _CONNECTION_ERROR,
+        None, None, "TCP 連接"),
+    "srt": CaptureConnector(
+        "srt_receiver", "srt", ("srt_not_installed", "✗ SRT 模組未安裝"), "_open_srt",
+        ("srt_connected_success", "✓ 成功連接到 OBS SRT 流"), _CONNECTION_FAILED, _CONNECTION_ERROR,
+        None, None, "SRT 連接"),
+    "capture_card": CaptureConnector(
+        "capture_card_camera", None, None, "_open_capture_card",
+        ("capture_card_connected", "✓ 成功連接到 Capture Card"), _CONNECTION_FAILED,
+        ("capture_card_connection_failed", "✗ Capture Card 連接失敗: {error}"),
+        ("capture_card_connected", "Capture Card 已連接"), "_start_capture_card_thread", "Capture Card 連接"),
+    "bettercam": CaptureConnector(
+        "bettercam_camera", "bettercam", ("bettercam_not_installed", "✗ BetterCam 未安裝，請先安裝: pip install bettercam"),
+        "_open_bettercam",
+        ("bettercam_started", "✓ BetterCam ({mode}) 已啟動"),
+        ("bettercam_start_failed", "✗ BetterCam 啟動失敗"),
+        ("bettercam_start_failed", "✗ BetterCam 啟動失敗: {error}"),
+        ("bettercam_connected", "BetterCam 已連接"), "_start_bettercam_thread", "BetterCam 啟動"),
+    "mss": CaptureConnector(
+        "mss_capture", "mss", ("mss_not_installed_msg", "✗ MSS 未安裝，請先安裝: pip install mss"), "_open_mss",
+        ("mss_started", "✓ MSS 已啟動"),
+        ("mss_start_failed", "✗ MSS 啟動失敗"),
+        ("mss_start_failed", "✗ MSS 啟動失敗: {error}"),
+        ("mss_connected", "MSS 已連接"), "_start_mss_thread", "MSS 啟動"),
+    "dxgi": CaptureConnector(
+        "dxgi_capture", "dxgi", ("dxgi_not_installed_msg", "✗ DXGI (dxcam) 未安裝，請先安裝: pip install dxcam"),
+        "_open_dxgi",
+        ("dxgi_started", "✓ DXGI 已啟動"),
+        ("dxgi_start_failed", "✗ DXGI 啟動失敗"),
+        ("dxgi_start_failed", "✗ DXGI 啟動失敗: {error}"),
+        ("dxgi_connected", "DXGI 已連接"), "_start_dxgi_thread", "DXGI 啟動"),
+    "ndi": CaptureConnector(
+        "ndi_capture", "ndi", ("ndi_not_installed_msg", "✗ NDI 未安裝，請先安裝: pip install cyndilib"), "_open_ndi",
+        ("ndi_started", "✓ NDI 已啟動"),
+        ("ndi_start_failed", "✗ NDI 啟動失敗，請檢查 NDI 源是否可用"),
+        ("ndi_start_failed", "✗ NDI 啟動失敗: {error}"),
+        ("ndi_connected", "NDI 已連接"), "_start_ndi_thread", "NDI 啟動"),
+}
+
+
+def _region_log_info(config, prefix: str) -> dict:
+    """擷取範圍和偏移的日誌附加信息（從 {prefix}_range_* / {prefix}_offset_* 屬性讀取）"""
+    return {
+        "範圍": f"{getattr(config, prefix + '_range_x')}x{getattr(config, prefix + '_range_y')}",
+        "偏移": f"({getattr(config, prefix + '_offset_x')}, {getattr(config, prefix + '_offset_y')})",
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _primary_screen_size() -> tuple:
+    """主螢幕解析度（Windows API，只查詢一次；不可用時返回 1920x1080）"""
+    try:
+        import ctypes
+        user32 = ctypes.windll.user32
+        return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)  # SM_CXSCREEN, SM_CYSCREEN
+    except Exception:
+        return 1920, 1080
+
+
+def _probe_local_ips() -> list:
+    """
+    獲取本機所有IP地址（可能因 DNS 查詢阻塞，應在後台線程調用）
+    
+    Returns:
+        IP地址列表（最多 5 個）
+    """
+    ips = []
+    seen = set()  # 已加入列表的 IP（不含主機名前綴）
+    try:
+        # 獲取主機名
+        hostname = socket.gethostname()
+        
+        # 獲取主機名對應的IP
+        try:
+            host_ip = socket.gethostbyname(hostname)
+            if host_ip and host_ip != "127.0.0.1":
+                ips.append(f"{hostname}: {host_ip}")
+                seen.add(host_ip)
+        except Exception:
+            pass
+        
+        # 獲取所有網絡接口的 IPv4 地址（進程內查詢，不需要啟動 ipconfig）
+        try:
+            for _family, _type, _proto, _name, sockaddr in socket.getaddrinfo(hostname, None, socket.AF_INET):
+                ip = sockaddr[0]
+                if ip and ip != "127.0.0.1" and not ip.startswith("169.254") and ip not in seen:
+                    ips.append(ip)
+                    seen.add(ip)
+        except Exception:
+            pass
+        
+        # 使用 socket 獲取所有接口
+        try:
+            # 連接到外部地址以獲取本機IP
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                # 連接到一個不存在的地址，不會實際發送數據
+                s.connect(('8.8.8.8', 80))
+                local_ip = s.getsockname()[0]
+                if local_ip and local_ip not in seen:
+                    ips.insert(0, local_ip)
+            except Exception:
+                pass
+            finally:
+                s.close()
+        except Exception:
+            pass
+        
+        # 如果沒有找到，至少顯示 localhost
+        if not ips:
+            ips.append("127.0.0.1 (localhost)")
+        
+    except Exception as e:
+        logger.error(f"獲取本機IP時出錯: {e}")
+        ips = ["無法獲取"]
+    
+    return ips[:5]  # 最多顯示5個IP
+
+
+def _set_text_if_changed(widget, text: str):
+    """文字改變時才調用 setText（相同文字也會觸發重新佈局和重繪）"""
+    if widget.text() != text:
+        widget.setText(text)
+
+
+def _set_style_if_changed(widget, style: str):
+    """樣式表改變時才調用 setStyleSheet（相同樣式也會重新解析並重新套用樣式）"""
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
+
+@functools.lru_cache(maxsize=256)
+def _color_preview_style(r: int, g: int, b: int) -> str:
+    """顏色預覽框樣式字串（按 RGB 緩存）"""
+    return f"background-color: rgb({r}, {g}, {b}); border: 2px solid #555; border-radius: 4px;"
+
+
 # 暗色科技風樣式表
 MODERN_STYLESHEET = """
 QMainWindow {
@@ -148,7 +468,7 @@ QGroupBox::title {
 }
 
 /* 輸入框 */
-QLineEdit, QSpinBox, QTextEdit {
+QLineEdit, QSpinBox, QPlainTextEdit {
     background-color: #1E1E1E;
     border: 1px solid #333333;
     border-radius: 4px;
@@ -351,8 +671,124 @@ QLabel#DetectionStatus {
     border: 1px solid #333;
     color: #FFF;
 }
+
+QLabel#FpsLabel {
+    color: #00E5FF;
+    font-family: 'Consolas', monospace;
+    font-size: 9pt;
+    padding: 4px 8px;
+}
+
+QLabel#LocalIpLabel {
+    color: #00E5FF;
+    font-size: 9pt;
+}
+
+/* 連接信息：通過 state 屬性切換顏色 */
+QLabel#ConnectionInfoLabel {
+    color: #888888;
+    font-size: 9pt;
+}
+
+QLabel#ConnectionInfoLabel[state="connected"] {
+    color: #00E5FF;
+}
+
+QLabel#ConnectionInfoLabel[state="error"] {
+    color: #FF5555;
+}
+
+/* 固定樣式的控件：通過 objectName 套用全局樣式，避免逐個解析樣式表 */
+QFrame#SepLine {
+    background-color: #333;
+}
+
+QLabel#SectionLabel {
+    font-weight: bold;
+    color: #E0E0E0;
+}
+
+QLabel#CooldownLabel {
+    color: #888;
+    font-size: 10pt;
+}
+
+QLabel#MouseStatusLabel {
+    color: #ff5555;
+    font-weight: bold;
+    font-size: 11pt;
+}
+
+QCheckBox#DebugWindowCheckbox {
+    font-weight: bold;
+    color: #00E5FF;
+}
+
+QPlainTextEdit#LogText {
+    font-family: 'Consolas';
+    font-size: 9pt;
+    background-color: #1a1a1a;
+    border: none;
+}
 """
 
+class DetectionBridge(QObject):
+    """將檢測結果從幀處理線程傳遞到主線程"""
+    result_ready = pyqtSignal(object)
+
+
+class ConfigWriteTask(QRunnable):
+    """在線程池中寫入已序列化的配置（避免磁碟 I/O 阻塞主線程）"""
+    
+    def __init__(self, config_manager: ConfigManager, payload: str):
+        super().__init__()
+        self.config_manager = config_manager
+        self.payload = payload
+    
+    def run(self):
+        self.config_manager.write_payload(self.payload)
+
+
+class CaptureLoopThread(QThread):
+    """以最高優先級運行擷取循環的線程（擷取源停止後循環自行結束）"""
+    
+    def __init__(self, capture_loop, name: str, parent=None):
+        super().__init__(parent)
+        self._capture_loop = capture_loop
+        self.setObjectName(name)
+    
+    def run(self):
+        self._capture_loop()
+
+
+class NDISourceScanner(QThread):
+    """在後台線程中探測 NDI 源（網路探測可能阻塞數百毫秒）"""
+    sources_found = pyqtSignal(list)
+    scan_failed = pyqtSignal(str)
+    
+    def __init__(self, ndi_module, parent=None):
+        super().__init__(parent)
+        self.ndi_module = ndi_module
+    
+    def run(self):
+        try:
+            # 創建臨時接收器來獲取源列表
+            temp_receiver = self.ndi_module.NDI_Receiver()
+            sources = temp_receiver.list_sources(refresh=True)
+            temp_receiver.disconnect()
+            self.sources_found.emit(list(sources or []))
+        except Exception as e:
+            self.scan_failed.emit(str(e))
+
+
+class LocalIpProbe(QThread):
+    """在後台線程中探測本機 IP（DNS 查詢可能阻塞界面）"""
+    ips_found = pyqtSignal(list)
+    
+    def run(self):
+        self.ips_found.emit(_probe_local_ips())
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -368,19 +804,12 @@ class MainWindow(QMainWindow):
         saved_lang = self.config_manager.get("language", "zh_CN")
         if saved_lang:
             self.language_manager.load_language(saved_lang)
+        self._rebuild_text_cache()
         
         # 從配置初始化控制器（支持範圍或單一值）
-        press_delay_min = self.config_manager.get("press_delay_min", self.config_manager.get("press_delay", 0))
-        press_delay_max = self.config_manager.get("press_delay_max", self.config_manager.get("press_delay", 0))
-        self.click_controller.set_press_delay_range(press_delay_min, press_delay_max)
-        
-        release_delay_min = self.config_manager.get("release_delay_min", self.config_manager.get("release_delay", 50))
-        release_delay_max = self.config_manager.get("release_delay_max", self.config_manager.get("release_delay", 50))
-        self.click_controller.set_release_delay_range(release_delay_min, release_delay_max)
-        
-        cooldown_min = self.config_manager.get("trigger_cooldown_min", self.config_manager.get("trigger_cooldown", 100))
-        cooldown_max = self.config_manager.get("trigger_cooldown_max", self.config_manager.get("trigger_cooldown", 100))
-        self.click_controller.set_cooldown_range(cooldown_min, cooldown_max)
+        self.click_controller.set_press_delay_range(*self.config_manager.get_delay_range("press_delay"))
+        self.click_controller.set_release_delay_range(*self.config_manager.get_delay_range("release_delay"))
+        self.click_controller.set_cooldown_range(*self.config_manager.get_delay_range("trigger_cooldown"))
         
         # 初始化組件
         self.udp_receiver = None
@@ -397,54 +826,38 @@ class MainWindow(QMainWindow):
         self.debug_window = None  # 調試窗口實例
         
         # 畫面更新標記
-        self.last_frame_time = time.time()
-        self.frame_count = 0
-        self.frame_count_start_time = time.time()
+        self.last_frame_ns = time.perf_counter_ns()
+        self.frame_counter = FrameCounter()  # 擷取線程遞增、主線程讀取和重置（無鎖）
+        self.frame_count_start_ns = time.perf_counter_ns()
+        self._last_fps_log_ns = self.frame_count_start_ns  # 上次記錄 FPS 調試日誌的時間
         
         # FPS 計算
         self.ui_update_count = 0
-        self.ui_update_start_time = time.time()
+        self.ui_update_start_ns = time.perf_counter_ns()
         self.capture_fps = 0.0
         self.ui_fps = 0.0
         
         # 異步處理框架
-        # 檢測線程池：用於並行處理顏色檢測
-        # 增加線程數以支持高 FPS 處理
-        self.detection_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="Detection")
-        
-        # 幀處理隊列：用於異步處理接收到的幀
-        # 增大隊列大小以支持高 FPS（144+），避免成為瓶頸
-        self.frame_processing_queue = Queue(maxsize=60)  # 增加隊列大小以支持更高 FPS
-        
-        # 檢測結果隊列：用於從檢測線程傳遞結果到主線程
-        self.detection_result_queue = Queue(maxsize=20)  # 增加結果隊列大小
-        
-        # 啟動多個幀處理線程以提升並行處理能力
-        # 使用多線程並行處理幀，提升高 FPS 下的處理能力
-        num_frame_processors = 4  # 使用 4 個幀處理線程
-        self.frame_processor_threads = []
-        for i in range(num_frame_processors):
-            thread = threading.Thread(
+        # 幀處理槽：只保留最新一幀，舊幀直接被覆蓋，避免排隊延遲
+        self.frame_processing_queue = LatestSlot()
+        # 可重用的檢測區域緩衝（處理線程用完、或槽中被覆蓋後歸還，擷取線程不再每幀分配）
+        self._region_buffers = deque()
+        
+        # 最新檢測結果（由處理線程寫入），顯示狀態改變時通過信號通知主線程
+        self.latest_detection_result = None
+        self._last_emitted_detection_key = None
+        self.detection_bridge = DetectionBridge()
+        self.detection_bridge.result_ready.connect(self.on_detection_result, Qt.QueuedConnection)
+        
+        # 單一幀處理線程：檢測為向量化運算，多線程只會增加 GIL 競爭與隊列交接開銷
+        self.frame_processor_thread = threading.Thread(
             target=self._frame_processor_loop,
             daemon=True,
-                name=f"FrameProcessor-{i}"
+            name="FrameProcessor"
         )
-            thread.start()
-            self.frame_processor_threads.append(thread)
+        self.frame_processor_thread.start()
         
-        # 檢測結果處理線程
-        self.result_processor_thread = threading.Thread(
-            target=self._result_processor_loop,
-            daemon=True,
-            name="ResultProcessor"
-        )
-        self.result_processor_thread.start()
-        
-        # 線程安全鎖
-        self.detection_lock = threading.Lock()
-        self.frame_lock = threading.Lock()
-        
-        # 當前處理中的幀（用於調試窗口）
+        # 當前處理中的幀（單一寫入者 / 讀取者，引用賦值本身是原子的，不需要鎖）
         self.current_display_frame = None
         
         # 顏色選擇器狀態
@@ -455,25 +868,85 @@ class MainWindow(QMainWindow):
         self.current_connection_ip = None
         self.current_connection_port = None
         
+        # 本機 IP 快取（後台探測，超過 LOCAL_IPS_TTL 秒後再次顯示時重新探測）
+        self._cached_local_ips = None
+        self._local_ips_time = 0.0
+        self._local_ip_probe = None
+        self._info_mask = INFO_ALL  # 調試窗口信息項目位元遮罩
+        self._capture_mode_combo_lang = None  # 擷取模式選擇器當前選項所用的語言
+        
+        # 顏色預覽框當前顯示的 RGB（用於跳過重複的樣式設置）
+        self._color_preview_rgb = {}
+        # 各顏色鍵的 ((R, G, B) 輸入框, 預覽框)，由 _build_color_row 填入
+        self._color_rows = {}
+        
+        # NDI 源列表是否已探測（延遲到首次使用 NDI 模式）
+        self._ndi_sources_loaded = False
+        self._ndi_scanner = None
+        
+        # 範圍處理器最後一次處理的 (範圍 X, 範圍 Y, 偏移 X, 偏移 Y)，按擷取模式
+        self._last_range_keys = {}
+        
+        # 運行中的擷取循環線程（關閉窗口時等待結束）
+        self._capture_threads = set()
+        
+        # 日誌緩衝：同一批日誌合併為一次界面更新（上限與日誌框保留條數一致）
+        self._log_queue = deque(maxlen=LOG_MAX_LINES)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(33)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        
+        # 配置延遲寫入：連續調整時合併為一次寫檔
+        self._config_dirty = False
+        self._config_flush_timer = QTimer(self)
+        self._config_flush_timer.setSingleShot(True)
+        self._config_flush_timer.setInterval(500)
+        self._config_flush_timer.timeout.connect(self._flush_config)
+        # 配置寫入線程池（單線程，保證寫入順序）
+        self._config_write_pool = QThreadPool(self)
+        self._config_write_pool.setMaxThreadCount(1)
+        
+        # 擷取模式切換合併：50ms 內的連續切換只處理最後一次
+        self._pending_mode_index = -1
+        self._applied_mode_data = None  # 最後一次已處理的擷取模式選擇器數據
+        self._mode_change_timer = QTimer(self)
+        self._mode_change_timer.setSingleShot(True)
+        self._mode_change_timer.setInterval(50)
+        self._mode_change_timer.timeout.connect(self._apply_pending_mode_change)
+        
+        # DXGI 重新啟動合併：連續調整範圍 / FPS 時只在最後一次改變後重新啟動一次
+        self._dxgi_restart_message = None
+        self._dxgi_restart_timer = QTimer(self)
+        self._dxgi_restart_timer.setSingleShot(True)
+        self._dxgi_restart_timer.setInterval(250)
+        self._dxgi_restart_timer.timeout.connect(self._apply_dxgi_restart)
+        
+        # 連接信息刷新合併：同一事件循環內的多次請求只刷新一次
+        self._pending_conn_update = False
+        
+        # 主螢幕解析度改變時清除快取，下次使用時重新查詢
+        primary_screen = QApplication.primaryScreen()
+        if primary_screen is not None:
+            primary_screen.geometryChanged.connect(lambda _geometry: _primary_screen_size.cache_clear())
+        
         # 設置 UI
         self.setup_ui()
         
-        # 從配置載入設置
+        # 從配置載入設置（配置檔重新載入後自動同步到 UI）
         self.load_settings_from_config()
+        self.config_manager.on_change(lambda _config: self.load_settings_from_config())
         
         # 初始化當前擷取模式
         mode_data = self.capture_mode_combo.currentData()
-        if mode_data and mode_data.startswith("bettercam_"):
-            self.current_capture_mode = "bettercam"
-        elif mode_data:
-            self.current_capture_mode = mode_data
-        else:
-            self.current_capture_mode = "udp"
+        self.current_capture_mode = _MODE_PARSE.get(mode_data, (mode_data or "udp", "cpu"))[0]
+        if self.current_capture_mode == "ndi":
+            self._ensure_ndi_sources()
         
         # 定時器用於更新畫面和統計
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(33)  # 約 30 FPS
+        self.update_timer.start(33)  # 初始約 30 FPS，之後根據擷取 FPS 自動調整
         
         # 更新窗口標題
         self.update_window_title()
@@ -487,6 +960,8 @@ class MainWindow(QMainWindow):
         """設置用戶界面 (三欄式佈局)"""
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
+        # 構建整個界面期間暫停重繪，完成後一次性佈局和更新
+        central_widget.setUpdatesEnabled(False)
         
         # 使用垂直主佈局：頂部控制 -> 中間內容 -> 底部日誌
         main_layout = QVBoxLayout(central_widget)
@@ -534,6 +1009,8 @@ class MainWindow(QMainWindow):
         footer_layout.addStretch()
 
         main_layout.addWidget(footer_widget)
+        
+        central_widget.setUpdatesEnabled(True)
 
     def create_top_bar(self):
         """創建頂部控制欄"""
@@ -576,7 +1053,7 @@ class MainWindow(QMainWindow):
         
         # FPS 顯示標籤
         self.fps_label = QLabel(t("ui_fps_display", "UI FPS: 0.0 | 擷取FPS: 0.0"))
-        self.fps_label.setStyleSheet("color: #00E5FF; font-family: 'Consolas', monospace; font-size: 9pt; padding: 4px 8px;")
+        self.fps_label.setObjectName("FpsLabel")
         layout.addWidget(self.fps_label)
         
         layout.addStretch()
@@ -610,44 +1087,31 @@ class MainWindow(QMainWindow):
     def create_settings_panel(self):
         """創建設置面板 (左欄)"""
         panel = QGroupBox(t("parameter_settings", "參數設置"))
+        # 批量創建控件期間暫停重繪，完成後一次性更新
+        panel.setUpdatesEnabled(False)
         layout = QVBoxLayout(panel)
         layout.setSpacing(15)
         
+        # 各面板重複使用的標籤只翻譯一次
+        ip_text = t("ip_address", "IP 地址") + ":"
+        port_text = t("port", "端口") + ":"
+        target_fps_text = t("target_fps", "目標 FPS") + ":"
+        unlimited_fps_text = t("target_fps", "目標 FPS (0=無限制)") + ":"
+        local_ip_text = t("local_ip", "本機 IP") + ":"
+        connection_info_text = t("connection_info", "連接信息") + ":"
+        not_connected_text = t("not_connected", "未連接")
+        rgb_labels = (t("r", "R"), t("g", "G"), t("b", "B"))
+        target_color_text = t("target_color", "目標顏色") + ":"
+        field_labels = {}  # 欄位表標籤快取（範圍 / 偏移標籤在多個面板中重複）
+        
         # 0. 擷取模式選擇
         capture_mode_layout = QFormLayout()
         capture_mode_layout.setSpacing(8)
         
         self.capture_mode_combo = QComboBox()
-        self.capture_mode_combo.addItem(t("udp", "UDP"), "udp")
-        if TCP_AVAILABLE:
-            self.capture_mode_combo.addItem(t("tcp", "TCP"), "tcp")
-        else:
-            self.capture_mode_combo.addItem(t("tcp", "TCP") + " " + t("tcp_not_installed", "[未安裝]"), "tcp")
-        if SRT_AVAILABLE:
-            self.capture_mode_combo.addItem(t("srt", "SRT"), "srt")
-        else:
-            self.capture_mode_combo.addItem(t("srt", "SRT") + " " + t("srt_not_installed", "[未安裝]"), "srt")
-        self.capture_mode_combo.addItem(t("capture_card", "Capture Card"), "capture_card")
-        if BETTERCAM_AVAILABLE:
-            self.capture_mode_combo.addItem(t("bettercam_cpu", "BetterCam (CPU)"), "bettercam_cpu")
-            self.capture_mode_combo.addItem(t("bettercam_gpu", "BetterCam (GPU)"), "bettercam_gpu")
-        else:
-            self.capture_mode_combo.addItem(t("bettercam_cpu", "BetterCam (CPU)") + " " + t("bettercam_not_installed", "[未安裝]"), "bettercam_cpu")
-            self.capture_mode_combo.addItem(t("bettercam_gpu", "BetterCam (GPU)") + " " + t("bettercam_not_installed", "[未安裝]"), "bettercam_gpu")
-        if MSS_AVAILABLE:
-            self.capture_mode_combo.addItem(t("mss", "MSS"), "mss")
-        else:
-            self.capture_mode_combo.addItem(t("mss", "MSS") + " " + t("mss_not_installed", "[未安裝]"), "mss")
-        if DXGI_AVAILABLE:
-            self.capture_mode_combo.addItem(t("dxgi", "DXGI"), "dxgi")
-        else:
-            self.capture_mode_combo.addItem(t("dxgi", "DXGI") + " " + t("dxgi_not_installed", "[未安裝]"), "dxgi")
-        if NDI_AVAILABLE:
-            self.capture_mode_combo.addItem(t("ndi", "OBS NDI"), "ndi")
-        else:
-            self.capture_mode_combo.addItem(t("ndi", "OBS NDI") + " " + t("ndi_not_installed", "[未安裝]"), "ndi")
+        self._populate_capture_mode_combo()
         
-        self.capture_mode_combo.currentIndexChanged.connect(self.on_capture_mode_changed)
+        self.capture_mode_combo.currentIndexChanged.connect(self._queue_capture_mode_change)
         capture_mode_label = QLabel(t("capture_mode", "擷取模式") + ":")
         capture_mode_layout.addRow(capture_mode_label, self.capture_mode_combo)
         self.capture_mode_label = capture_mode_label  # 保存引用以便更新
@@ -658,7 +1122,7 @@ class MainWindow(QMainWindow):
         line = QFrame()
         line.setFrameShape(QFrame.HLine)
         line.setFrameShadow(QFrame.Sunken)
-        line.setStyleSheet("background-color: #333;")
+        line.setObjectName("SepLine")
         layout.addWidget(line)
         
         # 1. UDP 設置面板
@@ -667,27 +1131,25 @@ class MainWindow(QMainWindow):
         udp_layout.setSpacing(8)
         
         self.ip_input = QLineEdit()
-        self.port_input = QSpinBox()
-        self.port_input.setRange(1, 65535)
-        self.udp_fps_input = QSpinBox()
-        self.udp_fps_input.setRange(30, 240)
+        self.port_input = self._make_spin_box((1, 65535))
+        self.udp_fps_input = self._make_spin_box((30, 240))
         
-        udp_layout.addRow(t("ip_address", "IP 地址") + ":", self.ip_input)
-        udp_layout.addRow(t("port", "端口") + ":", self.port_input)
-        udp_layout.addRow(t("target_fps", "目標 FPS") + ":", self.udp_fps_input)
+        udp_layout.addRow(ip_text, self.ip_input)
+        udp_layout.addRow(port_text, self.port_input)
+        udp_layout.addRow(target_fps_text, self.udp_fps_input)
         
         # 本機IP顯示
         self.local_ip_label = QLabel()
-        self.local_ip_label.setStyleSheet("color: #00E5FF; font-size: 9pt;")
+        self.local_ip_label.setObjectName("LocalIpLabel")
         self.local_ip_label.setWordWrap(True)
-        self._update_local_ip_display()
-        udp_layout.addRow(t("local_ip", "本機 IP") + ":", self.local_ip_label)
+        self._update_local_ip_display(self.local_ip_label)
+        udp_layout.addRow(local_ip_text, self.local_ip_label)
         
         # 當前連接信息顯示
-        self.connection_info_label = QLabel(t("not_connected", "未連接"))
-        self.connection_info_label.setStyleSheet("color: #888888; font-size: 9pt;")
+        self.connection_info_label = QLabel(not_connected_text)
+        self.connection_info_label.setObjectName("ConnectionInfoLabel")
         self.connection_info_label.setWordWrap(True)
-        udp_layout.addRow(t("connection_info", "連接信息") + ":", self.connection_info_label)
+        udp_layout.addRow(connection_info_text, self.connection_info_label)
         
         self.udp_settings_group.setLayout(udp_layout)
         layout.addWidget(self.udp_settings_group)
@@ -698,29 +1160,27 @@ class MainWindow(QMainWindow):
         tcp_layout.setSpacing(8)
         
         self.tcp_ip_input = QLineEdit()
-        self.tcp_port_input = QSpinBox()
-        self.tcp_port_input.setRange(1, 65535)
-        self.tcp_fps_input = QSpinBox()
-        self.tcp_fps_input.setRange(30, 240)
+        self.tcp_port_input = self._make_spin_box((1, 65535))
+        self.tcp_fps_input = self._make_spin_box((30, 240))
         self.tcp_server_mode_checkbox = QCheckBox()
         
-        tcp_layout.addRow(t("ip_address", "IP 地址") + ":", self.tcp_ip_input)
-        tcp_layout.addRow(t("port", "端口") + ":", self.tcp_port_input)
-        tcp_layout.addRow(t("target_fps", "目標 FPS") + ":", self.tcp_fps_input)
+        tcp_layout.addRow(ip_text, self.tcp_ip_input)
+        tcp_layout.addRow(port_text, self.tcp_port_input)
+        tcp_layout.addRow(target_fps_text, self.tcp_fps_input)
         tcp_layout.addRow(t("server_mode", "伺服器模式 (監聽連接)") + ":", self.tcp_server_mode_checkbox)
         
         # 本機IP顯示
         self.tcp_local_ip_label = QLabel()
-        self.tcp_local_ip_label.setStyleSheet("color: #00E5FF; font-size: 9pt;")
+        self.tcp_local_ip_label.setObjectName("LocalIpLabel")
         self.tcp_local_ip_label.setWordWrap(True)
-        self._update_local_ip_display()
-        tcp_layout.addRow(t("local_ip", "本機 IP") + ":", self.tcp_local_ip_label)
+        self._update_local_ip_display(self.tcp_local_ip_label)
+        tcp_layout.addRow(local_ip_text, self.tcp_local_ip_label)
         
         # 當前連接信息顯示
-        self.tcp_connection_info_label = QLabel(t("not_connected", "未連接"))
-        self.tcp_connection_info_label.setStyleSheet("color: #888888; font-size: 9pt;")
+        self.tcp_connection_info_label = QLabel(not_connected_text)
+        self.tcp_connection_info_label.setObjectName("ConnectionInfoLabel")
         self.tcp_connection_info_label.setWordWrap(True)
-        tcp_layout.addRow(t("connection_info", "連接信息") + ":", self.tcp_connection_info_label)
+        tcp_layout.addRow(connection_info_text, self.tcp_connection_info_label)
         
         self.tcp_settings_group.setLayout(tcp_layout)
         self.tcp_settings_group.setVisible(False)
@@ -732,29 +1192,27 @@ class MainWindow(QMainWindow):
         srt_layout.setSpacing(8)
         
         self.srt_ip_input = QLineEdit()
-        self.srt_port_input = QSpinBox()
-        self.srt_port_input.setRange(1, 65535)
-        self.srt_fps_input = QSpinBox()
-        self.srt_fps_input.setRange(30, 240)
+        self.srt_port_input = self._make_spin_box((1, 65535))
+        self.srt_fps_input = self._make_spin_box((30, 240))
         self.srt_listener_mode_checkbox = QCheckBox()
         
-        srt_layout.addRow(t("ip_address", "IP 地址") + ":", self.srt_ip_input)
-        srt_layout.addRow(t("port", "端口") + ":", self.srt_port_input)
-        srt_layout.addRow(t("target_fps", "目標 FPS") + ":", self.srt_fps_input)
+        srt_layout.addRow(ip_text, self.srt_ip_input)
+        srt_layout.addRow(port_text, self.srt_port_input)
+        srt_layout.addRow(target_fps_text, self.srt_fps_input)
         srt_layout.addRow(t("listener_mode", "監聽模式 (等待連接)") + ":", self.srt_listener_mode_checkbox)
         
         # 本機IP顯示
         self.srt_local_ip_label = QLabel()
-        self.srt_local_ip_label.setStyleSheet("color: #00E5FF; font-size: 9pt;")
+        self.srt_local_ip_label.setObjectName("LocalIpLabel")
         self.srt_local_ip_label.setWordWrap(True)
-        self._update_local_ip_display()
-        srt_layout.addRow(t("local_ip", "本機 IP") + ":", self.srt_local_ip_label)
+        self._update_local_ip_display(self.srt_local_ip_label)
+        srt_layout.addRow(local_ip_text, self.srt_local_ip_label)
         
         # 當前連接信息顯示
-        self.srt_connection_info_label = QLabel(t("not_connected", "未連接"))
-        self.srt_connection_info_label.setStyleSheet("color: #888888; font-size: 9pt;")
+        self.srt_connection_info_label = QLabel(not_connected_text)
+        self.srt_connection_info_label.setObjectName("ConnectionInfoLabel")
         self.srt_connection_info_label.setWordWrap(True)
-        srt_layout.addRow(t("connection_info", "連接信息") + ":", self.srt_connection_info_label)
+        srt_layout.addRow(connection_info_text, self.srt_connection_info_label)
         
         self.srt_settings_group.setLayout(srt_layout)
         self.srt_settings_group.setVisible(False)
@@ -765,31 +1223,11 @@ class MainWindow(QMainWindow):
         capture_card_layout = QFormLayout()
         capture_card_layout.setSpacing(8)
         
-        self.capture_device_index_input = QSpinBox()
-        self.capture_device_index_input.setRange(0, 10)
-        self.capture_width_input = QSpinBox()
-        self.capture_width_input.setRange(320, 7680)
-        self.capture_height_input = QSpinBox()
-        self.capture_height_input.setRange(240, 4320)
-        self.capture_fps_input = QSpinBox()
-        self.capture_fps_input.setRange(1, 300)
-        self.capture_range_x_input = QSpinBox()
-        self.capture_range_x_input.setRange(0, 7680)
-        self.capture_range_y_input = QSpinBox()
-        self.capture_range_y_input.setRange(0, 4320)
-        self.capture_offset_x_input = QSpinBox()
-        self.capture_offset_x_input.setRange(-3840, 3840)
-        self.capture_offset_y_input = QSpinBox()
-        self.capture_offset_y_input.setRange(-2160, 2160)
-        
-        capture_card_layout.addRow(t("device_index", "設備索引") + ":", self.capture_device_index_input)
-        capture_card_layout.addRow(t("width", "寬度") + ":", self.capture_width_input)
-        capture_card_layout.addRow(t("height", "高度") + ":", self.capture_height_input)
-        capture_card_layout.addRow(t("fps", "FPS") + ":", self.capture_fps_input)
-        capture_card_layout.addRow(t("range_x", "範圍 X (0=自動)") + ":", self.capture_range_x_input)
-        capture_card_layout.addRow(t("range_y", "範圍 Y (0=自動)") + ":", self.capture_range_y_input)
-        capture_card_layout.addRow(t("offset_x", "偏移 X") + ":", self.capture_offset_x_input)
-        capture_card_layout.addRow(t("offset_y", "偏移 Y") + ":", self.capture_offset_y_input)
+        self._build_spin_fields(capture_card_layout, CAPTURE_CARD_FIELDS, label_cache=field_labels)
+        self.capture_low_latency_checkbox = QCheckBox()
+        self.capture_low_latency_checkbox.setToolTip(
+            t("low_latency_mode_tooltip", "將驅動幀緩衝設為 1，只讀取最新畫面（部分設備不支持）"))
+        capture_card_layout.addRow(t("low_latency_mode", "低延遲模式") + ":", self.capture_low_latency_checkbox)
         
         self.capture_card_settings_group.setLayout(capture_card_layout)
         self.capture_card_settings_group.setVisible(False)
@@ -800,31 +1238,9 @@ class MainWindow(QMainWindow):
         mss_layout = QFormLayout()
         mss_layout.setSpacing(8)
         
-        self.mss_range_x_input = QSpinBox()
-        self.mss_range_x_input.setRange(1, 7680)  # 最小值改為 1
-        self.mss_range_y_input = QSpinBox()
-        self.mss_range_y_input.setRange(1, 4320)  # 最小值改為 1
-        self.mss_offset_x_input = QSpinBox()
-        self.mss_offset_x_input.setRange(-3840, 3840)
-        self.mss_offset_y_input = QSpinBox()
-        self.mss_offset_y_input.setRange(-2160, 2160)
-        self.mss_trigger_offset_x_input = QSpinBox()
-        self.mss_trigger_offset_x_input.setRange(-3840, 3840)
-        self.mss_trigger_offset_y_input = QSpinBox()
-        self.mss_trigger_offset_y_input.setRange(-2160, 2160)
-        
-        mss_layout.addRow(t("range_x", "範圍 X (0=全屏)") + ":", self.mss_range_x_input)
-        mss_layout.addRow(t("range_y", "範圍 Y (0=全屏)") + ":", self.mss_range_y_input)
-        mss_layout.addRow(t("offset_x", "偏移 X (中心點)") + ":", self.mss_offset_x_input)
-        mss_layout.addRow(t("offset_y", "偏移 Y (中心點)") + ":", self.mss_offset_y_input)
-        mss_layout.addRow(t("trigger_offset_x", "觸發中心偏移 X") + ":", self.mss_trigger_offset_x_input)
-        mss_layout.addRow(t("trigger_offset_y", "觸發中心偏移 Y") + ":", self.mss_trigger_offset_y_input)
-        
-        # 連接範圍和偏移變化的回調
-        self.mss_range_x_input.valueChanged.connect(self.on_mss_range_changed)
-        self.mss_range_y_input.valueChanged.connect(self.on_mss_range_changed)
-        self.mss_offset_x_input.valueChanged.connect(self.on_mss_range_changed)
-        self.mss_offset_y_input.valueChanged.connect(self.on_mss_range_changed)
+        # 由欄位表批量創建輸入框，範圍和偏移變化時觸發回調
+        self._build_spin_fields(mss_layout, MSS_FIELDS, self._debounced(self.on_mss_range_changed),
+                                label_cache=field_labels)
         
         self.mss_settings_group.setLayout(mss_layout)
         self.mss_settings_group.setVisible(False)
@@ -835,48 +1251,27 @@ class MainWindow(QMainWindow):
         bettercam_layout = QFormLayout()
         bettercam_layout.setSpacing(8)
         
-        self.bettercam_range_x_input = QSpinBox()
-        self.bettercam_range_x_input.setRange(1, 7680)  # 最小值改為 1
-        self.bettercam_range_y_input = QSpinBox()
-        self.bettercam_range_y_input.setRange(1, 4320)  # 最小值改為 1
-        self.bettercam_offset_x_input = QSpinBox()
-        self.bettercam_offset_x_input.setRange(-3840, 3840)
-        self.bettercam_offset_y_input = QSpinBox()
-        self.bettercam_offset_y_input.setRange(-2160, 2160)
-        self.bettercam_trigger_offset_x_input = QSpinBox()
-        self.bettercam_trigger_offset_x_input.setRange(-3840, 3840)
-        self.bettercam_trigger_offset_y_input = QSpinBox()
-        self.bettercam_trigger_offset_y_input.setRange(-2160, 2160)
-        
         # FPS 限制滑條
         bettercam_fps_layout = QHBoxLayout()
         self.bettercam_fps_slider = QSlider(Qt.Horizontal)
         self.bettercam_fps_slider.setRange(0, 300)
         self.bettercam_fps_slider.setValue(0)  # 默認無限制
-        self.bettercam_fps_input = QSpinBox()
-        self.bettercam_fps_input.setRange(0, 300)
+        self.bettercam_fps_slider.setTracking(False)  # 放開滑條時才發出 valueChanged
+        self.bettercam_fps_input = self._make_spin_box((0, 300))
         self.bettercam_fps_input.setValue(0)
         self.bettercam_fps_input.setSuffix(" FPS (0=無限制)")
         bettercam_fps_layout.addWidget(self.bettercam_fps_slider)
         bettercam_fps_layout.addWidget(self.bettercam_fps_input)
         
         # 連接滑條和輸入框
-        self.bettercam_fps_slider.valueChanged.connect(self.bettercam_fps_input.setValue)
-        self.bettercam_fps_input.valueChanged.connect(self.bettercam_fps_slider.setValue)
-        
-        bettercam_layout.addRow(t("target_fps", "目標 FPS (0=無限制)") + ":", bettercam_fps_layout)
-        bettercam_layout.addRow(t("range_x", "範圍 X (0=全屏)") + ":", self.bettercam_range_x_input)
-        bettercam_layout.addRow(t("range_y", "範圍 Y (0=全屏)") + ":", self.bettercam_range_y_input)
-        bettercam_layout.addRow(t("offset_x", "偏移 X (中心點)") + ":", self.bettercam_offset_x_input)
-        bettercam_layout.addRow(t("offset_y", "偏移 Y (中心點)") + ":", self.bettercam_offset_y_input)
-        bettercam_layout.addRow(t("trigger_offset_x", "觸發中心偏移 X") + ":", self.bettercam_trigger_offset_x_input)
-        bettercam_layout.addRow(t("trigger_offset_y", "觸發中心偏移 Y") + ":", self.bettercam_trigger_offset_y_input)
-        
-        # 連接範圍和偏移變化的回調
-        self.bettercam_range_x_input.valueChanged.connect(self.on_bettercam_range_changed)
-        self.bettercam_range_y_input.valueChanged.connect(self.on_bettercam_range_changed)
-        self.bettercam_offset_x_input.valueChanged.connect(self.on_bettercam_range_changed)
-        self.bettercam_offset_y_input.valueChanged.connect(self.on_bettercam_range_changed)
+        self._mirror_value(self.bettercam_fps_slider, self.bettercam_fps_input)
+        self._mirror_value(self.bettercam_fps_slider, self.bettercam_fps_input, self.bettercam_fps_slider.sliderMoved)
+        self._mirror_value(self.bettercam_fps_input, self.bettercam_fps_slider)
+        
+        bettercam_layout.addRow(unlimited_fps_text, bettercam_fps_layout)
+        # 由欄位表批量創建範圍和偏移輸入框（合併連續修改，只以最終值重新配置擷取）
+        self._build_spin_fields(bettercam_layout, BETTERCAM_FIELDS, self._debounced(self.on_bettercam_range_changed),
+                                label_cache=field_labels)
         
         self.bettercam_settings_group.setLayout(bettercam_layout)
         self.bettercam_settings_group.setVisible(False)
@@ -887,49 +1282,30 @@ class MainWindow(QMainWindow):
         dxgi_layout = QFormLayout()
         dxgi_layout.setSpacing(8)
         
-        self.dxgi_range_x_input = QSpinBox()
-        self.dxgi_range_x_input.setRange(1, 7680)  # 最小值改為 1
-        self.dxgi_range_y_input = QSpinBox()
-        self.dxgi_range_y_input.setRange(1, 4320)  # 最小值改為 1
-        self.dxgi_offset_x_input = QSpinBox()
-        self.dxgi_offset_x_input.setRange(-3840, 3840)
-        self.dxgi_offset_y_input = QSpinBox()
-        self.dxgi_offset_y_input.setRange(-2160, 2160)
-        self.dxgi_trigger_offset_x_input = QSpinBox()
-        self.dxgi_trigger_offset_x_input.setRange(-3840, 3840)
-        self.dxgi_trigger_offset_y_input = QSpinBox()
-        self.dxgi_trigger_offset_y_input.setRange(-2160, 2160)
-        
         # FPS 限制滑條
         dxgi_fps_layout = QHBoxLayout()
         self.dxgi_fps_slider = QSlider(Qt.Horizontal)
         self.dxgi_fps_slider.setRange(0, 300)
         self.dxgi_fps_slider.setValue(0)  # 默認無限制
-        self.dxgi_fps_input = QSpinBox()
-        self.dxgi_fps_input.setRange(0, 300)
+        self.dxgi_fps_slider.setTracking(False)  # 放開滑條時才發出 valueChanged
+        self.dxgi_fps_input = self._make_spin_box((0, 300))
         self.dxgi_fps_input.setValue(0)
         self.dxgi_fps_input.setSuffix(" FPS (0=無限制)")
         dxgi_fps_layout.addWidget(self.dxgi_fps_slider)
         dxgi_fps_layout.addWidget(self.dxgi_fps_input)
         
         # 連接滑條和輸入框
-        self.dxgi_fps_slider.valueChanged.connect(self.dxgi_fps_input.setValue)
-        self.dxgi_fps_input.valueChanged.connect(self.dxgi_fps_slider.setValue)
+        self._mirror_value(self.dxgi_fps_slider, self.dxgi_fps_input)
+        self._mirror_value(self.dxgi_fps_slider, self.dxgi_fps_input, self.dxgi_fps_slider.sliderMoved)
+        self._mirror_value(self.dxgi_fps_input, self.dxgi_fps_slider)
+        # 對端同步時信號被阻擋，兩邊都需要直接連接回調
+        self.dxgi_fps_slider.valueChanged.connect(self.on_dxgi_fps_changed)
         self.dxgi_fps_input.valueChanged.connect(self.on_dxgi_fps_changed)
         
-        dxgi_layout.addRow(t("target_fps", "目標 FPS (0=無限制)") + ":", dxgi_fps_layout)
-        dxgi_layout.addRow(t("range_x", "範圍 X (0=全屏)") + ":", self.dxgi_range_x_input)
-        dxgi_layout.addRow(t("range_y", "範圍 Y (0=全屏)") + ":", self.dxgi_range_y_input)
-        dxgi_layout.addRow(t("offset_x", "偏移 X (中心點)") + ":", self.dxgi_offset_x_input)
-        dxgi_layout.addRow(t("offset_y", "偏移 Y (中心點)") + ":", self.dxgi_offset_y_input)
-        dxgi_layout.addRow(t("trigger_offset_x", "觸發中心偏移 X") + ":", self.dxgi_trigger_offset_x_input)
-        dxgi_layout.addRow(t("trigger_offset_y", "觸發中心偏移 Y") + ":", self.dxgi_trigger_offset_y_input)
-        
-        # 連接範圍和偏移變化的回調
-        self.dxgi_range_x_input.valueChanged.connect(self.on_dxgi_range_changed)
-        self.dxgi_range_y_input.valueChanged.connect(self.on_dxgi_range_changed)
-        self.dxgi_offset_x_input.valueChanged.connect(self.on_dxgi_range_changed)
-        self.dxgi_offset_y_input.valueChanged.connect(self.on_dxgi_range_changed)
+        dxgi_layout.addRow(unlimited_fps_text, dxgi_fps_layout)
+        # 由欄位表批量創建範圍和偏移輸入框（重新啟動已由 _schedule_dxgi_restart 合併，不再另加延遲）
+        self._build_spin_fields(dxgi_layout, DXGI_FIELDS, self.on_dxgi_range_changed,
+                                label_cache=field_labels)
         
         self.dxgi_settings_group.setLayout(dxgi_layout)
         self.dxgi_settings_group.setVisible(False)
@@ -954,8 +1330,7 @@ class MainWindow(QMainWindow):
         ndi_layout.addRow(t("ndi_source", "NDI 源") + ":", ndi_source_layout)
         
         # NDI 源索引（如果使用索引）
-        self.ndi_source_index_input = QSpinBox()
-        self.ndi_source_index_input.setRange(0, 99)
+        self.ndi_source_index_input = self._make_spin_box((0, 99))
         self.ndi_source_index_input.setValue(0)
         self.ndi_source_index_input.setToolTip(t("ndi_source_index_tooltip", "使用索引選擇 NDI 源（0 為第一個可用源）"))
         ndi_layout.addRow(t("ndi_source_index", "源索引 (可選)") + ":", self.ndi_source_index_input)
@@ -964,22 +1339,18 @@ class MainWindow(QMainWindow):
         self.ndi_settings_group.setVisible(False)
         layout.addWidget(self.ndi_settings_group)
         
-        # 初始化時刷新 NDI 源列表
-        if NDI_AVAILABLE:
-            QTimer.singleShot(1000, self.refresh_ndi_sources)  # 延遲 1 秒後刷新，讓 NDI 有時間初始化
-        
         # 分隔線
         line = QFrame()
         line.setFrameShape(QFrame.HLine)
         line.setFrameShadow(QFrame.Sunken)
-        line.setStyleSheet("background-color: #333;")
+        line.setObjectName("SepLine")
         layout.addWidget(line)
         
         # 2. 檢測模式選擇
         mode_layout = QHBoxLayout()
-        mode_label = QLabel(t("detection_mode", "檢測模式") + ":")
-        mode_label.setStyleSheet("font-weight: bold; color: #E0E0E0;")
-        mode_layout.addWidget(mode_label)
+        self.detection_mode_label = QLabel(t("detection_mode", "檢測模式") + ":")
+        self.detection_mode_label.setObjectName("SectionLabel")
+        mode_layout.addWidget(self.detection_mode_label)
         
         self.mode_button_group = QButtonGroup()
         self.mode1_radio = QRadioButton(t("mode_1", "模式 1 (變色)"))
@@ -996,7 +1367,7 @@ class MainWindow(QMainWindow):
         # 2.5 點擊模式選擇
         click_mode_layout = QHBoxLayout()
         click_mode_label = QLabel(t("click_mode", "點擊模式") + ":")
-        click_mode_label.setStyleSheet("font-weight: bold; color: #E0E0E0;")
+        click_mode_label.setObjectName("SectionLabel")
         click_mode_layout.addWidget(click_mode_label)
         
         self.click_mode_button_group = QButtonGroup()
@@ -1018,86 +1389,34 @@ class MainWindow(QMainWindow):
         mode1_layout.setContentsMargins(0, 0, 0, 0)
         
         # 起始顏色
-        color_from_layout = QHBoxLayout()
-        self.color_from_r = QSpinBox()
-        self.color_from_g = QSpinBox()
-        self.color_from_b = QSpinBox()
-        for spin in [self.color_from_r, self.color_from_g, self.color_from_b]:
-            spin.setRange(0, 255)
-            spin.valueChanged.connect(lambda: self._update_color_preview('from'))
-        # 顏色預覽框
-        self.color_from_preview = QPushButton()
-        self.color_from_preview.setFixedSize(40, 30)
-        self.color_from_preview.setToolTip("點擊此框，然後在監視窗口點擊選擇顏色")
-        self.color_from_preview.clicked.connect(lambda: self._start_color_picker('from'))
-        color_from_layout.addWidget(QLabel(t("r", "R")))
-        color_from_layout.addWidget(self.color_from_r)
-        color_from_layout.addWidget(QLabel(t("g", "G")))
-        color_from_layout.addWidget(self.color_from_g)
-        color_from_layout.addWidget(QLabel(t("b", "B")))
-        color_from_layout.addWidget(self.color_from_b)
-        color_from_layout.addWidget(self.color_from_preview)
-        color_from_layout.addStretch()
+        (color_from_layout, (self.color_from_r, self.color_from_g, self.color_from_b),
+         self.color_from_preview) = self._build_color_row('from', rgb_labels)
         mode1_layout.addRow(t("start_color", "起始顏色") + ":", color_from_layout)
         
         # 目標顏色
-        color_to_layout = QHBoxLayout()
-        self.color_to_r = QSpinBox()
-        self.color_to_g = QSpinBox()
-        self.color_to_b = QSpinBox()
-        for spin in [self.color_to_r, self.color_to_g, self.color_to_b]:
-            spin.setRange(0, 255)
-            spin.valueChanged.connect(lambda: self._update_color_preview('to'))
-        # 顏色預覽框
-        self.color_to_preview = QPushButton()
-        self.color_to_preview.setFixedSize(40, 30)
-        self.color_to_preview.setToolTip("點擊此框，然後在監視窗口點擊選擇顏色")
-        self.color_to_preview.clicked.connect(lambda: self._start_color_picker('to'))
-        color_to_layout.addWidget(QLabel(t("r", "R")))
-        color_to_layout.addWidget(self.color_to_r)
-        color_to_layout.addWidget(QLabel(t("g", "G")))
-        color_to_layout.addWidget(self.color_to_g)
-        color_to_layout.addWidget(QLabel(t("b", "B")))
-        color_to_layout.addWidget(self.color_to_b)
-        color_to_layout.addWidget(self.color_to_preview)
-        color_to_layout.addStretch()
-        mode1_layout.addRow(t("target_color", "目標顏色") + ":", color_to_layout)
-        layout.addWidget(self.mode1_group)
+        (color_to_layout, (self.color_to_r, self.color_to_g, self.color_to_b),
+         self.color_to_preview) = self._build_color_row('to', rgb_labels)
+        mode1_layout.addRow(target_color_text, color_to_layout)
         
         self.mode2_group = QWidget()
         mode2_layout = QFormLayout(self.mode2_group)
         mode2_layout.setContentsMargins(0, 0, 0, 0)
         
-        target_color_layout = QHBoxLayout()
-        self.target_color_r = QSpinBox()
-        self.target_color_g = QSpinBox()
-        self.target_color_b = QSpinBox()
-        for spin in [self.target_color_r, self.target_color_g, self.target_color_b]:
-            spin.setRange(0, 255)
-            spin.valueChanged.connect(lambda: self._update_color_preview('target'))
-        # 顏色預覽框
-        self.target_color_preview = QPushButton()
-        self.target_color_preview.setFixedSize(40, 30)
-        self.target_color_preview.setToolTip("點擊此框，然後在監視窗口點擊選擇顏色")
-        self.target_color_preview.clicked.connect(lambda: self._start_color_picker('target'))
-        target_color_layout.addWidget(QLabel(t("r", "R")))
-        target_color_layout.addWidget(self.target_color_r)
-        target_color_layout.addWidget(QLabel(t("g", "G")))
-        target_color_layout.addWidget(self.target_color_g)
-        target_color_layout.addWidget(QLabel(t("b", "B")))
-        target_color_layout.addWidget(self.target_color_b)
-        target_color_layout.addWidget(self.target_color_preview)
-        target_color_layout.addStretch()
-        mode2_layout.addRow(t("target_color", "目標顏色") + ":", target_color_layout)
-        layout.addWidget(self.mode2_group)
-        self.mode2_group.setVisible(False)
+        (target_color_layout, (self.target_color_r, self.target_color_g, self.target_color_b),
+         self.target_color_preview) = self._build_color_row('target', rgb_labels)
+        mode2_layout.addRow(target_color_text, target_color_layout)
+        
+        # 兩種模式的顏色設置放在同一個堆疊中，只有當前頁參與佈局和重繪
+        self.mode_stack = QStackedWidget()
+        self.mode_stack.addWidget(self.mode1_group)
+        self.mode_stack.addWidget(self.mode2_group)
+        layout.addWidget(self.mode_stack)
         
         # 4. 通用設置
         settings_layout = QFormLayout()
         settings_layout.setSpacing(8)
         
-        self.tolerance_input = QSpinBox()
-        self.tolerance_input.setRange(0, 100)
+        self.tolerance_input = self._make_spin_box((0, 100))
         self.tolerance_input.valueChanged.connect(self.on_tolerance_changed)
         settings_layout.addRow(t("color_tolerance", "顏色容差") + ":", self.tolerance_input)
         
@@ -1108,43 +1427,43 @@ class MainWindow(QMainWindow):
         delay_settings_layout.setSpacing(8)
         
         # 按下延遲範圍
-        press_delay_widget = self._create_range_input_widget(
-            t("press_delay", "按下延遲"), 0, 5000, 
-            lambda min_val, max_val: self.on_press_delay_range_changed(min_val, max_val)
-        )
-        self.press_delay_min_input = press_delay_widget['min_input']
-        self.press_delay_min_slider = press_delay_widget['min_slider']
-        self.press_delay_max_input = press_delay_widget['max_input']
-        self.press_delay_max_slider = press_delay_widget['max_slider']
-        delay_settings_layout.addRow(t("press_delay", "按下延遲") + ":", press_delay_widget['container'])
+        press_delay_widget = RangeInput(t("press_delay", "按下延遲"), 0, 5000)
+        press_delay_widget.valueChanged.connect(self.on_press_delay_range_changed)
+        self.press_delay_min_input = press_delay_widget.min_input
+        self.press_delay_min_slider = press_delay_widget.min_slider
+        self.press_delay_max_input = press_delay_widget.max_input
+        self.press_delay_max_slider = press_delay_widget.max_slider
+        delay_settings_layout.addRow(t("press_delay", "按下延遲") + ":", press_delay_widget)
         
         # 釋放延遲範圍
-        release_delay_widget = self._create_range_input_widget(
-            t("release_delay", "釋放延遲"), 0, 5000,
-            lambda min_val, max_val: self.on_release_delay_range_changed(min_val, max_val)
-        )
-        self.release_delay_min_input = release_delay_widget['min_input']
-        self.release_delay_min_slider = release_delay_widget['min_slider']
-        self.release_delay_max_input = release_delay_widget['max_input']
-        self.release_delay_max_slider = release_delay_widget['max_slider']
-        delay_settings_layout.addRow(t("release_delay", "釋放延遲") + ":", release_delay_widget['container'])
+        release_delay_widget = RangeInput(t("release_delay", "釋放延遲"), 0, 5000)
+        release_delay_widget.valueChanged.connect(self.on_release_delay_range_changed)
+        self.release_delay_min_input = release_delay_widget.min_input
+        self.release_delay_min_slider = release_delay_widget.min_slider
+        self.release_delay_max_input = release_delay_widget.max_input
+        self.release_delay_max_slider = release_delay_widget.max_slider
+        delay_settings_layout.addRow(t("release_delay", "釋放延遲") + ":", release_delay_widget)
         
         # 觸發冷卻範圍
-        cooldown_widget = self._create_range_input_widget(
-            t("trigger_cooldown", "觸發冷卻"), 0, 10000,
-            lambda min_val, max_val: self.on_cooldown_range_changed(min_val, max_val)
-        )
-        self.cooldown_min_input = cooldown_widget['min_input']
-        self.cooldown_min_slider = cooldown_widget['min_slider']
-        self.cooldown_max_input = cooldown_widget['max_input']
-        self.cooldown_max_slider = cooldown_widget['max_slider']
-        delay_settings_layout.addRow(t("trigger_cooldown", "觸發冷卻") + ":", cooldown_widget['container'])
+        cooldown_widget = RangeInput(t("trigger_cooldown", "觸發冷卻"), 0, 10000)
+        cooldown_widget.valueChanged.connect(self.on_cooldown_range_changed)
+        self.cooldown_min_input = cooldown_widget.min_input
+        self.cooldown_min_slider = cooldown_widget.min_slider
+        self.cooldown_max_input = cooldown_widget.max_input
+        self.cooldown_max_slider = cooldown_widget.max_slider
+        delay_settings_layout.addRow(t("trigger_cooldown", "觸發冷卻") + ":", cooldown_widget)
+        
+        # 配置前綴 -> 範圍控件（對應 *_min / *_max 配置鍵）
+        self.delay_range_inputs = {
+            "press_delay": press_delay_widget,
+            "release_delay": release_delay_widget,
+            "trigger_cooldown": cooldown_widget,
+        }
         
         # 將延遲設置容器添加到主佈局
         settings_layout.addRow("", self.delay_settings_group)
         
-        self.detection_size_input = QSpinBox()
-        self.detection_size_input.setRange(2, 50)
+        self.detection_size_input = self._make_spin_box((2, 50))
         self.detection_size_input.setSuffix(t("px", " px"))
         self.detection_size_input.valueChanged.connect(self.on_detection_size_changed)
         settings_layout.addRow(t("detection_size", "檢測區域") + ":", self.detection_size_input)
@@ -1152,118 +1471,108 @@ class MainWindow(QMainWindow):
         layout.addLayout(settings_layout)
         layout.addStretch()
         
+        panel.setUpdatesEnabled(True)
         return panel
     
-    def _create_range_input_widget(self, name: str, default_min: int, default_max: int, callback):
+    # 共用的輸入框創建與靜默設值函數（見 ui.range_input）
+    _make_spin_box = staticmethod(make_spin_box)
+    _set_value_silently = staticmethod(set_value_silently)
+    
+    def _debounced(self, slot, interval_ms: int = 150):
+        """
+        返回合併連續調用的觸發函數：停止變化 interval_ms 毫秒後才執行一次 slot
+        
+        Args:
+            slot: 要延遲執行的函數（無參數）
+            interval_ms: 合併時間窗口（毫秒）
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(interval_ms)
+        timer.timeout.connect(slot)
+        # 忽略信號參數，避免 valueChanged(int) 被當作 QTimer.start(msec) 的間隔
+        return lambda *_args: timer.start()
+    
+    def _mirror_value(self, source, target, signal=None):
+        """將 source 的數值變化單向同步到 target（不觸發 target 的信號，signal 默認為 source.valueChanged）"""
+        if signal is None:
+            signal = source.valueChanged
+        signal.connect(lambda value: self._set_value_silently(target, value))
+    
+    def _populate_capture_mode_combo(self):
+        """按 CAPTURE_MODE_ITEMS 填充擷取模式選擇器（未安裝的後端附加提示，每個後端只翻譯一次）"""
+        not_installed = {}
+        for mode, label_default, backend in CAPTURE_MODE_ITEMS:
+            label = t(mode, label_default)
+            if backend is not None and not _BACKEND_AVAILABLE[backend]:
+                if backend not in not_installed:
+                    not_installed[backend] = t(f"{backend}_not_installed", "[未安裝]")
+                label = f"{label} {not_installed[backend]}"
+            self.capture_mode_combo.addItem(label, mode)
+        self._capture_mode_combo_lang = self.language_manager.get_current_lang()
+    
+    def _build_color_row(self, key: str, rgb_labels: tuple):
         """
-        創建帶有滑條的範圍輸入控件
+        創建一行「R/G/B 輸入框 + 顏色預覽框」
         
         Args:
-            name: 控件名稱（用於提示）
-            default_min: 默認最小值
-            default_max: 默認最大值
-            callback: 當值改變時的回調函數 (min_val, max_val)
+            key: 顏色鍵 ('from', 'to', 'target')
+            rgb_labels: 已翻譯的 (R, G, B) 標籤
         
         Returns:
-            dict: 包含所有控件的字典
+            (佈局, (R, G, B) 輸入框, 預覽框)
         """
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(4)
-        
-        # 最小值行
-        min_row = QHBoxLayout()
-        min_row.setSpacing(8)
-        
-        min_label = QLabel(t("min", "最小") + ":")
-        min_label.setMinimumWidth(40)
-        min_input = QSpinBox()
-        min_input.setRange(0, 99999)  # 輸入可以超過500
-        min_input.setSuffix(t("ms", " ms"))
-        min_input.setValue(default_min)
-        min_input.setToolTip(f"{name}的最小值（可超過500）")
-        
-        min_slider = QSlider(Qt.Horizontal)
-        min_slider.setRange(0, 500)
-        min_slider.setValue(default_min)
-        min_slider.setToolTip(f"{name}最小值滑條（0~500）")
-        
-        # 連接最小值的輸入框和滑條
-        def on_min_input_changed(value):
-            # 限制滑條範圍在0~500
-            if value <= 500:
-                min_slider.setValue(value)
-            # 確保最小值不超過最大值
-            if value > max_input.value():
-                max_input.setValue(value)
-            callback(min_input.value(), max_input.value())
-        
-        def on_min_slider_changed(value):
-            min_input.setValue(value)
-            callback(min_input.value(), max_input.value())
-        
-        min_input.valueChanged.connect(on_min_input_changed)
-        min_slider.valueChanged.connect(on_min_slider_changed)
-        
-        min_row.addWidget(min_label)
-        min_row.addWidget(min_input)
-        min_row.addWidget(min_slider)
-        min_row.addStretch()
-        
-        # 最大值行
-        max_row = QHBoxLayout()
-        max_row.setSpacing(8)
-        
-        max_label = QLabel(t("max", "最大") + ":")
-        max_label.setMinimumWidth(40)
-        max_input = QSpinBox()
-        max_input.setRange(0, 99999)  # 輸入可以超過500
-        max_input.setSuffix(t("ms", " ms"))
-        max_input.setValue(default_max)
-        max_input.setToolTip(f"{name}的最大值（可超過500）")
-        
-        max_slider = QSlider(Qt.Horizontal)
-        max_slider.setRange(0, 500)
-        max_slider.setValue(min(default_max, 500))
-        max_slider.setToolTip(f"{name}最大值滑條（0~500）")
-        
-        # 連接最大值的輸入框和滑條
-        def on_max_input_changed(value):
-            # 限制滑條範圍在0~500
-            if value <= 500:
-                max_slider.setValue(value)
-            # 確保最大值不小於最小值
-            if value < min_input.value():
-                min_input.setValue(value)
-            callback(min_input.value(), max_input.value())
-        
-        def on_max_slider_changed(value):
-            max_input.setValue(value)
-            callback(min_input.value(), max_input.value())
-        
-        max_input.valueChanged.connect(on_max_input_changed)
-        max_slider.valueChanged.connect(on_max_slider_changed)
-        
-        max_row.addWidget(max_label)
-        max_row.addWidget(max_input)
-        max_row.addWidget(max_slider)
-        max_row.addStretch()
-        
-        layout.addLayout(min_row)
-        layout.addLayout(max_row)
-        
-        return {
-            'container': container,
-            'min_input': min_input,
-            'min_slider': min_slider,
-            'max_input': max_input,
-            'max_slider': max_slider
-        }
-
+        row_layout = QHBoxLayout()
+        spins = (self._make_spin_box((0, 255)), self._make_spin_box((0, 255)), self._make_spin_box((0, 255)))
+        for label_text, spin in zip(rgb_labels, spins):
+            spin.valueChanged.connect(lambda _value, k=key: self._update_color_preview(k))
+            row_layout.addWidget(QLabel(label_text))
+            row_layout.addWidget(spin)
+        # 顏色預覽框
+        preview = QPushButton()
+        preview.setFixedSize(40, 30)
+        preview.setToolTip("點擊此框，然後在監視窗口點擊選擇顏色")
+        preview.clicked.connect(lambda: self._start_color_picker(key))
+        row_layout.addWidget(preview)
+        row_layout.addStretch()
+        self._color_rows[key] = (spins, preview)
+        return row_layout, spins, preview
+    
+    def _store_field_values(self, fields: list, **extra) -> dict:
+        """讀取欄位表中輸入框的數值（配置鍵為屬性名去掉 _input 後綴），連同 extra 一次寫入配置並返回"""
+        values = {attr_name[:-len("_input")]: getattr(self, attr_name).value() for attr_name, *_ in fields}
+        values.update(extra)
+        self.config_manager.update(values)
+        return values
+    
+    def _build_spin_fields(self, form_layout: QFormLayout, fields: list, on_change=None,
+                           label_cache: dict = None):
+        """
+        根據欄位表批量創建數值輸入框並加入表單佈局
+        
+        Args:
+            form_layout: 目標表單佈局
+            fields: (屬性名, 翻譯鍵, 預設標籤, 數值範圍, 是否觸發回調) 列表
+            on_change: 數值改變時的回調
+            label_cache: 跨面板共用的標籤快取 {(翻譯鍵, 預設標籤): 標籤文字}
+        """
+        if label_cache is None:
+            label_cache = {}
+        for attr_name, label_key, label_default, value_range, notify in fields:
+            spin = self._make_spin_box(value_range)
+            setattr(self, attr_name, spin)
+            label_text = label_cache.get((label_key, label_default))
+            if label_text is None:
+                label_text = label_cache[(label_key, label_default)] = t(label_key, label_default) + ":"
+            form_layout.addRow(label_text, spin)
+            if notify and on_change is not None:
+                spin.valueChanged.connect(on_change)
+    
     def create_monitor_panel(self):
         """創建監控面板 (右欄)"""
         panel = QWidget()
+        # 批量創建控件期間暫停重繪，完成後一次性更新
+        panel.setUpdatesEnabled(False)
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(15)
@@ -1281,7 +1590,7 @@ class MainWindow(QMainWindow):
         
         self.cooldown_label = QLabel(t("ready", "準備就緒"))
         self.cooldown_label.setAlignment(Qt.AlignCenter)
-        self.cooldown_label.setStyleSheet("color: #888; font-size: 10pt;")
+        self.cooldown_label.setObjectName("CooldownLabel")
         status_layout.addWidget(self.cooldown_label)
         
         self.stats_label = QLabel(t("waiting_for_data", "等待連接..."))
@@ -1299,7 +1608,7 @@ class MainWindow(QMainWindow):
         
         # 狀態顯示
         self.mouse_status_label = QLabel(t("not_connected", "未連接"))
-        self.mouse_status_label.setStyleSheet("color: #ff5555; font-weight: bold; font-size: 11pt;")
+        self.mouse_status_label.setObjectName("MouseStatusLabel")
         self.mouse_status_label.setAlignment(Qt.AlignCenter)
         mouse_layout.addWidget(self.mouse_status_label)
         
@@ -1325,7 +1634,7 @@ class MainWindow(QMainWindow):
         debug_layout = QVBoxLayout()
         
         self.debug_window_checkbox = QCheckBox(t("enable_debug_window", "開啟即時畫面預覽 (調試窗口)"))
-        self.debug_window_checkbox.setStyleSheet("font-weight: bold; color: #00E5FF;")
+        self.debug_window_checkbox.setObjectName("DebugWindowCheckbox")
         self.debug_window_checkbox.stateChanged.connect(self.toggle_debug_window)
         debug_layout.addWidget(self.debug_window_checkbox)
         
@@ -1350,24 +1659,22 @@ class MainWindow(QMainWindow):
         # 使用 Grid 佈局來節省空間
         grid_layout = QGridLayout()
         self.info_fps_checkbox = QCheckBox("FPS")
-        self.info_fps_checkbox.setChecked(True)
-        self.info_fps_checkbox.stateChanged.connect(lambda: self.update_info_item('fps', self.info_fps_checkbox.isChecked()))
-        
         self.info_resolution_checkbox = QCheckBox(t("resolution_info", "解析度"))
-        self.info_resolution_checkbox.setChecked(True)
-        self.info_resolution_checkbox.stateChanged.connect(lambda: self.update_info_item('resolution', self.info_resolution_checkbox.isChecked()))
-        
         self.info_detection_size_checkbox = QCheckBox(t("detection_area_info", "區域大小"))
-        self.info_detection_size_checkbox.setChecked(True)
-        self.info_detection_size_checkbox.stateChanged.connect(lambda: self.update_info_item('detection_size', self.info_detection_size_checkbox.isChecked()))
-        
         self.info_state_checkbox = QCheckBox(t("detection_state_info", "檢測狀態"))
-        self.info_state_checkbox.setChecked(True)
-        self.info_state_checkbox.stateChanged.connect(lambda: self.update_info_item('state', self.info_state_checkbox.isChecked()))
-        
         self.info_hotkeys_checkbox = QCheckBox(t("hotkeys_info", "快捷鍵"))
-        self.info_hotkeys_checkbox.setChecked(True)
-        self.info_hotkeys_checkbox.stateChanged.connect(lambda: self.update_info_item('hotkeys', self.info_hotkeys_checkbox.isChecked()))
+        
+        # 非互斥按鈕組，按鈕 ID 即為信息項目位元，統一由一個槽更新位元遮罩
+        self.info_button_group = QButtonGroup(self)
+        self.info_button_group.setExclusive(False)
+        for checkbox, bit in ((self.info_fps_checkbox, INFO_FPS),
+                              (self.info_resolution_checkbox, INFO_RESOLUTION),
+                              (self.info_detection_size_checkbox, INFO_DETECTION_SIZE),
+                              (self.info_state_checkbox, INFO_STATE),
+                              (self.info_hotkeys_checkbox, INFO_HOTKEYS)):
+            checkbox.setChecked(bool(self._info_mask & bit))
+            self.info_button_group.addButton(checkbox, bit)
+        self.info_button_group.buttonToggled[int, bool].connect(self.update_info_item)
         
         grid_layout.addWidget(self.info_fps_checkbox, 0, 0)
         grid_layout.addWidget(self.info_resolution_checkbox, 0, 1)
@@ -1382,6 +1689,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(debug_group)
         
         layout.addStretch()
+        panel.setUpdatesEnabled(True)
         return panel
 
     def create_log_panel(self):
@@ -1390,21 +1698,67 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(10, 10, 10, 10)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)  # 只保留最近的日誌，舊的自動移除
         self.log_text.setMaximumHeight(150)
-        self.log_text.setStyleSheet("font-family: 'Consolas'; font-size: 9pt; background-color: #1a1a1a; border: none;")
+        self.log_text.setObjectName("LogText")
         layout.addWidget(self.log_text)
         
         return panel
     
+    def _region_values(self, prefix: str) -> tuple:
+        """讀取指定擷取模式的範圍與偏移輸入值"""
+        return tuple(getattr(self, f"{prefix}_{name}_input").value()
+                     for name in ("range_x", "range_y", "offset_x", "offset_y"))
+    
     def load_settings_from_config(self):
         """從配置檔案載入設置"""
-        self.ip_input.setText(self.config_manager.get("udp_ip", "127.0.0.1"))
-        self.port_input.setValue(self.config_manager.get("udp_port", 1234))
+        # 記錄載入前的擷取區域，載入後只在實際改變時才重新配置擷取
+        previous_regions = {prefix: self._region_values(prefix) for prefix in ("mss", "bettercam", "dxgi")}
+        
+        # 批量設置期間阻擋輸入框信號，避免每個 setValue 都觸發下游回調，結束後統一應用一次
+        # （擷取模式選擇器、範圍控件和檢測區域保持連接，它們的回調負責同步界面狀態）
+        blocked_widgets = [
+            self.ip_input, self.port_input, self.udp_fps_input,
+            self.tcp_ip_input, self.tcp_port_input, self.tcp_fps_input,
+            self.srt_ip_input, self.srt_port_input, self.srt_fps_input,
+            self.bettercam_fps_input, self.dxgi_fps_input,
+            self.color_from_r, self.color_from_g, self.color_from_b,
+            self.color_to_r, self.color_to_g, self.color_to_b,
+            self.target_color_r, self.target_color_g, self.target_color_b,
+            self.tolerance_input,
+        ]
+        for fields in (CAPTURE_CARD_FIELDS, MSS_FIELDS, BETTERCAM_FIELDS, DXGI_FIELDS):
+            blocked_widgets.extend(getattr(self, field[0]) for field in fields)
+        blockers = [QSignalBlocker(widget) for widget in blocked_widgets]
+        try:
+            self._apply_config_to_widgets()
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        # 配置中的擷取模式立即生效，不等待合併計時器
+        if self._mode_change_timer.isActive():
+            self._apply_pending_mode_change()
+        
+        # 同步被阻擋信號的配對控件與下游狀態
+        self._set_value_silently(self.bettercam_fps_slider, self.bettercam_fps_input.value())
+        self._set_value_silently(self.dxgi_fps_slider, self.dxgi_fps_input.value())
+        if self.is_running:
+            self.color_detector.set_tolerance(self.tolerance_input.value())
+        for prefix, handler in (("mss", self.on_mss_range_changed),
+                                ("bettercam", self.on_bettercam_range_changed),
+                                ("dxgi", self.on_dxgi_range_changed)):
+            if self._region_values(prefix) != previous_regions[prefix]:
+                handler()
+    
+    def _apply_config_to_widgets(self):
+        """將配置值寫入界面控件"""
+        # 一次取得唯讀配置快照，之後直接查表
+        cfg = self.config_manager.get_all()
         # 載入擷取模式
-        capture_mode = self.config_manager.get("capture_mode", "udp")
-        bettercam_mode = self.config_manager.get("bettercam_mode", "cpu")
+        capture_mode = cfg.get("capture_mode", "udp")
+        bettercam_mode = cfg.get("bettercam_mode", "cpu")
         
         # 設置擷取模式選擇器
         mode_text = capture_mode
@@ -1413,113 +1767,99 @@ class MainWindow(QMainWindow):
         elif capture_mode == "bettercam_cpu" or capture_mode == "bettercam_gpu":
             mode_text = capture_mode
         
-        for i in range(self.capture_mode_combo.count()):
-            if self.capture_mode_combo.itemData(i) == mode_text:
-                self.capture_mode_combo.setCurrentIndex(i)
-                break
+        mode_index = self.capture_mode_combo.findData(mode_text)
+        if mode_index >= 0:
+            self.capture_mode_combo.setCurrentIndex(mode_index)
         
         # 載入UDP設置
-        self.ip_input.setText(self.config_manager.get("udp_ip", "127.0.0.1"))
-        self.port_input.setValue(self.config_manager.get("udp_port", 1234))
-        self.udp_fps_input.setValue(self.config_manager.get("target_fps", 60))
+        self.ip_input.setText(cfg.get("udp_ip", "127.0.0.1"))
+        self.port_input.setValue(cfg.get("udp_port", 1234))
+        self.udp_fps_input.setValue(cfg.get("target_fps", 60))
         
         # 載入 TCP 設置
-        if hasattr(self, 'tcp_ip_input'):
-            self.tcp_ip_input.setText(self.config_manager.get("tcp_ip", "192.168.0.1"))
-            self.tcp_port_input.setValue(self.config_manager.get("tcp_port", 1234))
-            self.tcp_fps_input.setValue(self.config_manager.get("tcp_fps", 60))
-            self.tcp_server_mode_checkbox.setChecked(self.config_manager.get("tcp_server_mode", False))
+        self.tcp_ip_input.setText(cfg.get("tcp_ip", "192.168.0.1"))
+        self.tcp_port_input.setValue(cfg.get("tcp_port", 1234))
+        self.tcp_fps_input.setValue(cfg.get("tcp_fps", 60))
+        self.tcp_server_mode_checkbox.setChecked(cfg.get("tcp_server_mode", False))
         
         # 載入 SRT 設置
-        if hasattr(self, 'srt_ip_input'):
-            self.srt_ip_input.setText(self.config_manager.get("srt_ip", "192.168.0.1"))
-            self.srt_port_input.setValue(self.config_manager.get("srt_port", 1234))
-            self.srt_fps_input.setValue(self.config_manager.get("srt_fps", 60))
-            self.srt_listener_mode_checkbox.setChecked(self.config_manager.get("srt_listener_mode", False))
+        self.srt_ip_input.setText(cfg.get("srt_ip", "192.168.0.1"))
+        self.srt_port_input.setValue(cfg.get("srt_port", 1234))
+        self.srt_fps_input.setValue(cfg.get("srt_fps", 60))
+        self.srt_listener_mode_checkbox.setChecked(cfg.get("srt_listener_mode", False))
         
         # 載入Capture Card設置
-        self.capture_device_index_input.setValue(self.config_manager.get("capture_device_index", 0))
-        self.capture_width_input.setValue(self.config_manager.get("capture_width", 1920))
-        self.capture_height_input.setValue(self.config_manager.get("capture_height", 1080))
-        self.capture_fps_input.setValue(self.config_manager.get("capture_fps", 240))
-        self.capture_range_x_input.setValue(self.config_manager.get("capture_range_x", 0))
-        self.capture_range_y_input.setValue(self.config_manager.get("capture_range_y", 0))
-        self.capture_offset_x_input.setValue(self.config_manager.get("capture_offset_x", 0))
-        self.capture_offset_y_input.setValue(self.config_manager.get("capture_offset_y", 0))
+        self.capture_device_index_input.setValue(cfg.get("capture_device_index", 0))
+        self.capture_width_input.setValue(cfg.get("capture_width", 1920))
+        self.capture_height_input.setValue(cfg.get("capture_height", 1080))
+        self.capture_fps_input.setValue(cfg.get("capture_fps", 240))
+        self.capture_range_x_input.setValue(cfg.get("capture_range_x", 0))
+        self.capture_range_y_input.setValue(cfg.get("capture_range_y", 0))
+        self.capture_offset_x_input.setValue(cfg.get("capture_offset_x", 0))
+        self.capture_offset_y_input.setValue(cfg.get("capture_offset_y", 0))
+        self.capture_low_latency_checkbox.setChecked(cfg.get("capture_low_latency", True))
         
         # 載入MSS設置
-        self.mss_range_x_input.setValue(self.config_manager.get("mss_range_x", 0))
-        self.mss_range_y_input.setValue(self.config_manager.get("mss_range_y", 0))
-        self.mss_offset_x_input.setValue(self.config_manager.get("mss_offset_x", 0))
-        self.mss_offset_y_input.setValue(self.config_manager.get("mss_offset_y", 0))
-        self.mss_trigger_offset_x_input.setValue(self.config_manager.get("mss_trigger_offset_x", 0))
-        self.mss_trigger_offset_y_input.setValue(self.config_manager.get("mss_trigger_offset_y", 0))
+        self.mss_range_x_input.setValue(cfg.get("mss_range_x", 0))
+        self.mss_range_y_input.setValue(cfg.get("mss_range_y", 0))
+        self.mss_offset_x_input.setValue(cfg.get("mss_offset_x", 0))
+        self.mss_offset_y_input.setValue(cfg.get("mss_offset_y", 0))
+        self.mss_trigger_offset_x_input.setValue(cfg.get("mss_trigger_offset_x", 0))
+        self.mss_trigger_offset_y_input.setValue(cfg.get("mss_trigger_offset_y", 0))
         
         # 載入BetterCam設置
-        self.bettercam_range_x_input.setValue(self.config_manager.get("bettercam_range_x", 0))
-        self.bettercam_range_y_input.setValue(self.config_manager.get("bettercam_range_y", 0))
-        self.bettercam_offset_x_input.setValue(self.config_manager.get("bettercam_offset_x", 0))
-        self.bettercam_offset_y_input.setValue(self.config_manager.get("bettercam_offset_y", 0))
-        self.bettercam_trigger_offset_x_input.setValue(self.config_manager.get("bettercam_trigger_offset_x", 0))
-        self.bettercam_trigger_offset_y_input.setValue(self.config_manager.get("bettercam_trigger_offset_y", 0))
-        self.bettercam_fps_input.setValue(self.config_manager.get("bettercam_target_fps", 0))
+        self.bettercam_range_x_input.setValue(cfg.get("bettercam_range_x", 0))
+        self.bettercam_range_y_input.setValue(cfg.get("bettercam_range_y", 0))
+        self.bettercam_offset_x_input.setValue(cfg.get("bettercam_offset_x", 0))
+        self.bettercam_offset_y_input.setValue(cfg.get("bettercam_offset_y", 0))
+        self.bettercam_trigger_offset_x_input.setValue(cfg.get("bettercam_trigger_offset_x", 0))
+        self.bettercam_trigger_offset_y_input.setValue(cfg.get("bettercam_trigger_offset_y", 0))
+        self.bettercam_fps_input.setValue(cfg.get("bettercam_target_fps", 0))
         
         # 載入DXGI設置
-        self.dxgi_range_x_input.setValue(self.config_manager.get("dxgi_range_x", 0))
-        self.dxgi_range_y_input.setValue(self.config_manager.get("dxgi_range_y", 0))
-        self.dxgi_offset_x_input.setValue(self.config_manager.get("dxgi_offset_x", 0))
-        self.dxgi_offset_y_input.setValue(self.config_manager.get("dxgi_offset_y", 0))
-        self.dxgi_trigger_offset_x_input.setValue(self.config_manager.get("dxgi_trigger_offset_x", 0))
-        self.dxgi_trigger_offset_y_input.setValue(self.config_manager.get("dxgi_trigger_offset_y", 0))
-        self.dxgi_fps_input.setValue(self.config_manager.get("dxgi_target_fps", 0))
-        
-        mode = self.config_manager.get("detection_mode", 1)
+        self.dxgi_range_x_input.setValue(cfg.get("dxgi_range_x", 0))
+        self.dxgi_range_y_input.setValue(cfg.get("dxgi_range_y", 0))
+        self.dxgi_offset_x_input.setValue(cfg.get("dxgi_offset_x", 0))
+        self.dxgi_offset_y_input.setValue(cfg.get("dxgi_offset_y", 0))
+        self.dxgi_trigger_offset_x_input.setValue(cfg.get("dxgi_trigger_offset_x", 0))
+        self.dxgi_trigger_offset_y_input.setValue(cfg.get("dxgi_trigger_offset_y", 0))
+        self.dxgi_fps_input.setValue(cfg.get("dxgi_target_fps", 0))
+        
+        mode = cfg.get("detection_mode", 1)
         if mode == 1:
             self.mode1_radio.setChecked(True)
-            self.mode1_group.setVisible(True)
-            self.mode2_group.setVisible(False)
         else:
             self.mode2_radio.setChecked(True)
-            self.mode1_group.setVisible(False)
-            self.mode2_group.setVisible(True)
+        self.mode_stack.setCurrentIndex(0 if mode == 1 else 1)
         
-        self.color_from_r.setValue(self.config_manager.get("color_from_r", 206))
-        self.color_from_g.setValue(self.config_manager.get("color_from_g", 38))
-        self.color_from_b.setValue(self.config_manager.get("color_from_b", 54))
+        self.color_from_r.setValue(cfg.get("color_from_r", 206))
+        self.color_from_g.setValue(cfg.get("color_from_g", 38))
+        self.color_from_b.setValue(cfg.get("color_from_b", 54))
         self._update_color_preview('from')
         
-        self.color_to_r.setValue(self.config_manager.get("color_to_r", 75))
-        self.color_to_g.setValue(self.config_manager.get("color_to_g", 219))
-        self.color_to_b.setValue(self.config_manager.get("color_to_b", 106))
+        self.color_to_r.setValue(cfg.get("color_to_r", 75))
+        self.color_to_g.setValue(cfg.get("color_to_g", 219))
+        self.color_to_b.setValue(cfg.get("color_to_b", 106))
         self._update_color_preview('to')
         
-        self.target_color_r.setValue(self.config_manager.get("target_color_r", 206))
-        self.target_color_g.setValue(self.config_manager.get("target_color_g", 38))
-        self.target_color_b.setValue(self.config_manager.get("target_color_b", 54))
+        self.target_color_r.setValue(cfg.get("target_color_r", 206))
+        self.target_color_g.setValue(cfg.get("target_color_g", 38))
+        self.target_color_b.setValue(cfg.get("target_color_b", 54))
         self._update_color_preview('target')
         
-        self.tolerance_input.setValue(self.config_manager.get("tolerance", 30))
+        self.tolerance_input.setValue(cfg.get("tolerance", 30))
         
-        # 載入延遲範圍（向後兼容單一值）
-        press_delay_min = self.config_manager.get("press_delay_min", self.config_manager.get("press_delay", 0))
-        press_delay_max = self.config_manager.get("press_delay_max", self.config_manager.get("press_delay", 0))
-        self.press_delay_min_input.setValue(press_delay_min)
-        self.press_delay_max_input.setValue(press_delay_max)
+        # 載入延遲範圍（ConfigManager 已在載入時處理舊版單一值並計算好 (min, max)）
+        delays = self.config_manager.delays
+        for prefix, range_input in self.delay_range_inputs.items():
+            delay_min, delay_max = delays[prefix]
+            range_input.min_input.setValue(delay_min)
+            range_input.max_input.setValue(delay_max)
         
-        release_delay_min = self.config_manager.get("release_delay_min", self.config_manager.get("release_delay", 50))
-        release_delay_max = self.config_manager.get("release_delay_max", self.config_manager.get("release_delay", 50))
-        self.release_delay_min_input.setValue(release_delay_min)
-        self.release_delay_max_input.setValue(release_delay_max)
-        
-        cooldown_min = self.config_manager.get("trigger_cooldown_min", self.config_manager.get("trigger_cooldown", 100))
-        cooldown_max = self.config_manager.get("trigger_cooldown_max", self.config_manager.get("trigger_cooldown", 100))
-        self.cooldown_min_input.setValue(cooldown_min)
-        self.cooldown_max_input.setValue(cooldown_max)
-        
-        self.detection_size_input.setValue(self.config_manager.get("detection_size", 10))
+        self.detection_size_input.setValue(cfg.get("detection_size", 10))
         
         # 設置點擊模式（預設為立刻模式）
-        click_mode = self.config_manager.get("click_mode", 2)  # 默認立刻模式
+        click_mode = cfg.get("click_mode", 2)  # 默認立刻模式
         if click_mode == 1:
             self.click_mode_advanced_radio.setChecked(True)
             self.delay_settings_group.setVisible(True)
@@ -1531,34 +1871,52 @@ class MainWindow(QMainWindow):
             self.click_controller.set_release_delay_range(1, 1)
             self.click_controller.set_cooldown_range(1, 1)
     
+    def _queue_capture_mode_change(self, index: int):
+        """記錄待處理的擷取模式切換，停止變化 50ms 後才執行（避免連續切換反覆重建擷取源）"""
+        self._pending_mode_index = index
+        self._mode_change_timer.start()
+    
+    def _apply_pending_mode_change(self):
+        """立即執行待處理的擷取模式切換"""
+        self._mode_change_timer.stop()
+        index, self._pending_mode_index = self._pending_mode_index, -1
+        if index >= 0:
+            self.on_capture_mode_changed(index)
+    
     def on_capture_mode_changed(self, index):
         """擷取模式切換處理"""
         mode_data = self.capture_mode_combo.itemData(index)
-        if not mode_data:
+        # 重新選回已生效的模式（例如合併窗口內來回切換）時不重建擷取源
+        if not mode_data or mode_data == self._applied_mode_data:
             return
+        self._applied_mode_data = mode_data
         
         # 解析模式
-        if mode_data.startswith("bettercam_"):
-            mode = "bettercam"
-            bettercam_mode = mode_data.split("_")[1]
-        else:
-            mode = mode_data
-            bettercam_mode = "cpu"
+        mode, bettercam_mode = _MODE_PARSE.get(mode_data, (mode_data, "cpu"))
         
         # 強制停止所有當前的擷取模式
         self._stop_all_capture_modes()
         
         self.current_capture_mode = mode
         
-        # 顯示/隱藏對應的設置面板
-        self.udp_settings_group.setVisible(mode == "udp")
-        self.tcp_settings_group.setVisible(mode == "tcp")
-        self.srt_settings_group.setVisible(mode == "srt")
-        self.capture_card_settings_group.setVisible(mode == "capture_card")
-        self.mss_settings_group.setVisible(mode == "mss")
-        self.bettercam_settings_group.setVisible(mode == "bettercam" or mode == "bettercam_cpu" or mode == "bettercam_gpu")
-        self.dxgi_settings_group.setVisible(mode == "dxgi")
-        self.ndi_settings_group.setVisible(mode == "ndi")
+        # 顯示/隱藏對應的設置面板（批量切換，只重新佈局一次）
+        self.setUpdatesEnabled(False)
+        try:
+            for group, group_mode in ((self.udp_settings_group, "udp"),
+                                      (self.tcp_settings_group, "tcp"),
+                                      (self.srt_settings_group, "srt"),
+                                      (self.capture_card_settings_group, "capture_card"),
+                                      (self.mss_settings_group, "mss"),
+                                      (self.bettercam_settings_group, "bettercam"),
+                                      (self.dxgi_settings_group, "dxgi"),
+                                      (self.ndi_settings_group, "ndi")):
+                group.setVisible(mode == group_mode)
+        finally:
+            self.setUpdatesEnabled(True)
+        if mode == "ndi":
+            self._ensure_ndi_sources()
+        elif mode in _LOCAL_IP_LABELS:
+            self._update_local_ip_display(getattr(self, _LOCAL_IP_LABELS[mode]))
         
         # 如果正在運行檢測，先停止
         if self.is_running:
@@ -1566,928 +1924,486 @@ class MainWindow(QMainWindow):
         
         self.log(t("switched_to_capture_mode", "切換到擷取模式: {mode}").format(mode=self.capture_mode_combo.itemText(index)))
         
-        # 更新連接按鈕文字
-        if mode == "udp" or mode == "tcp" or mode == "srt":
-            self.connect_btn.setText(t("connect_obs", "連接 OBS"))
-        else:
-            self.connect_btn.setText(t("connect", "連接"))
-        
-        # 重置連接狀態
-        self.connect_btn.setStyleSheet("")
-        self.start_btn.setEnabled(False)
-        self.stats_label.setText(t("disconnected_status", "已斷開連接"))
+        # 重置連接狀態（網路串流模式的按鈕提示連接 OBS）
+        texts = self._texts
+        connect_text = texts.connect_obs if mode in ("udp", "tcp", "srt") else texts.connect
+        self._set_connection_state(False, texts.disconnected_status, connect_text)
+        self._schedule_connection_info_update()
+    
+    def _schedule_connection_info_update(self):
+        """在下一輪事件循環刷新連接信息（緊接著的連接操作會覆蓋時不再重複重繪）"""
+        if not self._pending_conn_update:
+            self._pending_conn_update = True
+            QTimer.singleShot(0, self._flush_connection_info_update)
+    
+    def _flush_connection_info_update(self):
+        self._pending_conn_update = False
         self._update_connection_info()
     
+    def _reset_frame_count(self):
+        """重置擷取幀計數和 FPS 計時起點"""
+        self.frame_counter.reset()
+        self.frame_count_start_ns = time.perf_counter_ns()
+    
     def _stop_all_capture_modes(self):
         """強制停止所有擷取模式"""
-        # 停止 UDP
-        if self.udp_receiver and self.udp_receiver.is_connected:
-            try:
-                self.udp_receiver.disconnect()
-                self.udp_receiver = None
-                self.log(t("udp_disconnected", "已停止 UDP 擷取"))
-                log_connection_event("UDP 停止", {"狀態": "成功"})
-            except Exception as e:
-                log_exception(e, context="停止 UDP 擷取", additional_info={
-                    "擷取模式": "UDP",
-                    "連接狀態": self.udp_receiver.is_connected if self.udp_receiver else "None"
-                })
-                logger.error(f"停止 UDP 時出錯: {e}")
-        
-        # 停止 TCP
-        if self.tcp_receiver and self.tcp_receiver.is_connected:
-            try:
-                self.tcp_receiver.disconnect()
-                self.tcp_receiver = None
-                self.log(t("tcp_disconnected", "已停止 TCP 擷取"))
-                log_connection_event("TCP 停止", {"狀態": "成功"})
-            except Exception as e:
-                log_exception(e, context="停止 TCP 擷取", additional_info={
-                    "擷取模式": "TCP",
-                    "連接狀態": self.tcp_receiver.is_connected if self.tcp_receiver else "None"
-                })
-                logger.error(f"停止 TCP 時出錯: {e}")
-        
-        # 停止 SRT
-        if self.srt_receiver and self.srt_receiver.is_connected:
-            try:
-                self.srt_receiver.disconnect()
-                self.srt_receiver = None
-                self.log(t("srt_disconnected", "已停止 SRT 擷取"))
-                log_connection_event("SRT 停止", {"狀態": "成功"})
-            except Exception as e:
-                log_exception(e, context="停止 SRT 擷取", additional_info={
-                    "擷取模式": "SRT",
-                    "連接狀態": self.srt_receiver.is_connected if self.srt_receiver else "None"
-                })
-                logger.error(f"停止 SRT 時出錯: {e}")
-        
-        # 停止 Capture Card
-        if self.capture_card_camera:
-            try:
-                self.capture_card_camera.stop()
-                self.capture_card_camera = None
-                self.log(t("capture_card_disconnected", "已停止 Capture Card 擷取"))
-                log_connection_event("Capture Card 停止", {"狀態": "成功"})
-            except Exception as e:
-                log_exception(e, context="停止 Capture Card 擷取", additional_info={
-                    "擷取模式": "Capture Card",
-                    "相機對象": str(type(self.capture_card_camera))
-                })
-                logger.error(f"停止 Capture Card 時出錯: {e}")
-        
-        # 停止 BetterCam
-        if self.bettercam_camera:
-            try:
-                self.bettercam_camera.stop()
-                self.bettercam_camera = None
-                self.log(t("bettercam_disconnected", "已停止 BetterCam 擷取"))
-                log_connection_event("BetterCam 停止", {"狀態": "成功"})
-            except Exception as e:
-                log_exception(e, context="停止 BetterCam 擷取", additional_info={
-                    "擷取模式": "BetterCam",
-                    "相機對象": str(type(self.bettercam_camera))
-                })
-                logger.error(f"停止 BetterCam 時出錯: {e}")
-        
-        # 停止 MSS
-        if self.mss_capture:
-            try:
-                self.mss_capture.stop()
-                self.mss_capture = None
-                self.log(t("mss_disconnected", "已停止 MSS 擷取"))
-                log_connection_event("MSS 停止", {"狀態": "成功"})
-            except Exception as e:
-                log_exception(e, context="停止 MSS 擷取", additional_info={
-                    "擷取模式": "MSS",
-                    "擷取對象": str(type(self.mss_capture))
-                })
-                logger.error(f"停止 MSS 時出錯: {e}")
-        
-        # 停止 DXGI
-        if self.dxgi_capture:
-            try:
-                self.dxgi_capture.stop()
-                self.dxgi_capture = None
-                self.log(t("dxgi_disconnected", "已停止 DXGI 擷取"))
-                log_connection_event("DXGI 停止", {"狀態": "成功"})
-            except Exception as e:
-                log_exception(e, context="停止 DXGI 擷取", additional_info={
-                    "擷取模式": "DXGI",
-                    "擷取對象": str(type(self.dxgi_capture))
-                })
-                logger.error(f"停止 DXGI 時出錯: {e}")
-        
-        # 停止 NDI
-        if self.ndi_capture:
+        for entry in CAPTURE_SOURCES:
+            source = getattr(self, entry.attr)
+            if not source or (entry.connected_only and not source.is_connected):
+                continue
             try:
-                self.ndi_capture.stop()
-                self.ndi_capture = None
-                self.log(t("ndi_disconnected", "已停止 NDI 擷取"))
-                log_connection_event("NDI 停止", {"狀態": "成功"})
+                getattr(source, entry.stop_method)()
+                setattr(self, entry.attr, None)
+                self.log(t(entry.log_key, f"已停止 {entry.label} 擷取"))
+                log_connection_event(f"{entry.label} 停止", {"狀態": "成功"})
             except Exception as e:
-                log_exception(e, context="停止 NDI 擷取", additional_info={
-                    "擷取模式": "NDI",
-                    "擷取對象": str(type(self.ndi_capture))
-                })
-                logger.error(f"停止 NDI 時出錯: {e}")
+                additional_info = dict(_CAPTURE_SOURCE_LOG_INFO[entry.attr])
+                if entry.connected_only:
+                    additional_info["連接狀態"] = source.is_connected
+                else:
+                    additional_info["擷取對象"] = str(type(source))
+                log_exception(e, context=f"停止 {entry.label} 擷取", additional_info=additional_info)
+                logger.error(f"停止 {entry.label} 時出錯: {e}")
     
     def save_current_config(self):
         """保存當前配置"""
+        # 先執行待處理的模式切換，保存的模式與界面一致
+        self._apply_pending_mode_change()
+        
         # 獲取當前擷取模式
         mode_data = self.capture_mode_combo.currentData()
-        if mode_data and mode_data.startswith("bettercam_"):
-            capture_mode = "bettercam"
-            bettercam_mode = mode_data.split("_")[1]
-        elif mode_data:
-            capture_mode = mode_data
-            bettercam_mode = "cpu"
-        else:
-            capture_mode = "udp"
-            bettercam_mode = "cpu"
+        capture_mode, bettercam_mode = _MODE_PARSE.get(mode_data, (mode_data or "udp", "cpu"))
         
         config_data = {
             "capture_mode": capture_mode,
             "bettercam_mode": bettercam_mode,
-            "udp_ip": self.ip_input.text(),
-            "udp_port": self.port_input.value(),
-            "target_fps": self.udp_fps_input.value(),
-            "tcp_ip": self.tcp_ip_input.text() if hasattr(self, 'tcp_ip_input') else "192.168.0.1",
-            "tcp_port": self.tcp_port_input.value() if hasattr(self, 'tcp_port_input') else 1234,
-            "tcp_fps": self.tcp_fps_input.value() if hasattr(self, 'tcp_fps_input') else 60,
-            "tcp_server_mode": self.tcp_server_mode_checkbox.isChecked() if hasattr(self, 'tcp_server_mode_checkbox') else False,
-            "srt_ip": self.srt_ip_input.text() if hasattr(self, 'srt_ip_input') else "192.168.0.1",
-            "srt_port": self.srt_port_input.value() if hasattr(self, 'srt_port_input') else 1234,
-            "srt_fps": self.srt_fps_input.value() if hasattr(self, 'srt_fps_input') else 60,
-            "srt_listener_mode": self.srt_listener_mode_checkbox.isChecked() if hasattr(self, 'srt_listener_mode_checkbox') else False,
-            "capture_device_index": self.capture_device_index_input.value(),
-            "capture_width": self.capture_width_input.value(),
-            "capture_height": self.capture_height_input.value(),
-            "capture_fps": self.capture_fps_input.value(),
-            "capture_range_x": self.capture_range_x_input.value(),
-            "capture_range_y": self.capture_range_y_input.value(),
-            "capture_offset_x": self.capture_offset_x_input.value(),
-            "capture_offset_y": self.capture_offset_y_input.value(),
-            "mss_range_x": self.mss_range_x_input.value(),
-            "mss_range_y": self.mss_range_y_input.value(),
-            "mss_offset_x": self.mss_offset_x_input.value(),
-            "mss_offset_y": self.mss_offset_y_input.value(),
-            "mss_trigger_offset_x": self.mss_trigger_offset_x_input.value(),
-            "mss_trigger_offset_y": self.mss_trigger_offset_y_input.value(),
-            "bettercam_range_x": self.bettercam_range_x_input.value(),
-            "bettercam_range_y": self.bettercam_range_y_input.value(),
-            "bettercam_offset_x": self.bettercam_offset_x_input.value(),
-            "bettercam_offset_y": self.bettercam_offset_y_input.value(),
-            "bettercam_trigger_offset_x": self.bettercam_trigger_offset_x_input.value(),
-            "bettercam_trigger_offset_y": self.bettercam_trigger_offset_y_input.value(),
-            "bettercam_target_fps": self.bettercam_fps_input.value(),
-            "dxgi_range_x": self.dxgi_range_x_input.value(),
-            "dxgi_range_y": self.dxgi_range_y_input.value(),
-            "dxgi_offset_x": self.dxgi_offset_x_input.value(),
-            "dxgi_offset_y": self.dxgi_offset_y_input.value(),
-            "dxgi_trigger_offset_x": self.dxgi_trigger_offset_x_input.value(),
-            "dxgi_trigger_offset_y": self.dxgi_trigger_offset_y_input.value(),
-            "dxgi_target_fps": self.dxgi_fps_input.value(),
             "detection_mode": self.mode_button_group.checkedId(),
-            "color_from_r": self.color_from_r.value(),
-            "color_from_g": self.color_from_g.value(),
-            "color_from_b": self.color_from_b.value(),
-            "color_to_r": self.color_to_r.value(),
-            "color_to_g": self.color_to_g.value(),
-            "color_to_b": self.color_to_b.value(),
-            "target_color_r": self.target_color_r.value(),
-            "target_color_g": self.target_color_g.value(),
-            "target_color_b": self.target_color_b.value(),
-            "tolerance": self.tolerance_input.value(),
-            "press_delay_min": self.press_delay_min_input.value(),
-            "press_delay_max": self.press_delay_max_input.value(),
-            "release_delay_min": self.release_delay_min_input.value(),
-            "release_delay_max": self.release_delay_max_input.value(),
-            "trigger_cooldown_min": self.cooldown_min_input.value(),
-            "trigger_cooldown_max": self.cooldown_max_input.value(),
-            "detection_size": self.detection_size_input.value()
         }
+        config_data.update((widget.key, getattr(getattr(self, widget.attr), widget.getter)())
+                           for widget in CONFIG_WIDGETS)
+        for prefix, range_input in self.delay_range_inputs.items():
+            config_data[prefix + "_min"], config_data[prefix + "_max"] = range_input.values()
+        # 同步保存會寫入全部配置：取消待刷新的延遲寫入，並等待線程池中的舊內容寫完，避免舊內容覆蓋本次保存
+        self._config_flush_timer.stop()
+        self._config_dirty = False
+        self._config_write_pool.waitForDone()
         if self.config_manager.save(config_data):
             self.log(t("config_saved", "✓ 配置已保存到 config.json"))
         else:
             self.log(t("config_save_failed", "✗ 配置保存失敗"), error=True)
     
+    def _mark_config_dirty(self):
+        """標記配置已修改，500ms 內無新修改才寫入檔案"""
+        self._config_dirty = True
+        self._config_flush_timer.start()
+    
+    def _flush_config(self):
+        """將待寫入的配置寫入檔案"""
+        self._config_flush_timer.stop()
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        # 主線程只做序列化，寫入檔案交給線程池
+        try:
+            payload = self.config_manager.serialize()
+        except Exception as e:
+            logger.error(f"序列化配置失敗: {e}")
+            return
+        if payload is not None:
+            self._config_write_pool.start(ConfigWriteTask(self.config_manager, payload))
+    
     def reload_config(self):
         """重新載入配置"""
-        self.config_manager.load()
-        self.load_settings_from_config()
+        self._flush_config()
+        self._config_write_pool.waitForDone()
+        self.config_manager.reload(force=True)
         self.log(t("config_reloaded", "✓ 配置已重新載入"))
     
+    def _reload_config_if_changed(self):
+        """配置檔案被外部修改時重新載入（只比較修改時間，未變更時不重新解析）"""
+        # 本地修改尚未寫入或正在寫入時不重新載入，避免覆蓋界面上的修改
+        if self._config_dirty or self._config_write_pool.activeThreadCount():
+            return
+        if self.config_manager.reload():
+            self.log(t("config_reloaded", "✓ 配置已重新載入"))
+    
     def on_language_changed(self, index):
         """語言切換處理"""
         lang_code = self.language_combo.itemData(index)
-        if lang_code and self.language_manager.load_language(lang_code):
+        # 重新選擇當前語言時不重新載入和重新翻譯整個界面
+        if not lang_code or lang_code == self.language_manager.get_current_lang():
+            return
+        if self.language_manager.load_language(lang_code):
             # 保存語言設置
             self.config_manager.set("language", lang_code)
-            self.config_manager.save()
+            self._mark_config_dirty()
             
             # 更新所有 UI 文字
+            self._rebuild_text_cache()
             self.update_ui_texts()
             self.update_window_title()
             
             self.log(t("language_changed", f"語言已切換為: {self.language_combo.itemText(index)}"))
     
-    def update_window_title(self):
+    def _rebuild_text_cache(self):
+        """預先翻譯連接流程和畫面等待提示中反覆使用的文字（切換語言時重建）"""
+        self._texts = SimpleNamespace(
+            connect=t("connect", "連接"),
+            connect_obs=t("connect_obs", "連接 OBS"),
+            disconnect=t("disconnect", "斷開連接"),
+            disconnecting=t("disconnecting", "正在斷開連接..."),
+            disconnected_status=t("disconnected_status", "已斷開連接"),
+            waiting_for_frame_data=t("waiting_for_frame_data", "等待畫面數據..."),
+            # 模板：{mode}
+            confirm_capture_providing=t("confirm_capture_providing", "請確認 {mode} 正在提供畫面"),
+        )
+    
+    def update_window_title(self):
         """更新窗口標題"""
         base_title = t("window_title", "顏色檢測自動點擊程式 v1.2")
         self.setWindowTitle(f"{base_title}  -  made by asenyeroao")
     
     def update_ui_texts(self):
-        """更新所有 UI 文字"""
-        # 頂部按鈕
-        self.connect_btn.setText(t("connect_obs", "連接 OBS"))
-        self.start_btn.setText(t("start_detection", "啟動檢測"))
-        self.save_config_btn.setText(t("save_config", "保存配置"))
-        self.load_config_btn.setText(t("reload_config", "重載配置"))
+        """更新所有 UI 文字（批量更新期間暫停重繪，結束後一次性刷新）"""
+        self.setUpdatesEnabled(False)
+        try:
+            self._retranslate_widgets()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _retranslate_widgets(self):
+        """將當前語言的文字寫入各控件"""
+        # 多處使用的文字只翻譯一次
+        texts = self._texts
+        
+        # 頂部按鈕（連接按鈕文字依當前模式在最後設置）
+        _set_text_if_changed(self.start_btn, t("start_detection", "啟動檢測"))
+        _set_text_if_changed(self.save_config_btn, t("save_config", "保存配置"))
+        _set_text_if_changed(self.load_config_btn, t("reload_config", "重載配置"))
         
         # 設置面板標題
-        if hasattr(self, 'udp_settings_group'):
-            self.udp_settings_group.setTitle(t("udp_settings", "UDP 設置"))
-        if hasattr(self, 'capture_card_settings_group'):
-            self.capture_card_settings_group.setTitle(t("capture_card_settings", "Capture Card 設置"))
-        if hasattr(self, 'mss_settings_group'):
-            self.mss_settings_group.setTitle(t("mss_settings", "MSS 設置"))
-        if hasattr(self, 'bettercam_settings_group'):
-            self.bettercam_settings_group.setTitle(t("bettercam_settings", "BetterCam 設置"))
-        if hasattr(self, 'dxgi_settings_group'):
-            self.dxgi_settings_group.setTitle(t("dxgi_settings", "DXGI 設置"))
-        if hasattr(self, 'ndi_settings_group'):
-            self.ndi_settings_group.setTitle(t("ndi_settings", "NDI 設置"))
+        self.udp_settings_group.setTitle(t("udp_settings", "UDP 設置"))
+        self.capture_card_settings_group.setTitle(t("capture_card_settings", "Capture Card 設置"))
+        self.mss_settings_group.setTitle(t("mss_settings", "MSS 設置"))
+        self.bettercam_settings_group.setTitle(t("bettercam_settings", "BetterCam 設置"))
+        self.dxgi_settings_group.setTitle(t("dxgi_settings", "DXGI 設置"))
+        self.ndi_settings_group.setTitle(t("ndi_settings", "NDI 設置"))
         
         # 更新 FPS 顯示標籤
-        if hasattr(self, 'fps_label'):
-            self.fps_label.setText(t("ui_fps_display", "UI FPS: {ui_fps:.1f} | 擷取FPS: {capture_fps:.1f}").format(
-                ui_fps=self.ui_fps,
-                capture_fps=self.capture_fps
-            ))
-        
-        # 更新擷取模式選項
-        if hasattr(self, 'capture_mode_combo'):
+        _set_text_if_changed(self.fps_label, t("ui_fps_display", "UI FPS: {ui_fps:.1f} | 擷取FPS: {capture_fps:.1f}").format(
+            ui_fps=self.ui_fps,
+            capture_fps=self.capture_fps
+        ))
+        
+        # 更新擷取模式選項（語言未變時選項文字相同，跳過重建）
+        if self._capture_mode_combo_lang != self.language_manager.get_current_lang():
             current_data = self.capture_mode_combo.currentData()
+            # 重建期間阻擋信號，避免 clear()/addItem() 觸發擷取模式切換
+            combo_blocker = QSignalBlocker(self.capture_mode_combo)
             self.capture_mode_combo.clear()
-            self.capture_mode_combo.addItem(t("udp", "UDP"), "udp")
-            if TCP_AVAILABLE:
-                self.capture_mode_combo.addItem(t("tcp", "TCP"), "tcp")
-            else:
-                self.capture_mode_combo.addItem(t("tcp", "TCP") + " " + t("tcp_not_installed", "[未安裝]"), "tcp")
-            if SRT_AVAILABLE:
-                self.capture_mode_combo.addItem(t("srt", "SRT"), "srt")
-            else:
-                self.capture_mode_combo.addItem(t("srt", "SRT") + " " + t("srt_not_installed", "[未安裝]"), "srt")
-            self.capture_mode_combo.addItem(t("capture_card", "Capture Card"), "capture_card")
-            if BETTERCAM_AVAILABLE:
-                self.capture_mode_combo.addItem(t("bettercam_cpu", "BetterCam (CPU)"), "bettercam_cpu")
-                self.capture_mode_combo.addItem(t("bettercam_gpu", "BetterCam (GPU)"), "bettercam_gpu")
-            else:
-                self.capture_mode_combo.addItem(t("bettercam_cpu", "BetterCam (CPU)") + " " + t("bettercam_not_installed", "[未安裝]"), "bettercam_cpu")
-                self.capture_mode_combo.addItem(t("bettercam_gpu", "BetterCam (GPU)") + " " + t("bettercam_not_installed", "[未安裝]"), "bettercam_gpu")
-            if MSS_AVAILABLE:
-                self.capture_mode_combo.addItem(t("mss", "MSS"), "mss")
-            else:
-                self.capture_mode_combo.addItem(t("mss", "MSS") + " " + t("mss_not_installed", "[未安裝]"), "mss")
-            if DXGI_AVAILABLE:
-                self.capture_mode_combo.addItem(t("dxgi", "DXGI"), "dxgi")
-            else:
-                self.capture_mode_combo.addItem(t("dxgi", "DXGI") + " " + t("dxgi_not_installed", "[未安裝]"), "dxgi")
-            if NDI_AVAILABLE:
-                self.capture_mode_combo.addItem(t("ndi", "OBS NDI"), "ndi")
-            else:
-                self.capture_mode_combo.addItem(t("ndi", "OBS NDI") + " " + t("ndi_not_installed", "[未安裝]"), "ndi")
+            self._populate_capture_mode_combo()
             # 恢復之前的選擇
             if current_data:
                 index = self.capture_mode_combo.findData(current_data)
                 if index >= 0:
                     self.capture_mode_combo.setCurrentIndex(index)
+            combo_blocker.unblock()
         
         # 更新檢測模式
-        if hasattr(self, 'mode1_radio'):
-            self.mode1_radio.setText(t("mode_1", "模式 1 (變色)"))
-            self.mode2_radio.setText(t("mode_2", "模式 2 (單色)"))
+        _set_text_if_changed(self.mode1_radio, t("mode_1", "模式 1 (變色)"))
+        _set_text_if_changed(self.mode2_radio, t("mode_2", "模式 2 (單色)"))
         
         # 更新按鈕文字
-        if hasattr(self, 'move_test_btn'):
-            self.move_test_btn.setText(t("test_move", "測試移動"))
-            self.click_test_btn.setText(t("test_click", "測試點擊"))
-            self.switch_4m_btn.setText(t("switch_4m", "切換 4M 波特率"))
+        _set_text_if_changed(self.move_test_btn, t("test_move", "測試移動"))
+        _set_text_if_changed(self.click_test_btn, t("test_click", "測試點擊"))
+        _set_text_if_changed(self.switch_4m_btn, t("switch_4m", "切換 4M 波特率"))
         
         # 更新 CheckBox 文字
-        if hasattr(self, 'debug_window_checkbox'):
-            self.debug_window_checkbox.setText(t("enable_debug_window", "開啟即時畫面預覽 (調試窗口)"))
-            self.always_on_top_checkbox.setText(t("always_on_top", "窗口置頂"))
-            self.show_text_info_checkbox.setText(t("show_params", "顯示參數"))
+        _set_text_if_changed(self.debug_window_checkbox, t("enable_debug_window", "開啟即時畫面預覽 (調試窗口)"))
+        _set_text_if_changed(self.always_on_top_checkbox, t("always_on_top", "窗口置頂"))
+        _set_text_if_changed(self.show_text_info_checkbox, t("show_params", "顯示參數"))
         
         # 更新調試工具中的 CheckBox
-        if hasattr(self, 'info_fps_checkbox'):
-            self.info_fps_checkbox.setText(t("fps_info", "FPS"))
-            self.info_resolution_checkbox.setText(t("resolution_info", "解析度"))
-            self.info_detection_size_checkbox.setText(t("detection_area_info", "區域大小"))
-            self.info_state_checkbox.setText(t("detection_state_info", "檢測狀態"))
-            self.info_hotkeys_checkbox.setText(t("hotkeys_info", "快捷鍵"))
-        
-        # 更新系統狀態標題
-        if hasattr(self, 'detection_status_label'):
-            if not self.is_running:
-                self.detection_status_label.setText(t("not_started", "未啟動"))
+        _set_text_if_changed(self.info_fps_checkbox, t("fps_info", "FPS"))
+        _set_text_if_changed(self.info_resolution_checkbox, t("resolution_info", "解析度"))
+        _set_text_if_changed(self.info_detection_size_checkbox, t("detection_area_info", "區域大小"))
+        _set_text_if_changed(self.info_state_checkbox, t("detection_state_info", "檢測狀態"))
+        _set_text_if_changed(self.info_hotkeys_checkbox, t("hotkeys_info", "快捷鍵"))
         
         # 更新滑鼠狀態標題
-        if hasattr(self, 'mouse_status_label'):
-            if not mouse_module.is_connected:
-                self.mouse_status_label.setText(t("not_connected", "未連接"))
+        if not mouse_module.is_connected:
+            _set_text_if_changed(self.mouse_status_label, t("not_connected", "未連接"))
         
-        # 更新連接按鈕文字（根據當前模式）
-        if hasattr(self, 'capture_mode_combo'):
-            mode_data = self.capture_mode_combo.currentData()
-            if mode_data == "udp":
-                if hasattr(self, 'udp_receiver') and self.udp_receiver and self.udp_receiver.is_connected:
-                    self.connect_btn.setText(t("disconnect", "斷開連接"))
-                else:
-                    self.connect_btn.setText(t("connect_obs", "連接 OBS"))
-            elif mode_data == "tcp":
-                if hasattr(self, 'tcp_receiver') and self.tcp_receiver and self.tcp_receiver.is_connected:
-                    self.connect_btn.setText(t("disconnect", "斷開連接"))
-                else:
-                    self.connect_btn.setText(t("connect_obs", "連接 OBS"))
-            elif mode_data == "srt":
-                if hasattr(self, 'srt_receiver') and self.srt_receiver and self.srt_receiver.is_connected:
-                    self.connect_btn.setText(t("disconnect", "斷開連接"))
-                else:
-                    self.connect_btn.setText(t("connect_obs", "連接 OBS"))
-            else:
-                is_connected = False
-                if mode_data == "capture_card" and hasattr(self, 'capture_card_camera') and self.capture_card_camera:
-                    is_connected = self.capture_card_camera.cap is not None and self.capture_card_camera.cap.isOpened()
-                elif mode_data and mode_data.startswith("bettercam") and hasattr(self, 'bettercam_camera') and self.bettercam_camera:
-                    is_connected = self.bettercam_camera.running
-                elif mode_data == "mss" and hasattr(self, 'mss_capture') and self.mss_capture:
-                    is_connected = self.mss_capture.running
-                
-                if is_connected:
-                    self.connect_btn.setText(t("disconnect", "斷開連接"))
-                else:
-                    self.connect_btn.setText(t("connect", "連接"))
+        # 更新連接按鈕文字（根據當前模式，模式數據只讀取一次並傳給標籤更新）
+        mode_data = self.capture_mode_combo.currentData()
+        is_connected = _CONN_CHECKERS.get(mode_data, _not_connected)(self)
+        if is_connected:
+            _set_text_if_changed(self.connect_btn, texts.disconnect)
+        elif mode_data in ("udp", "tcp", "srt"):
+            _set_text_if_changed(self.connect_btn, texts.connect_obs)
+        else:
+            _set_text_if_changed(self.connect_btn, texts.connect)
         
         # 更新所有標籤文字（需要遍歷所有 QLabel）
-        self._update_all_labels()
+        self._update_all_labels(mode_data, is_connected)
     
-    def _update_all_labels(self):
-        """更新所有表單標籤和其他標籤的文字"""
+    def _update_all_labels(self, mode_data=None, is_connected: bool = False):
+        """
+        更新所有表單標籤和其他標籤的文字
+        
+        Args:
+            mode_data: 擷取模式選擇器的當前數據
+            is_connected: 當前擷取模式是否已連接
+        """
         # 更新系統狀態標籤
-        if hasattr(self, 'detection_status_label'):
-            if not self.is_running:
-                self.detection_status_label.setText(t("not_started", "未啟動"))
-        
-        if hasattr(self, 'stats_label'):
-            mode_data = self.capture_mode_combo.currentData() if hasattr(self, 'capture_mode_combo') else None
-            is_connected = False
-            if mode_data == "udp":
-                is_connected = hasattr(self, 'udp_receiver') and self.udp_receiver and self.udp_receiver.is_connected
-            elif mode_data == "tcp":
-                is_connected = hasattr(self, 'tcp_receiver') and self.tcp_receiver and self.tcp_receiver.is_connected
-            elif mode_data == "srt":
-                is_connected = hasattr(self, 'srt_receiver') and self.srt_receiver and self.srt_receiver.is_connected
-            
-            if not is_connected and (mode_data == "udp" or mode_data == "tcp" or mode_data == "srt"):
-                if not hasattr(self, 'bettercam_camera') or not self.bettercam_camera or not self.bettercam_camera.running:
-                    if not hasattr(self, 'mss_capture') or not self.mss_capture or not self.mss_capture.running:
-                        if not hasattr(self, 'capture_card_camera') or not self.capture_card_camera:
-                            self.stats_label.setText(t("waiting_for_data", "等待畫面數據..."))
+        if not self.is_running:
+            _set_text_if_changed(self.detection_status_label, t("not_started", "未啟動"))
+        
+        if not is_connected and (mode_data == "udp" or mode_data == "tcp" or mode_data == "srt"):
+            if ((self.bettercam_camera is None or not self.bettercam_camera.running)
+                    and (self.mss_capture is None or not self.mss_capture.running)
+                    and self.capture_card_camera is None):
+                _set_text_if_changed(self.stats_label, t("waiting_for_data", "等待畫面數據..."))
         
-        if hasattr(self, 'cooldown_label'):
-            self.cooldown_label.setText(t("ready", "準備就緒"))
+        _set_text_if_changed(self.cooldown_label, t("ready", "準備就緒"))
         
         # 更新擷取模式標籤
-        if hasattr(self, 'capture_mode_label'):
-            self.capture_mode_label.setText(t("capture_mode", "擷取模式") + ":")
+        _set_text_if_changed(self.capture_mode_label, t("capture_mode", "擷取模式") + ":")
         
         # 更新檢測模式標籤
-        if hasattr(self, 'detection_mode_label'):
-            self.detection_mode_label.setText(t("detection_mode", "檢測模式") + ":")
+        _set_text_if_changed(self.detection_mode_label, t("detection_mode", "檢測模式") + ":")
     
     def on_mode_changed(self):
         """模式切換處理"""
         mode = self.mode_button_group.checkedId()
-        self.mode1_group.setVisible(mode == 1)
-        self.mode2_group.setVisible(mode == 2)
+        self.mode_stack.setCurrentIndex(0 if mode == 1 else 1)
         self.color_detector.set_mode(mode)
         self.log(t("mode_switched", f"切換到模式 {mode}"))
     
     def toggle_connection(self):
         """切換擷取連接狀態"""
+        # 先執行待處理的模式切換，否則延遲觸發的切換會停止剛建立的連接
+        self._apply_pending_mode_change()
         mode_data = self.capture_mode_combo.currentData()
         if not mode_data:
             return
         
         # 解析模式
-        if mode_data.startswith("bettercam_"):
-            mode = "bettercam"
-            bettercam_mode = mode_data.split("_")[1]
-        else:
-            mode = mode_data
-            bettercam_mode = "cpu"
-        
-        is_connected = False
-        if mode == "udp":
-            is_connected = self.udp_receiver is not None and self.udp_receiver.is_connected
-        elif mode == "capture_card":
-            is_connected = self.capture_card_camera is not None and self.capture_card_camera.cap is not None and self.capture_card_camera.cap.isOpened()
-        elif mode == "bettercam":
-            is_connected = self.bettercam_camera is not None and self.bettercam_camera.running
-        elif mode == "mss":
-            is_connected = self.mss_capture is not None and self.mss_capture.running
-        elif mode == "dxgi":
-            is_connected = self.dxgi_capture is not None and self.dxgi_capture.running
-        elif mode == "ndi":
-            is_connected = self.ndi_capture is not None and self.ndi_capture.is_connected()
-        elif mode == "tcp":
-            is_connected = self.tcp_receiver is not None and self.tcp_receiver.is_connected
-        elif mode == "srt":
-            is_connected = self.srt_receiver is not None and self.srt_receiver.is_connected
-        
-        if not is_connected:
-            # 連接
-            if mode == "udp":
-                ip = self.ip_input.text()
-                port = self.port_input.value()
-                fps = self.udp_fps_input.value()
-                
-                self.log(t("connecting_to_udp", "正在連接到 UDP {ip}:{port}...").format(ip=ip, port=port))
-                try:
-                    self.udp_receiver = OBS_UDP_Receiver(ip, port, fps, max_workers=4)
-                    self.udp_receiver.set_frame_callback(self.on_frame_received)
-                    
-                    if self.udp_receiver.connect():
-                        self.log(t("udp_connected_success", "✓ 成功連接到 OBS UDP 流"))
-                        self.connect_btn.setText(t("disconnect", "斷開連接"))
-                        self.connect_btn.setStyleSheet("background-color: #ff5555;")
-                        self.start_btn.setEnabled(True)
-                        self.stats_label.setText(t("waiting_for_frame_data", "等待畫面數據..."))
-                        self.frame_count = 0
-                        self.frame_count_start_time = time.time()
-                        QTimer.singleShot(100, self._update_connection_info)
-                    else:
-                        self.log(t("connection_failed", "✗ 連接失敗"), error=True)
-                        self.udp_receiver = None
-                        self._update_connection_info()
-                except Exception as e:
-                    log_exception(e, context="UDP 連接", additional_info={
-                        "IP": self.ip_input.text(),
-                        "端口": self.port_input.value(),
-                        "目標 FPS": self.udp_fps_input.value()
-                    })
-                    self.log(t("connection_failed_error", "✗ 連接失敗: {error}").format(error=str(e)), error=True)
-                    self.udp_receiver = None
-            
-            elif mode == "tcp":
-                if not TCP_AVAILABLE:
-                    self.log(t("tcp_not_installed", "✗ TCP 模組未安裝"), error=True)
-                    return
-                
-                ip = self.tcp_ip_input.text()
-                port = self.tcp_port_input.value()
-                fps = self.tcp_fps_input.value()
-                is_server = self.tcp_server_mode_checkbox.isChecked()
-                
-                self.log(t("connecting_to_tcp", "正在連接到 TCP {ip}:{port}...").format(ip=ip, port=port))
-                try:
-                    self.tcp_receiver = OBS_TCP_Receiver(ip, port, fps, is_server=is_server, max_workers=4)
-                    self.tcp_receiver.set_frame_callback(self.on_frame_received)
-                    
-                    if self.tcp_receiver.connect():
-                        self.log(t("tcp_connected_success", "✓ 成功連接到 OBS TCP 流"))
-                        self.connect_btn.setText(t("disconnect", "斷開連接"))
-                        self.connect_btn.setStyleSheet("background-color: #ff5555;")
-                        self.start_btn.setEnabled(True)
-                        self.stats_label.setText(t("waiting_for_frame_data", "等待畫面數據..."))
-                        self.frame_count = 0
-                        self.frame_count_start_time = time.time()
-                        QTimer.singleShot(100, self._update_connection_info)
-                    else:
-                        self.log(t("connection_failed", "✗ 連接失敗"), error=True)
-                        self.tcp_receiver = None
-                        self._update_connection_info()
-                except Exception as e:
-                    log_exception(e, context="TCP 連接", additional_info={
-                        "IP": self.tcp_ip_input.text(),
-                        "端口": self.tcp_port_input.value(),
-                        "目標 FPS": self.tcp_fps_input.value(),
-                        "伺服器模式": self.tcp_server_mode_checkbox.isChecked()
-                    })
-                    self.log(t("connection_failed_error", "✗ 連接失敗: {error}").format(error=str(e)), error=True)
-                    self.tcp_receiver = None
-            
-            elif mode == "srt":
-                if not SRT_AVAILABLE:
-                    self.log(t("srt_not_installed", "✗ SRT 模組未安裝"), error=True)
-                    return
-                
-                ip = self.srt_ip_input.text()
-                port = self.srt_port_input.value()
-                fps = self.srt_fps_input.value()
-                is_listener = self.srt_listener_mode_checkbox.isChecked()
-                
-                self.log(t("connecting_to_srt", "正在連接到 SRT {ip}:{port}...").format(ip=ip, port=port))
-                try:
-                    self.srt_receiver = OBS_SRT_Receiver(ip, port, fps, is_listener=is_listener, max_workers=4)
-                    self.srt_receiver.set_frame_callback(self.on_frame_received)
-                    
-                    if self.srt_receiver.connect():
-                        self.log(t("srt_connected_success", "✓ 成功連接到 OBS SRT 流"))
-                        self.connect_btn.setText(t("disconnect", "斷開連接"))
-                        self.connect_btn.setStyleSheet("background-color: #ff5555;")
-                        self.start_btn.setEnabled(True)
-                        self.stats_label.setText(t("waiting_for_frame_data", "等待畫面數據..."))
-                        self.frame_count = 0
-                        self.frame_count_start_time = time.time()
-                        QTimer.singleShot(100, self._update_connection_info)
-                    else:
-                        self.log(t("connection_failed", "✗ 連接失敗"), error=True)
-                        self.srt_receiver = None
-                        self._update_connection_info()
-                except Exception as e:
-                    log_exception(e, context="SRT 連接", additional_info={
-                        "IP": self.srt_ip_input.text(),
-                        "端口": self.srt_port_input.value(),
-                        "目標 FPS": self.srt_fps_input.value(),
-                        "監聽模式": self.srt_listener_mode_checkbox.isChecked()
-                    })
-                    self.log(t("connection_failed_error", "✗ 連接失敗: {error}").format(error=str(e)), error=True)
-                    self.srt_receiver = None
+        mode, bettercam_mode = _MODE_PARSE.get(mode_data, (mode_data, "cpu"))
+        connector = CAPTURE_CONNECTORS.get(mode)
+        if connector is None:
+            return
+        
+        if not _CONN_CHECKERS.get(mode_data, _not_connected)(self):
+            self._connect_capture(connector, bettercam_mode)
+            return
+        
+        # 斷開
+        self.log(self._texts.disconnecting)
+        if self.is_running:
+            self.toggle_detection()
+        
+        source = getattr(self, connector.attr)
+        if source:
+            entry = _CAPTURE_SOURCE_BY_ATTR[connector.attr]
+            try:
+                getattr(source, entry.stop_method)()
+            except Exception as e:
+                log_exception(e, context=f"關閉時停止 {entry.label}",
+                              additional_info=dict(_CAPTURE_SOURCE_LOG_INFO[connector.attr]))
+                logger.error(f"停止 {entry.label} 時出錯: {e}")
+            finally:
+                setattr(self, connector.attr, None)
+        
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_connection_state(False, self._texts.disconnected_status)
+            self._update_connection_info()
+        finally:
+            self.setUpdatesEnabled(True)
     
-            elif mode == "capture_card":
-                self.log(t("connecting_capture_card", "正在連接 Capture Card..."))
-                try:
-                    # 更新config對象
-                    self.config_manager.set("capture_device_index", self.capture_device_index_input.value())
-                    self.config_manager.set("capture_width", self.capture_width_input.value())
-                    self.config_manager.set("capture_height", self.capture_height_input.value())
-                    self.config_manager.set("capture_fps", self.capture_fps_input.value())
-                    self.config_manager.set("capture_range_x", self.capture_range_x_input.value())
-                    self.config_manager.set("capture_range_y", self.capture_range_y_input.value())
-                    self.config_manager.set("capture_offset_x", self.capture_offset_x_input.value())
-                    self.config_manager.set("capture_offset_y", self.capture_offset_y_input.value())
-                    
-                    # 創建一個臨時配置對象
-                    class TempConfig:
-                        pass
-                    temp_config = TempConfig()
-                    for key in ["capture_device_index", "capture_width", "capture_height", "capture_fps",
-                               "capture_range_x", "capture_range_y", "capture_offset_x", "capture_offset_y",
-                               "region_size"]:
-                        setattr(temp_config, key, self.config_manager.get(key, 0))
-                    
-                    self.capture_card_camera = create_capture_card_camera(temp_config)
-                    self.log(t("capture_card_connected", "✓ 成功連接到 Capture Card"))
-                    self.connect_btn.setText(t("disconnect", "斷開連接"))
-                    self.connect_btn.setStyleSheet("background-color: #ff5555;")
-                    self.start_btn.setEnabled(True)
-                    self.stats_label.setText(t("capture_card_connected", "Capture Card 已連接"))
-                    # 使用線程安全的方式重置計數器
-                    if hasattr(self, '_frame_count_lock'):
-                        with self._frame_count_lock:
-                            self.frame_count = 0
-                    else:
-                        self.frame_count = 0
-                    self.frame_count_start_time = time.time()
-                    # 啟動幀獲取線程
-                    self._start_capture_card_thread()
-                except Exception as e:
-                    log_exception(e, context="Capture Card 連接", additional_info={
-                        "設備索引": self.capture_device_index_input.value(),
-                        "寬度": self.capture_width_input.value(),
-                        "高度": self.capture_height_input.value(),
-                        "FPS": self.capture_fps_input.value()
-                    })
-                    self.log(t("capture_card_connection_failed", "✗ Capture Card 連接失敗: {error}").format(error=str(e)), error=True)
-                    self.capture_card_camera = None
+    def _set_connection_state(self, connected: bool, status_text: str, connect_text: Optional[str] = None):
+        """
+        一次設置連接按鈕、開始按鈕和狀態標籤（期間暫停重繪，結束後一次性刷新）
+        
+        Args:
+            connected: 是否已連接
+            status_text: 狀態標籤文字
+            connect_text: 未連接時的按鈕文字（默認為「連接」）
+        """
+        texts = self._texts
+        # 調用方已暫停重繪時不重複切換（避免提前恢復重繪）
+        pause_updates = self.updatesEnabled()
+        if pause_updates:
+            self.setUpdatesEnabled(False)
+        try:
+            if connected:
+                _set_text_if_changed(self.connect_btn, texts.disconnect)
+                _set_style_if_changed(self.connect_btn, "background-color: #ff5555;")
+            else:
+                _set_text_if_changed(self.connect_btn, connect_text or texts.connect)
+                _set_style_if_changed(self.connect_btn, "")
+            self.start_btn.setEnabled(connected)
+            _set_text_if_changed(self.stats_label, status_text)
+        finally:
+            if pause_updates:
+                self.setUpdatesEnabled(True)
     
-            elif mode == "bettercam":
-                if not BETTERCAM_AVAILABLE:
-                    self.log(t("bettercam_not_installed", "✗ BetterCam 未安裝，請先安裝: pip install bettercam"), error=True)
-                    return
-                
-                self.log(t("starting_bettercam", "正在啟動 BetterCam ({mode})...").format(mode=bettercam_mode.upper()))
-                try:
-                    # 更新config對象
-                    self.config_manager.set("bettercam_range_x", self.bettercam_range_x_input.value())
-                    self.config_manager.set("bettercam_range_y", self.bettercam_range_y_input.value())
-                    self.config_manager.set("bettercam_offset_x", self.bettercam_offset_x_input.value())
-                    self.config_manager.set("bettercam_offset_y", self.bettercam_offset_y_input.value())
-                    self.config_manager.set("bettercam_trigger_offset_x", self.bettercam_trigger_offset_x_input.value())
-                    self.config_manager.set("bettercam_trigger_offset_y", self.bettercam_trigger_offset_y_input.value())
-                    
-                    # 創建一個臨時配置對象
-                    class TempConfig:
-                        pass
-                    temp_config = TempConfig()
-                    for key in ["bettercam_range_x", "bettercam_range_y", "bettercam_offset_x", "bettercam_offset_y",
-                               "bettercam_trigger_offset_x", "bettercam_trigger_offset_y"]:
-                        setattr(temp_config, key, self.config_manager.get(key, 0))
-                    
-                    # 獲取屏幕分辨率（如果配置中沒有，使用 Windows API）
-                    screen_width = self.config_manager.get("screen_width", 0)
-                    screen_height = self.config_manager.get("screen_height", 0)
-                    if screen_width <= 0 or screen_height <= 0:
-                        try:
-                            import ctypes
-                            user32 = ctypes.windll.user32
-                            screen_width = user32.GetSystemMetrics(0)  # SM_CXSCREEN
-                            screen_height = user32.GetSystemMetrics(1)  # SM_CYSCREEN
-                        except:
-                            screen_width = 1920
-                            screen_height = 1080
-                    setattr(temp_config, "screen_width", screen_width)
-                    setattr(temp_config, "screen_height", screen_height)
-                    
-                    use_gpu = (bettercam_mode == "gpu")
-                    # 讀取目標 FPS 設置
-                    target_fps = self.config_manager.get("bettercam_target_fps", 0)
-                    self.bettercam_camera = create_bettercam_capture(temp_config, device_idx=0, output_idx=0, use_gpu=use_gpu, target_fps=target_fps)
-                    
-                    if self.bettercam_camera.start():
-                        self.log(t("bettercam_started", "✓ BetterCam ({mode}) 已啟動").format(mode=bettercam_mode.upper()))
-                        self.connect_btn.setText(t("disconnect", "斷開連接"))
-                        self.connect_btn.setStyleSheet("background-color: #ff5555;")
-                        self.start_btn.setEnabled(True)
-                        self.stats_label.setText(t("bettercam_connected", "BetterCam 已連接"))
-                        # 使用線程安全的方式重置計數器
-                        if hasattr(self, '_frame_count_lock'):
-                            with self._frame_count_lock:
-                                self.frame_count = 0
-                        else:
-                            self.frame_count = 0
-                        self.frame_count_start_time = time.time()
-                        # 啟動幀獲取線程
-                        self._start_bettercam_thread()
-                    else:
-                        self.log(t("bettercam_start_failed", "✗ BetterCam 啟動失敗"), error=True)
-                        self.bettercam_camera = None
-                except Exception as e:
-                    log_exception(e, context="BetterCam 啟動", additional_info={
-                        "模式": bettercam_mode,
-                        "範圍": f"{self.bettercam_range_x_input.value()}x{self.bettercam_range_y_input.value()}",
-                        "偏移": f"({self.bettercam_offset_x_input.value()}, {self.bettercam_offset_y_input.value()})"
-                    })
-                    self.log(t("bettercam_start_failed", "✗ BetterCam 啟動失敗: {error}").format(error=str(e)), error=True)
-                    self.bettercam_camera = None
-                    
-            elif mode == "mss":
-                if not MSS_AVAILABLE:
-                    self.log(t("mss_not_installed_msg", "✗ MSS 未安裝，請先安裝: pip install mss"), error=True)
-                    return
-                
-                self.log(t("starting_mss", "正在啟動 MSS..."))
-                try:
-                    # 更新config對象
-                    self.config_manager.set("mss_range_x", self.mss_range_x_input.value())
-                    self.config_manager.set("mss_range_y", self.mss_range_y_input.value())
-                    self.config_manager.set("mss_offset_x", self.mss_offset_x_input.value())
-                    self.config_manager.set("mss_offset_y", self.mss_offset_y_input.value())
-                    self.config_manager.set("mss_trigger_offset_x", self.mss_trigger_offset_x_input.value())
-                    self.config_manager.set("mss_trigger_offset_y", self.mss_trigger_offset_y_input.value())
-                    
-                    # 創建一個臨時配置對象
-                    class TempConfig:
-                        pass
-                    temp_config = TempConfig()
-                    for key in ["mss_range_x", "mss_range_y", "mss_offset_x", "mss_offset_y",
-                               "mss_trigger_offset_x", "mss_trigger_offset_y"]:
-                        setattr(temp_config, key, self.config_manager.get(key, 0))
-                    
-                    # MSS 會自動檢測屏幕分辨率，但我們也可以設置
-                    # 如果配置中沒有，MSS 會自動從 monitor 獲取
-                    screen_width = self.config_manager.get("screen_width", 0)
-                    screen_height = self.config_manager.get("screen_height", 0)
-                    if screen_width <= 0 or screen_height <= 0:
-                        # MSS 會自動檢測，這裡設置為 0 讓它自動檢測
-                        screen_width = 0
-                        screen_height = 0
-                    setattr(temp_config, "screen_width", screen_width)
-                    setattr(temp_config, "screen_height", screen_height)
-                    
-                    self.mss_capture = create_mss_capture(temp_config)
-                    self.log(t("mss_started", "✓ MSS 已啟動"))
-                    self.connect_btn.setText(t("disconnect", "斷開連接"))
-                    self.connect_btn.setStyleSheet("background-color: #ff5555;")
-                    self.start_btn.setEnabled(True)
-                    self.stats_label.setText(t("mss_connected", "MSS 已連接"))
-                    # 使用線程安全的方式重置計數器
-                    if hasattr(self, '_frame_count_lock'):
-                        with self._frame_count_lock:
-                            self.frame_count = 0
-                    else:
-                        self.frame_count = 0
-                    self.frame_count_start_time = time.time()
-                    # 啟動幀獲取線程
-                    self._start_mss_thread()
-                except Exception as e:
-                    log_exception(e, context="MSS 啟動", additional_info={
-                        "範圍": f"{self.mss_range_x_input.value()}x{self.mss_range_y_input.value()}",
-                        "偏移": f"({self.mss_offset_x_input.value()}, {self.mss_offset_y_input.value()})"
-                    })
-                    self.log(t("mss_start_failed", "✗ MSS 啟動失敗: {error}").format(error=str(e)), error=True)
-                    self.mss_capture = None
-            elif mode == "dxgi":
-                if not DXGI_AVAILABLE:
-                    self.log(t("dxgi_not_installed_msg", "✗ DXGI (dxcam) 未安裝，請先安裝: pip install dxcam"), error=True)
-                    return
-                
-                self.log(t("starting_dxgi", "正在啟動 DXGI..."))
-                try:
-                    # 更新config對象
-                    self.config_manager.set("dxgi_range_x", self.dxgi_range_x_input.value())
-                    self.config_manager.set("dxgi_range_y", self.dxgi_range_y_input.value())
-                    self.config_manager.set("dxgi_offset_x", self.dxgi_offset_x_input.value())
-                    self.config_manager.set("dxgi_offset_y", self.dxgi_offset_y_input.value())
-                    self.config_manager.set("dxgi_trigger_offset_x", self.dxgi_trigger_offset_x_input.value())
-                    self.config_manager.set("dxgi_trigger_offset_y", self.dxgi_trigger_offset_y_input.value())
-                    self.config_manager.set("dxgi_target_fps", self.dxgi_fps_input.value())
-                    
-                    # 創建一個臨時配置對象
-                    class TempConfig:
-                        pass
-                    temp_config = TempConfig()
-                    for key in ["dxgi_range_x", "dxgi_range_y", "dxgi_offset_x", "dxgi_offset_y",
-                               "dxgi_trigger_offset_x", "dxgi_trigger_offset_y", "dxgi_target_fps"]:
-                        setattr(temp_config, key, self.config_manager.get(key, 0))
-                    
-                    # 獲取屏幕分辨率（如果配置中沒有，使用 Windows API）
-                    screen_width = self.config_manager.get("screen_width", 0)
-                    screen_height = self.config_manager.get("screen_height", 0)
-                    if screen_width <= 0 or screen_height <= 0:
-                        try:
-                            import ctypes
-                            user32 = ctypes.windll.user32
-                            screen_width = user32.GetSystemMetrics(0)  # SM_CXSCREEN
-                            screen_height = user32.GetSystemMetrics(1)  # SM_CYSCREEN
-                        except:
-                            screen_width = 1920
-                            screen_height = 1080
-                    setattr(temp_config, "screen_width", screen_width)
-                    setattr(temp_config, "screen_height", screen_height)
-                    
-                    target_fps = self.dxgi_fps_input.value()
-                    self.dxgi_capture = create_dxgi_capture(temp_config, output_idx=0, target_fps=target_fps)
-                    
-                    if self.dxgi_capture.start():
-                        self.log(t("dxgi_started", "✓ DXGI 已啟動"))
-                        self.connect_btn.setText(t("disconnect", "斷開連接"))
-                        self.connect_btn.setStyleSheet("background-color: #ff5555;")
-                        self.start_btn.setEnabled(True)
-                        self.stats_label.setText(t("dxgi_connected", "DXGI 已連接"))
-                        # 使用線程安全的方式重置計數器
-                        if hasattr(self, '_frame_count_lock'):
-                            with self._frame_count_lock:
-                                self.frame_count = 0
-                        else:
-                            self.frame_count = 0
-                        self.frame_count_start_time = time.time()
-                        # 啟動幀獲取線程
-                        self._start_dxgi_thread()
-                    else:
-                        self.log(t("dxgi_start_failed", "✗ DXGI 啟動失敗"), error=True)
-                        self.dxgi_capture = None
-                except Exception as e:
-                    log_exception(e, context="DXGI 啟動", additional_info={
-                        "範圍": f"{self.dxgi_range_x_input.value()}x{self.dxgi_range_y_input.value()}",
-                        "偏移": f"({self.dxgi_offset_x_input.value()}, {self.dxgi_offset_y_input.value()})",
-                        "目標 FPS": self.dxgi_fps_input.value()
-                    })
-                    self.log(t("dxgi_start_failed", "✗ DXGI 啟動失敗: {error}").format(error=str(e)), error=True)
-                    self.dxgi_capture = None
-            
-            elif mode == "ndi":
-                if not NDI_AVAILABLE:
-                    self.log(t("ndi_not_installed_msg", "✗ NDI 未安裝，請先安裝: pip install cyndilib"), error=True)
-                    return
-                
-                self.log(t("starting_ndi", "正在啟動 NDI..."))
-                try:
-                    # 獲取 NDI 源選擇
-                    source_name = self.ndi_source_combo.currentText().strip()
-                    source_index = self.ndi_source_index_input.value()
-                    
-                    # 如果源名稱不為空，使用名稱；否則使用索引
-                    if source_name:
-                        source_name_or_index = source_name
-                    else:
-                        source_name_or_index = source_index
-                    
-                    # 創建臨時配置對象
-                    class TempConfig:
-                        pass
-                    temp_config = TempConfig()
-                    temp_config.ndi_width = 0  # 將由 NDI 自動檢測
-                    temp_config.ndi_height = 0  # 將由 NDI 自動檢測
-                    
-                    self.ndi_capture = create_ndi_capture(config=temp_config, source_name_or_index=source_name_or_index)
-                    
-                    if self.ndi_capture.start():
-                        self.log(t("ndi_started", "✓ NDI 已啟動"))
-                        self.connect_btn.setText(t("disconnect", "斷開連接"))
-                        self.connect_btn.setStyleSheet("background-color: #ff5555;")
-                        self.start_btn.setEnabled(True)
-                        self.stats_label.setText(t("ndi_connected", "NDI 已連接"))
-                        # 使用線程安全的方式重置計數器
-                        if hasattr(self, '_frame_count_lock'):
-                            with self._frame_count_lock:
-                                self.frame_count = 0
-                        else:
-                            self.frame_count = 0
-                        self.frame_count_start_time = time.time()
-                        # 啟動幀獲取線程
-                        self._start_ndi_thread()
-                    else:
-                        self.log(t("ndi_start_failed", "✗ NDI 啟動失敗，請檢查 NDI 源是否可用"), error=True)
-                        self.ndi_capture = None
-                except Exception as e:
-                    log_exception(e, context="NDI 啟動", additional_info={
-                        "源名稱": self.ndi_source_combo.currentText().strip(),
-                        "源索引": self.ndi_source_index_input.value()
-                    })
-                    self.log(t("ndi_start_failed", "✗ NDI 啟動失敗: {error}").format(error=str(e)), error=True)
-                    self.ndi_capture = None
-        else:
-            # 斷開
-            self.log(t("disconnecting", "正在斷開連接..."))
-            if self.is_running:
-                self.toggle_detection()
-            
-            if mode == "udp" and self.udp_receiver:
-                self.udp_receiver.disconnect()
-                self.udp_receiver = None
-            elif mode == "tcp" and self.tcp_receiver:
-                self.tcp_receiver.disconnect()
-                self.tcp_receiver = None
-            elif mode == "srt" and self.srt_receiver:
-                self.srt_receiver.disconnect()
-                self.srt_receiver = None
-            elif mode == "capture_card" and self.capture_card_camera:
-                self.capture_card_camera.stop()
-                self.capture_card_camera = None
-            elif mode == "bettercam" and self.bettercam_camera:
-                try:
-                    self.bettercam_camera.stop()
-                except Exception as e:
-                    log_exception(e, context="關閉時停止 BetterCam", additional_info={
-                        "擷取模式": "BetterCam"
-                    })
-                    logger.error(f"停止 BetterCam 時出錯: {e}")
-                finally:
-                    self.bettercam_camera = None
-            elif mode == "mss" and self.mss_capture:
-                self.mss_capture.stop()
-                self.mss_capture = None
-            elif mode == "dxgi" and self.dxgi_capture:
-                try:
-                    self.dxgi_capture.stop()
-                except Exception as e:
-                    log_exception(e, context="關閉時停止 DXGI", additional_info={
-                        "擷取模式": "DXGI"
-                    })
-                    logger.error(f"停止 DXGI 時出錯: {e}")
-                finally:
-                    self.dxgi_capture = None
-            elif mode == "ndi" and self.ndi_capture:
-                try:
-                    self.ndi_capture.stop()
-                except Exception as e:
-                    log_exception(e, context="關閉時停止 NDI", additional_info={
-                        "擷取模式": "NDI"
-                    })
-                    logger.error(f"停止 NDI 時出錯: {e}")
-                finally:
-                    self.ndi_capture = None
+    def _connect_capture(self, connector: CaptureConnector, bettercam_mode: str):
+        """按連接處理表連接擷取源（日誌、按鈕狀態、計數器重置和異常處理各模式共用）"""
+        module = None
+        if connector.backend is not None:
+            module = _load_backend(connector.backend) if _BACKEND_AVAILABLE[connector.backend] else None
+            if module is None:
+                self.log(t(*connector.not_installed), error=True)
+                return
+        
+        # 打開擷取源時讀取的參數（只讀一次控件，異常日誌直接使用）
+        info = {}
+        try:
+            source = getattr(self, connector.opener)(module, bettercam_mode, info)
+            setattr(self, connector.attr, source)
+            if source is None:
+                self.log(t(*connector.failed), error=True)
+                if connector.thread_starter is None:
+                    self._update_connection_info()
+                return
             
-            self.connect_btn.setText(t("connect", "連接"))
-            self.connect_btn.setStyleSheet("")
-            self.start_btn.setEnabled(False)
-            self.stats_label.setText(t("disconnected_status", "已斷開連接"))
-            self._update_connection_info()
+            self.log(t(*connector.success).format(mode=bettercam_mode.upper()))
+            self._reset_frame_count()
+            if connector.thread_starter is None:
+                # 網路串流由接收器推送畫面，稍後刷新連接信息
+                self._set_connection_state(True, self._texts.waiting_for_frame_data)
+                QTimer.singleShot(100, self._update_connection_info)
+            else:
+                self._set_connection_state(True, t(*connector.status))
+                # 啟動幀獲取線程
+                getattr(self, connector.thread_starter)()
+        except Exception as e:
+            log_exception(e, context=connector.context, additional_info=info)
+            self.log(t(*connector.error).format(error=str(e)), error=True)
+            setattr(self, connector.attr, None)
+    
+    def _open_udp(self, _module, _bettercam_mode, info: dict):
+        """創建並連接 UDP 接收器，連接失敗返回 None"""
+        ip = self.ip_input.text()
+        port = self.port_input.value()
+        fps = self.udp_fps_input.value()
+        info.update({"IP": ip, "端口": port, "目標 FPS": fps})
+        
+        self.log(t("connecting_to_udp", "正在連接到 UDP {ip}:{port}...").format(ip=ip, port=port))
+        receiver = OBS_UDP_Receiver(ip, port, fps, max_workers=4)
+        receiver.set_frame_callback(self.on_frame_received)
+        return receiver if receiver.connect() else None
+    
+    def _open_tcp(self, obs_tcp, _bettercam_mode, info: dict):
+        """創建並連接 TCP 接收器，連接失敗返回 None"""
+        ip = self.tcp_ip_input.text()
+        port = self.tcp_port_input.value()
+        fps = self.tcp_fps_input.value()
+        is_server = self.tcp_server_mode_checkbox.isChecked()
+        info.update({"IP": ip, "端口": port, "目標 FPS": fps, "伺服器模式": is_server})
+        
+        self.log(t("connecting_to_tcp", "正在連接到 TCP {ip}:{port}...").format(ip=ip, port=port))
+        receiver = obs_tcp.OBS_TCP_Receiver(ip, port, fps, is_server=is_server, max_workers=4)
+        receiver.set_frame_callback(self.on_frame_received)
+        return receiver if receiver.connect() else None
+    
+    def _open_srt(self, obs_srt, _bettercam_mode, info: dict):
+        """創建並連接 SRT 接收器，連接失敗返回 None"""
+        ip = self.srt_ip_input.text()
+        port = self.srt_port_input.value()
+        fps = self.srt_fps_input.value()
+        is_listener = self.srt_listener_mode_checkbox.isChecked()
+        info.update({"IP": ip, "端口": port, "目標 FPS": fps, "監聽模式": is_listener})
+        
+        self.log(t("connecting_to_srt", "正在連接到 SRT {ip}:{port}...").format(ip=ip, port=port))
+        receiver = obs_srt.OBS_SRT_Receiver(ip, port, fps, is_listener=is_listener, max_workers=4)
+        receiver.set_frame_callback(self.on_frame_received)
+        return receiver if receiver.connect() else None
+    
+    def _open_capture_card(self, _module, _bettercam_mode, info: dict):
+        """創建 Capture Card 擷取對象（失敗時拋出異常）"""
+        self.log(t("connecting_capture_card", "正在連接 Capture Card..."))
+        # 輸入框數值一次寫入配置，並作為擷取模組的配置對象
+        low_latency = self.capture_low_latency_checkbox.isChecked()
+        values = self._store_field_values(CAPTURE_CARD_FIELDS, capture_low_latency=low_latency)
+        info.update({"設備索引": values["capture_device_index"], "寬度": values["capture_width"],
+                     "高度": values["capture_height"], "FPS": values["capture_fps"]})
+        temp_config = SimpleNamespace(region_size=self.config_manager.get("region_size", 0),
+                                      capture_buffer_size=1 if low_latency else 0, **values)
+        return create_capture_card_camera(temp_config)
+    
+    def _open_bettercam(self, bettercam_module, bettercam_mode, info: dict):
+        """創建並啟動 BetterCam 擷取，啟動失敗返回 None"""
+        self.log(t("starting_bettercam", "正在啟動 BetterCam ({mode})...").format(mode=bettercam_mode.upper()))
+        info["模式"] = bettercam_mode
+        # 輸入框數值一次寫入配置，並作為擷取模組的配置對象
+        temp_config = SimpleNamespace(**self._store_field_values(BETTERCAM_FIELDS))
+        info.update(_region_log_info(temp_config, "bettercam"))
+        
+        # 獲取屏幕分辨率（如果配置中沒有，使用 Windows API）
+        temp_config.__dict__.update(self.config_manager.get_many(SCREEN_SIZE_KEYS, 0))
+        if temp_config.screen_width <= 0 or temp_config.screen_height <= 0:
+            temp_config.screen_width, temp_config.screen_height = _primary_screen_size()
+        
+        use_gpu = (bettercam_mode == "gpu")
+        # 讀取目標 FPS 設置
+        target_fps = self.config_manager.get("bettercam_target_fps", 0)
+        camera = bettercam_module.create_bettercam_capture(temp_config, device_idx=0, output_idx=0, use_gpu=use_gpu, target_fps=target_fps)
+        return camera if camera.start() else None
+    
+    def _open_mss(self, mss_module, _bettercam_mode, info: dict):
+        """創建 MSS 擷取對象（失敗時拋出異常）"""
+        self.log(t("starting_mss", "正在啟動 MSS..."))
+        # 輸入框數值一次寫入配置，並作為擷取模組的配置對象
+        temp_config = SimpleNamespace(**self._store_field_values(MSS_FIELDS))
+        info.update(_region_log_info(temp_config, "mss"))
+        
+        # MSS 會自動檢測屏幕分辨率，但我們也可以設置
+        # 如果配置中沒有（<= 0），設置為 0 讓 MSS 從 monitor 獲取
+        temp_config.__dict__.update(self.config_manager.get_many(SCREEN_SIZE_KEYS, 0))
+        if temp_config.screen_width <= 0 or temp_config.screen_height <= 0:
+            temp_config.screen_width = temp_config.screen_height = 0
+        return mss_module.create_mss_capture(temp_config)
+    
+    def _open_dxgi(self, dxgi_module, _bettercam_mode, info: dict):
+        """創建並啟動 DXGI 擷取，啟動失敗返回 None"""
+        self.log(t("starting_dxgi", "正在啟動 DXGI..."))
+        target_fps = self.dxgi_fps_input.value()
+        # 輸入框數值一次寫入配置，並作為擷取模組的配置對象
+        temp_config = SimpleNamespace(**self._store_field_values(DXGI_FIELDS, dxgi_target_fps=target_fps))
+        info.update(_region_log_info(temp_config, "dxgi"))
+        info["目標 FPS"] = target_fps
+        
+        # 獲取屏幕分辨率（如果配置中沒有，使用 Windows API）
+        temp_config.__dict__.update(self.config_manager.get_many(SCREEN_SIZE_KEYS, 0))
+        if temp_config.screen_width <= 0 or temp_config.screen_height <= 0:
+            temp_config.screen_width, temp_config.screen_height = _primary_screen_size()
+        
+        capture = dxgi_module.create_dxgi_capture(temp_config, output_idx=0, target_fps=target_fps)
+        return capture if capture.start() else None
+    
+    def _open_ndi(self, ndi_module, _bettercam_mode, info: dict):
+        """創建並啟動 NDI 擷取，啟動失敗返回 None"""
+        self.log(t("starting_ndi", "正在啟動 NDI..."))
+        # 如果源名稱不為空，使用名稱；否則使用索引
+        source_name = self.ndi_source_combo.currentText().strip()
+        source_index = self.ndi_source_index_input.value()
+        info.update({"源名稱": source_name, "源索引": source_index})
+        source_name_or_index = source_name or source_index
+        
+        # 寬高將由 NDI 自動檢測
+        temp_config = SimpleNamespace(ndi_width=0, ndi_height=0)
+        capture = ndi_module.create_ndi_capture(config=temp_config, source_name_or_index=source_name_or_index)
+        return capture if capture.start() else None
     
     def toggle_debug_window(self, state):
         """切換調試窗口"""
         if state == Qt.Checked:
             # 開啟調試窗口
             mode_data = self.capture_mode_combo.currentData()
-            is_connected = False
-            
-            if mode_data == "udp":
-                is_connected = self.udp_receiver is not None and self.udp_receiver.is_connected
-            elif mode_data == "capture_card":
-                is_connected = self.capture_card_camera is not None and self.capture_card_camera.cap is not None and self.capture_card_camera.cap.isOpened()
-            elif mode_data and mode_data.startswith("bettercam"):
-                is_connected = self.bettercam_camera is not None and self.bettercam_camera.running
-            elif mode_data == "mss":
-                is_connected = self.mss_capture is not None and self.mss_capture.running
-            elif mode_data == "dxgi":
-                is_connected = self.dxgi_capture is not None and self.dxgi_capture.running
-            elif mode_data == "ndi":
-                is_connected = self.ndi_capture is not None and self.ndi_capture.is_connected()
+            is_connected = _CONN_CHECKERS.get(mode_data, _not_connected)(self)
             
             if not is_connected:
                 self.log(t("please_connect_capture_first", "✗ 請先連接擷取源"), error=True)
@@ -2502,11 +2418,7 @@ class MainWindow(QMainWindow):
                 self.debug_window.show_info = self.show_text_info_checkbox.isChecked()
                 
                 # 應用詳細信息設置
-                self.debug_window.set_info_item('fps', self.info_fps_checkbox.isChecked())
-                self.debug_window.set_info_item('resolution', self.info_resolution_checkbox.isChecked())
-                self.debug_window.set_info_item('detection_size', self.info_detection_size_checkbox.isChecked())
-                self.debug_window.set_info_item('state', self.info_state_checkbox.isChecked())
-                self.debug_window.set_info_item('hotkeys', self.info_hotkeys_checkbox.isChecked())
+                self.debug_window.set_info_mask(self._info_mask)
                 
                 self.debug_window.start()
                 self.log("✓ 調試窗口已開啟")
@@ -2543,19 +2455,23 @@ class MainWindow(QMainWindow):
             status = "已顯示" if show_info else "已隱藏"
             self.log(f"文字資訊 {status}")
     
-    def update_info_item(self, item: str, visible: bool):
-        """更新信息項目的可見性"""
+    def update_info_item(self, bit: int, visible: bool):
+        """更新信息項目的可見性（bit 為 INFO_* 位元，即按鈕組中的按鈕 ID）"""
+        if visible:
+            self._info_mask |= bit
+        else:
+            self._info_mask &= ~bit
         if self.debug_window:
-            self.debug_window.set_info_item(item, visible)
+            self.debug_window.set_info_mask(self._info_mask)
             item_names = {
-                'fps': 'FPS',
-                'resolution': '解析度',
-                'detection_size': '檢測區域',
-                'state': '檢測狀態',
-                'hotkeys': '快捷鍵提示'
+                INFO_FPS: 'FPS',
+                INFO_RESOLUTION: '解析度',
+                INFO_DETECTION_SIZE: '檢測區域',
+                INFO_STATE: '檢測狀態',
+                INFO_HOTKEYS: '快捷鍵提示'
             }
             status = "顯示" if visible else "隱藏"
-            self.log(f"{item_names.get(item, item)} {status}")
+            self.log(f"{item_names.get(bit, bit)} {status}")
     
     def on_tolerance_changed(self, value):
         """顏色容差改變時"""
@@ -2573,7 +2489,7 @@ class MainWindow(QMainWindow):
         # 保存配置
         self.config_manager.set("press_delay_min", min_val)
         self.config_manager.set("press_delay_max", max_val)
-        self.config_manager.save()
+        self._mark_config_dirty()
         if self.is_running:
             self.log(f"✓ 已應用新的按下延遲範圍")
     
@@ -2585,7 +2501,7 @@ class MainWindow(QMainWindow):
         # 保存配置
         self.config_manager.set("release_delay_min", min_val)
         self.config_manager.set("release_delay_max", max_val)
-        self.config_manager.save()
+        self._mark_config_dirty()
         if self.is_running:
             self.log(f"✓ 已應用新的釋放延遲範圍")
     
@@ -2597,7 +2513,7 @@ class MainWindow(QMainWindow):
         # 保存配置
         self.config_manager.set("trigger_cooldown_min", min_val)
         self.config_manager.set("trigger_cooldown_max", max_val)
-        self.config_manager.save()
+        self._mark_config_dirty()
         if self.is_running:
             self.log(f"✓ 已應用新的觸發冷卻範圍")
     
@@ -2631,7 +2547,7 @@ class MainWindow(QMainWindow):
         
         # 保存配置
         self.config_manager.set("click_mode", mode)
-        self.config_manager.save()
+        self._mark_config_dirty()
     
     def on_detection_size_changed(self, value):
         """檢測區域改變時"""
@@ -2660,6 +2576,12 @@ class MainWindow(QMainWindow):
             range_y = 1
             self.mss_range_y_input.setValue(1)
         
+        # 數值未變（例如輸入後又改回原值）時不重複寫配置、重啟或調整調試窗口
+        region_key = (range_x, range_y, offset_x, offset_y)
+        if region_key == self._last_range_keys.get("mss"):
+            return
+        self._last_range_keys["mss"] = region_key
+        
         # 更新配置
         self.config_manager.set("mss_range_x", range_x)
         self.config_manager.set("mss_range_y", range_y)
@@ -2680,10 +2602,8 @@ class MainWindow(QMainWindow):
             top = center_y - capture_h // 2 + offset_y
             
             # 設置擷取區域信息到 debug window 並調整窗口大小
-            if hasattr(self.debug_window, 'set_capture_region'):
-                self.debug_window.set_capture_region((left, top, left + capture_w, top + capture_h))
-            if hasattr(self.debug_window, 'set_target_size'):
-                self.debug_window.set_target_size((capture_w, capture_h))
+            self.debug_window.set_capture_region((left, top, left + capture_w, top + capture_h))
+            self.debug_window.set_target_size((capture_w, capture_h))
         
         self.log(f"MSS 範圍: {range_x}x{range_y}, 偏移: ({offset_x}, {offset_y})")
     
@@ -2702,19 +2622,26 @@ class MainWindow(QMainWindow):
             range_y = 1
             self.bettercam_range_y_input.setValue(1)
         
+        # 數值未變（例如輸入後又改回原值）時不重複寫配置、重啟或調整調試窗口
+        region_key = (range_x, range_y, offset_x, offset_y)
+        if region_key == self._last_range_keys.get("bettercam"):
+            return
+        self._last_range_keys["bettercam"] = region_key
+        
         # 更新配置
         self.config_manager.set("bettercam_range_x", range_x)
         self.config_manager.set("bettercam_range_y", range_y)
         self.config_manager.set("bettercam_offset_x", offset_x)
         self.config_manager.set("bettercam_offset_y", offset_y)
         
-        # 如果正在運行，需要重新啟動 BetterCam
+        # 如果正在運行，就地更新擷取區域；無法就地更新時才重新啟動 BetterCam
         if self.bettercam_camera and self.bettercam_camera.running:
-            self.log("重新啟動 BetterCam 以應用新的範圍設置...")
-            if self.bettercam_camera.restart():
-                self.log("✓ BetterCam 已重新啟動")
-            else:
-                self.log("✗ BetterCam 重新啟動失敗", error=True)
+            if not self.bettercam_camera.set_region(range_x, range_y, offset_x, offset_y):
+                self.log("重新啟動 BetterCam 以應用新的範圍設置...")
+                if self.bettercam_camera.restart():
+                    self.log("✓ BetterCam 已重新啟動")
+                else:
+                    self.log("✗ BetterCam 重新啟動失敗", error=True)
         
         # 更新 debug window 顯示並調整大小
         if self.debug_window and self.bettercam_camera:
@@ -2729,24 +2656,33 @@ class MainWindow(QMainWindow):
             top = center_y - capture_h // 2 + offset_y
             
             # 設置擷取區域信息到 debug window 並調整窗口大小
-            if hasattr(self.debug_window, 'set_capture_region'):
-                self.debug_window.set_capture_region((left, top, left + capture_w, top + capture_h))
-            if hasattr(self.debug_window, 'set_target_size'):
-                self.debug_window.set_target_size((capture_w, capture_h))
+            self.debug_window.set_capture_region((left, top, left + capture_w, top + capture_h))
+            self.debug_window.set_target_size((capture_w, capture_h))
         
         self.log(f"BetterCam 範圍: {range_x}x{range_y}, 偏移: ({offset_x}, {offset_y})")
     
     def on_dxgi_range_changed(self):
-        """DXGI 範圍或偏移改變時的處理"""
-        # 更新配置
-        self.config_manager.set("dxgi_range_x", self.dxgi_range_x_input.value())
-        self.config_manager.set("dxgi_range_y", self.dxgi_range_y_input.value())
-        self.config_manager.set("dxgi_offset_x", self.dxgi_offset_x_input.value())
-        self.config_manager.set("dxgi_offset_y", self.dxgi_offset_y_input.value())
-        
+        """DXGI 範圍或偏移改變時的處理（配置立即更新，重新啟動延遲合併）"""
+        self._store_field_values(DXGI_FIELDS)
+        self._schedule_dxgi_restart("重新啟動 DXGI 以應用新的範圍設置...")
+    
+    def on_dxgi_fps_changed(self):
+        """DXGI FPS 改變時的處理（配置立即更新，重新啟動延遲合併）"""
+        self.config_manager.set("dxgi_target_fps", self.dxgi_fps_input.value())
+        self._schedule_dxgi_restart("重新啟動 DXGI 以應用新的 FPS 設置...")
+    
+    def _schedule_dxgi_restart(self, message: str):
+        """在 250 毫秒內沒有新的改變後才重新啟動 DXGI（重建擷取鏈需要數十毫秒）"""
+        self._dxgi_restart_message = message
+        self._dxgi_restart_timer.start()
+    
+    def _apply_dxgi_restart(self):
+        """按最新配置重新啟動 DXGI 並更新調試窗口的擷取區域"""
         # 如果 DXGI 正在運行，重新啟動以應用新設置
         if self.dxgi_capture and self.dxgi_capture.running:
-            self.log("重新啟動 DXGI 以應用新的範圍設置...")
+            # 擷取對象從自己的配置快照讀取設置，重新啟動前同步最新數值
+            self.dxgi_capture.config.__dict__.update(self.config_manager.get_many(DXGI_CONFIG_KEYS, 0))
+            self.log(self._dxgi_restart_message)
             if self.dxgi_capture.restart():
                 self.log("✓ DXGI 已重新啟動")
             else:
@@ -2760,18 +2696,10 @@ class MainWindow(QMainWindow):
             offset_x = self.dxgi_offset_x_input.value()
             offset_y = self.dxgi_offset_y_input.value()
             
-            # 獲取屏幕分辨率
-            screen_width = self.config_manager.get("screen_width", 1920)
-            screen_height = self.config_manager.get("screen_height", 1080)
+            # 獲取屏幕分辨率（配置中沒有時使用快取的主螢幕解析度）
+            screen_width, screen_height = self.config_manager.get_many(SCREEN_SIZE_KEYS, 0).values()
             if screen_width <= 0 or screen_height <= 0:
-                try:
-                    import ctypes
-                    user32 = ctypes.windll.user32
-                    screen_width = user32.GetSystemMetrics(0)
-                    screen_height = user32.GetSystemMetrics(1)
-                except:
-                    screen_width = 1920
-                    screen_height = 1080
+                screen_width, screen_height = _primary_screen_size()
             
             # 計算擷取區域
             capture_width = max(1, range_x) if range_x > 0 else screen_width
@@ -2785,101 +2713,42 @@ class MainWindow(QMainWindow):
             
             self.debug_window.set_capture_region((left, top, right, bottom))
     
-    def on_dxgi_fps_changed(self):
-        """DXGI FPS 改變時的處理"""
-        # 更新配置
-        self.config_manager.set("dxgi_target_fps", self.dxgi_fps_input.value())
-        
-        # 如果 DXGI 正在運行，重新啟動以應用新設置
-        if self.dxgi_capture and self.dxgi_capture.running:
-            self.log("重新啟動 DXGI 以應用新的 FPS 設置...")
-            if self.dxgi_capture.restart():
-                self.log("✓ DXGI 已重新啟動")
-            else:
-                self.log("✗ DXGI 重新啟動失敗", error=True)
-    
-    def _update_local_ip_display(self):
-        """更新本機IP顯示"""
-        try:
-            local_ips = self._get_local_ips()
-            if local_ips:
-                ip_text = "\n".join(local_ips)
-                self.local_ip_label.setText(ip_text)
-            else:
-                self.local_ip_label.setText("無法獲取")
-        except Exception as e:
-            logger.error(f"獲取本機IP失敗: {e}")
-            self.local_ip_label.setText("獲取失敗")
-    
-    def _get_local_ips(self) -> list:
+    def _update_local_ip_display(self, label: QLabel = None, refresh: bool = False):
         """
-        獲取本機所有IP地址
+        更新本機IP顯示（顯示快取結果，快取過期時在後台重新探測）
         
-        Returns:
-            IP地址列表
+        Args:
+            label: 要更新的標籤（默認為 UDP 面板的本機 IP 標籤）
+            refresh: 是否強制重新探測本機 IP
         """
-        ips = []
-        try:
-            # 獲取主機名
-            hostname = socket.gethostname()
-            
-            # 獲取主機名對應的IP
-            try:
-                host_ip = socket.gethostbyname(hostname)
-                if host_ip and host_ip != "127.0.0.1":
-                    ips.append(f"{hostname}: {host_ip}")
-            except:
-                pass
-            
-            # 獲取所有網絡接口的IP
-            import platform
-            if platform.system() == "Windows":
-                # Windows 系統
-                try:
-                    import subprocess
-                    result = subprocess.run(['ipconfig'], capture_output=True, text=True, encoding='gbk', errors='ignore')
-                    lines = result.stdout.split('\n')
-                    for line in lines:
-                        if 'IPv4' in line or 'IP Address' in line:
-                            parts = line.split(':')
-                            if len(parts) > 1:
-                                ip = parts[-1].strip()
-                                if ip and ip != "127.0.0.1" and not ip.startswith("169.254"):
-                                    if ip not in [i.split(': ')[-1] if ': ' in i else i for i in ips]:
-                                        ips.append(ip)
-                except:
-                    pass
-            
-            # 使用 socket 獲取所有接口
-            try:
-                # 連接到外部地址以獲取本機IP
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                try:
-                    # 連接到一個不存在的地址，不會實際發送數據
-                    s.connect(('8.8.8.8', 80))
-                    local_ip = s.getsockname()[0]
-                    if local_ip and local_ip not in ips:
-                        ips.insert(0, local_ip)
-                except:
-                    pass
-                finally:
-                    s.close()
-            except:
-                pass
-            
-            # 如果沒有找到，至少顯示 localhost
-            if not ips:
-                ips.append("127.0.0.1 (localhost)")
-            
-        except Exception as e:
-            logger.error(f"獲取本機IP時出錯: {e}")
-            ips = ["無法獲取"]
-        
-        return ips[:5]  # 最多顯示5個IP
+        if label is None:
+            label = self.local_ip_label
+        if self._cached_local_ips is None:
+            label.setText("正在獲取...")
+        else:
+            label.setText("\n".join(self._cached_local_ips) or "無法獲取")
+        if refresh or time.monotonic() - self._local_ips_time >= LOCAL_IPS_TTL:
+            self._start_local_ip_probe()
+    
+    def _start_local_ip_probe(self):
+        """啟動後台本機 IP 探測（上一次探測尚未完成時不重複啟動）"""
+        if self._local_ip_probe is None:
+            self._local_ip_probe = LocalIpProbe(self)
+            self._local_ip_probe.ips_found.connect(self._on_local_ips_found)
+        if not self._local_ip_probe.isRunning():
+            self._local_ip_probe.start()
+    
+    def _on_local_ips_found(self, ips: list):
+        """本機 IP 探測完成（主線程），更新快取和各網路串流面板"""
+        self._cached_local_ips = ips
+        self._local_ips_time = time.monotonic()
+        ip_text = "\n".join(ips) or "無法獲取"
+        for attr in _LOCAL_IP_LABELS.values():
+            getattr(self, attr).setText(ip_text)
     
     def _update_connection_info(self):
         """更新連接信息顯示"""
-        mode_data = self.capture_mode_combo.currentData() if hasattr(self, 'capture_mode_combo') else None
+        mode_data = self.capture_mode_combo.currentData()
         
         # UDP 連接信息
         if mode_data == "udp" and self.udp_receiver and self.udp_receiver.is_connected and self.udp_receiver.socket:
@@ -2893,14 +2762,14 @@ class MainWindow(QMainWindow):
                 if bound_ip == "0.0.0.0":
                     info_text += " (監聽所有接口)"
                 self.connection_info_label.setText(info_text)
-                self.connection_info_label.setStyleSheet("color: #00E5FF; font-size: 9pt;")
+                self._set_label_state(self.connection_info_label, "connected")
             except Exception as e:
                 logger.error(f"獲取 UDP 連接信息失敗: {e}")
                 self.connection_info_label.setText(t("get_connection_info_failed", "獲取失敗"))
-                self.connection_info_label.setStyleSheet("color: #FF5555; font-size: 9pt;")
+                self._set_label_state(self.connection_info_label, "error")
         elif mode_data == "udp":
             self.connection_info_label.setText(t("not_connected", "未連接"))
-            self.connection_info_label.setStyleSheet("color: #888888; font-size: 9pt;")
+            self._set_label_state(self.connection_info_label, "")
         # TCP 連接信息
         elif mode_data == "tcp" and self.tcp_receiver and self.tcp_receiver.is_connected and self.tcp_receiver.socket:
             try:
@@ -2919,14 +2788,14 @@ class MainWindow(QMainWindow):
                 else:
                     info_text = f"{self.tcp_receiver.ip}:{self.tcp_receiver.port}"
                 self.tcp_connection_info_label.setText(info_text)
-                self.tcp_connection_info_label.setStyleSheet("color: #00E5FF; font-size: 9pt;")
+                self._set_label_state(self.tcp_connection_info_label, "connected")
             except Exception as e:
                 logger.error(f"獲取 TCP 連接信息失敗: {e}")
                 self.tcp_connection_info_label.setText(t("get_connection_info_failed", "獲取失敗"))
-                self.tcp_connection_info_label.setStyleSheet("color: #FF5555; font-size: 9pt;")
+                self._set_label_state(self.tcp_connection_info_label, "error")
         elif mode_data == "tcp":
             self.tcp_connection_info_label.setText(t("not_connected", "未連接"))
-            self.tcp_connection_info_label.setStyleSheet("color: #888888; font-size: 9pt;")
+            self._set_label_state(self.tcp_connection_info_label, "")
         # SRT 連接信息
         elif mode_data == "srt" and self.srt_receiver and self.srt_receiver.is_connected and self.srt_receiver.socket:
             try:
@@ -2945,20 +2814,29 @@ class MainWindow(QMainWindow):
                 else:
                     info_text = f"{self.srt_receiver.ip}:{self.srt_receiver.port}"
                 self.srt_connection_info_label.setText(info_text)
-                self.srt_connection_info_label.setStyleSheet("color: #00E5FF; font-size: 9pt;")
+                self._set_label_state(self.srt_connection_info_label, "connected")
             except Exception as e:
                 logger.error(f"獲取 SRT 連接信息失敗: {e}")
                 self.srt_connection_info_label.setText(t("get_connection_info_failed", "獲取失敗"))
-                self.srt_connection_info_label.setStyleSheet("color: #FF5555; font-size: 9pt;")
+                self._set_label_state(self.srt_connection_info_label, "error")
         elif mode_data == "srt":
             self.srt_connection_info_label.setText(t("not_connected", "未連接"))
-            self.srt_connection_info_label.setStyleSheet("color: #888888; font-size: 9pt;")
+            self._set_label_state(self.srt_connection_info_label, "")
         else:
             self.connection_info_label.setText(t("not_connected", "未連接"))
-            self.connection_info_label.setStyleSheet("color: #888888; font-size: 9pt;")
+            self._set_label_state(self.connection_info_label, "")
             self.current_connection_ip = None
             self.current_connection_port = None
     
+    def _set_label_state(self, label: QLabel, state: str):
+        """設置標籤的 state 屬性，由樣式表決定對應的顏色"""
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        # 屬性改變後需要重新套用樣式
+        label.style().unpolish(label)
+        label.style().polish(label)
+    
     def _update_color_preview(self, color_type: str):
         """
         更新顏色預覽框
@@ -2966,27 +2844,19 @@ class MainWindow(QMainWindow):
         Args:
             color_type: 'from', 'to', 'target'
         """
-        if color_type == 'from':
-            r = self.color_from_r.value()
-            g = self.color_from_g.value()
-            b = self.color_from_b.value()
-            preview = self.color_from_preview
-        elif color_type == 'to':
-            r = self.color_to_r.value()
-            g = self.color_to_g.value()
-            b = self.color_to_b.value()
-            preview = self.color_to_preview
-        elif color_type == 'target':
-            r = self.target_color_r.value()
-            g = self.target_color_g.value()
-            b = self.target_color_b.value()
-            preview = self.target_color_preview
-        else:
+        row = self._color_rows.get(color_type)
+        if row is None:
             return
+        (r_spin, g_spin, b_spin), preview = row
+        
+        # 顏色未改變時跳過 setStyleSheet，避免重新解析樣式表
+        r, g, b = rgb = (r_spin.value(), g_spin.value(), b_spin.value())
+        if self._color_preview_rgb.get(color_type) == rgb:
+            return
+        self._color_preview_rgb[color_type] = rgb
         
         # 創建顏色樣式（注意：Qt 使用 RGB，而 OpenCV 使用 BGR）
-        style = f"background-color: rgb({r}, {g}, {b}); border: 2px solid #555; border-radius: 4px;"
-        preview.setStyleSheet(style)
+        preview.setStyleSheet(_color_preview_style(r, g, b))
     
     def _start_color_picker(self, color_type: str):
         """
@@ -3051,21 +2921,21 @@ class MainWindow(QMainWindow):
         target_type = self.color_picker_target
         name = ""
         
-        # 更新對應的 RGB 輸入框
+        # 更新對應的 RGB 輸入框（不逐個觸發預覽，最後統一更新一次）
         if self.color_picker_target == 'from':
-            self.color_from_r.setValue(int(r))
-            self.color_from_g.setValue(int(g))
-            self.color_from_b.setValue(int(b))
+            self._set_value_silently(self.color_from_r, int(r))
+            self._set_value_silently(self.color_from_g, int(g))
+            self._set_value_silently(self.color_from_b, int(b))
             name = "起始顏色"
         elif self.color_picker_target == 'to':
-            self.color_to_r.setValue(int(r))
-            self.color_to_g.setValue(int(g))
-            self.color_to_b.setValue(int(b))
+            self._set_value_silently(self.color_to_r, int(r))
+            self._set_value_silently(self.color_to_g, int(g))
+            self._set_value_silently(self.color_to_b, int(b))
             name = "目標顏色"
         else:
-            self.target_color_r.setValue(int(r))
-            self.target_color_g.setValue(int(g))
-            self.target_color_b.setValue(int(b))
+            self._set_value_silently(self.target_color_r, int(r))
+            self._set_value_silently(self.target_color_g, int(g))
+            self._set_value_silently(self.target_color_b, int(b))
             name = "目標顏色"
         
         # 關閉顏色選擇模式
@@ -3096,38 +2966,23 @@ class MainWindow(QMainWindow):
         if frame is None:
             return
         
-        # 使用線程安全的計數器（使用原子操作）
-        # 創建專用的計數器鎖（如果不存在）
-        if not hasattr(self, '_frame_count_lock'):
-            self._frame_count_lock = threading.Lock()
-        with self._frame_count_lock:
-            self.frame_count += 1
+        # 無鎖計數（每幀不再獲取鎖）
+        self.frame_counter.increment()
         
-        # 將幀放入處理隊列（如果隊列滿了，丟棄最舊的幀，保持低延遲）
-        # 使用 frame.copy() 確保線程安全
+        # 將幀放入處理槽（未處理的舊幀會被覆蓋，保持低延遲）
+        # 只把檢測所需的中心區域複製到可重用緩衝（切片為視圖，複製確保線程安全），避免整幀複製
         try:
-            if self.frame_processing_queue.full():
-                try:
-                    self.frame_processing_queue.get_nowait()  # 丟棄最舊的幀
-                except Empty:
-                    pass
-            # 只在隊列中存儲時複製，避免不必要的內存操作
-            self.frame_processing_queue.put_nowait((frame.copy(), time.time()))
+            detection_region = self.color_detector.get_detection_region(frame)
+            buffer = self._take_region_buffer(detection_region)
+            np.copyto(buffer, detection_region)
+            replaced = self.frame_processing_queue.put((buffer, time.time()))
+            if replaced is not None:
+                self._region_buffers.append(replaced[0])
         except Exception as e:
             logger.debug(f"Frame queue error: {e}")
         
-        # 更新顯示用幀（用於調試窗口和 UI 顯示）
-        # 優化：只在需要時複製，減少內存開銷
-        # 使用非阻塞方式更新，避免阻塞擷取線程
-        try:
-            with self.frame_lock:
-                # 只在調試窗口開啟時才複製，否則直接引用（減少內存複製）
-                if self.debug_window and self.debug_window.is_running:
-                    self.current_display_frame = frame.copy()
-                else:
-                    self.current_display_frame = frame
-        except:
-            pass  # 如果鎖被佔用，跳過更新，不阻塞擷取線程
+        # 更新顯示用幀引用（UI 只檢查是否有幀；調試窗口自行接收幀）
+        self.current_display_frame = frame
         
         # 優化：如果調試窗口開啟，直接更新每一幀（不降低頻率）
         if self.debug_window and self.debug_window.is_running:
@@ -3137,6 +2992,23 @@ class MainWindow(QMainWindow):
             except:
                 pass  # 如果更新失敗，不阻塞擷取線程
     
+    def _take_region_buffer(self, region: np.ndarray) -> np.ndarray:
+        """取出一個與檢測區域同尺寸的可重用緩衝（尺寸不符的舊緩衝直接丟棄，沒有時新分配）"""
+        buffers = self._region_buffers
+        while buffers:
+            buffer = buffers.pop()
+            if buffer.shape == region.shape and buffer.dtype == region.dtype:
+                return buffer
+        return np.empty(region.shape, dtype=region.dtype)
+    
+    def _start_capture_loop(self, capture_loop, name: str):
+        """在最高優先級的 QThread 中運行擷取循環（循環結束後線程自動釋放）"""
+        thread = CaptureLoopThread(capture_loop, name, self)
+        self._capture_threads.add(thread)
+        thread.finished.connect(lambda: self._capture_threads.discard(thread))
+        thread.finished.connect(thread.deleteLater)
+        thread.start(QThread.HighestPriority)
+    
     def _start_capture_card_thread(self):
         """啟動 Capture Card 幀獲取線程"""
         def capture_loop():
@@ -3146,7 +3018,7 @@ class MainWindow(QMainWindow):
                     if frame is not None and frame.size > 0:
                         # Capture Card 返回的是 BGR 格式，直接使用
                         self._process_frame(frame)
-                    time.sleep(1.0 / self.capture_fps_input.value() if self.capture_fps_input.value() > 0 else 0.01)
+                    # get_latest_frame() 會阻塞等待抓取線程的新幀，不需要額外延遲
                 except Exception as e:
                     log_exception(e, context="Capture Card 擷取線程", additional_info={
                         "線程": "CaptureCardThread",
@@ -3155,8 +3027,7 @@ class MainWindow(QMainWindow):
                     logger.error(f"Capture Card error: {e}")
                     time.sleep(0.01)
         
-        thread = threading.Thread(target=capture_loop, daemon=True, name="CaptureCardThread")
-        thread.start()
+        self._start_capture_loop(capture_loop, "CaptureCardThread")
     
     def _start_bettercam_thread(self):
         """啟動 BetterCam 幀獲取線程"""
@@ -3170,10 +3041,9 @@ class MainWindow(QMainWindow):
                         # BetterCam 模組已經返回 BGR 格式
                         # 只在第一次或調試窗口開啟時更新區域信息（減少開銷）
                         if not debug_region_set and self.debug_window and self.bettercam_camera:
-                            if hasattr(self.debug_window, 'set_capture_region'):
-                                h, w = frame.shape[:2]
-                                self.debug_window.set_capture_region((0, 0, w, h))
-                                debug_region_set = True
+                            h, w = frame.shape[:2]
+                            self.debug_window.set_capture_region((0, 0, w, h))
+                            debug_region_set = True
                         self._process_frame(frame)
                     # 不添加延遲，讓 BetterCam 以最快速度獲取幀
                     # BetterCam 的 get_latest_frame() 會阻塞等待新幀，所以不需要額外延遲
@@ -3185,8 +3055,7 @@ class MainWindow(QMainWindow):
                     logger.error(f"BetterCam error: {e}")
                     time.sleep(0.01)  # 只在錯誤時稍作延遲
         
-        thread = threading.Thread(target=capture_loop, daemon=True, name="BetterCamThread")
-        thread.start()
+        self._start_capture_loop(capture_loop, "BetterCamThread")
     
     def _start_mss_thread(self):
         """啟動 MSS 幀獲取線程"""
@@ -3207,8 +3076,7 @@ class MainWindow(QMainWindow):
                     logger.error(f"MSS error: {e}")
                     time.sleep(0.01)  # 只在錯誤時稍作延遲
         
-        thread = threading.Thread(target=capture_loop, daemon=True, name="MSSThread")
-        thread.start()
+        self._start_capture_loop(capture_loop, "MSSThread")
     
     def _start_dxgi_thread(self):
         """啟動 DXGI 幀獲取線程"""
@@ -3222,10 +3090,9 @@ class MainWindow(QMainWindow):
                         # DXGI 模組已經返回 BGR 格式
                         # 只在第一次或調試窗口開啟時更新區域信息（減少開銷）
                         if not debug_region_set and self.debug_window and self.dxgi_capture:
-                            if hasattr(self.debug_window, 'set_capture_region'):
-                                h, w = frame.shape[:2]
-                                self.debug_window.set_capture_region((0, 0, w, h))
-                                debug_region_set = True
+                            h, w = frame.shape[:2]
+                            self.debug_window.set_capture_region((0, 0, w, h))
+                            debug_region_set = True
                         self._process_frame(frame)
                     # 不添加延遲，讓 DXGI 以最快速度獲取幀
                     # DXGI 的 get_latest_frame() 會阻塞等待新幀，所以不需要額外延遲
@@ -3237,14 +3104,15 @@ class MainWindow(QMainWindow):
                     logger.error(f"DXGI error: {e}")
                     time.sleep(0.01)  # 只在錯誤時稍作延遲
         
-        thread = threading.Thread(target=capture_loop, daemon=True, name="DXGIThread")
-        thread.start()
+        self._start_capture_loop(capture_loop, "DXGIThread")
     
     def _start_ndi_thread(self):
         """啟動 NDI 幀獲取線程"""
         def capture_loop():
             # 只在第一次設置調試窗口區域
             debug_region_set = False
+            # NDI 幀同步讀取不阻塞，按單調時鐘的固定截止時間輪詢（處理耗時不會累積成漂移）
+            next_deadline = time.perf_counter()
             while self.ndi_capture and self.ndi_capture.is_connected():
                 try:
                     frame = self.ndi_capture.get_latest_frame()
@@ -3252,13 +3120,17 @@ class MainWindow(QMainWindow):
                         # NDI 模組已經返回 BGR 格式
                         # 只在第一次或調試窗口開啟時更新區域信息（減少開銷）
                         if not debug_region_set and self.debug_window and self.ndi_capture:
-                            if hasattr(self.debug_window, 'set_capture_region'):
-                                h, w = frame.shape[:2]
-                                self.debug_window.set_capture_region((0, 0, w, h))
-                                debug_region_set = True
+                            h, w = frame.shape[:2]
+                            self.debug_window.set_capture_region((0, 0, w, h))
+                            debug_region_set = True
                         self._process_frame(frame)
-                    # 添加小延遲以避免過度佔用 CPU
-                    time.sleep(0.001)  # 1ms 延遲
+                    next_deadline += NDI_POLL_INTERVAL
+                    sleep_for = next_deadline - time.perf_counter()
+                    if sleep_for > 0:
+                        time.sleep(sleep_for)
+                    else:
+                        # 已落後時從當前時間重新計時，避免連續無間隔輪詢追趕
+                        next_deadline = time.perf_counter()
                 except Exception as e:
                     log_exception(e, context="NDI 擷取線程", additional_info={
                         "線程": "NDIThread",
@@ -3267,8 +3139,14 @@ class MainWindow(QMainWindow):
                     logger.error(f"NDI error: {e}")
                     time.sleep(0.01)  # 只在錯誤時稍作延遲
         
-        thread = threading.Thread(target=capture_loop, daemon=True, name="NDIThread")
-        thread.start()
+        self._start_capture_loop(capture_loop, "NDIThread")
+    
+    def _ensure_ndi_sources(self):
+        """首次切換到 NDI 模式時才探測 NDI 源（不使用 NDI 的用戶無需承擔探測開銷）"""
+        if self._ndi_sources_loaded or not NDI_AVAILABLE:
+            return
+        self._ndi_sources_loaded = True
+        QTimer.singleShot(1000, self.refresh_ndi_sources)  # 延遲 1 秒後刷新，讓 NDI 有時間初始化
     
     def refresh_ndi_sources(self):
         """刷新 NDI 源列表"""
@@ -3276,158 +3154,136 @@ class MainWindow(QMainWindow):
             self.log(t("ndi_not_installed_msg", "✗ NDI 未安裝，請先安裝: pip install cyndilib"), error=True)
             return
         
-        try:
-            # 如果已經有 NDI 接收器，使用它來獲取源列表
-            if self.ndi_capture and self.ndi_capture.receiver:
-                sources = self.ndi_capture.list_sources()
-            else:
-                # 創建臨時接收器來獲取源列表
-                from capture.obs_ndi import NDI_Receiver
-                temp_receiver = NDI_Receiver()
-                sources = temp_receiver.list_sources(refresh=True)
-                temp_receiver.disconnect()
-            
-            # 更新下拉框
-            self.ndi_source_combo.clear()
-            if sources:
-                for source in sources:
-                    self.ndi_source_combo.addItem(source)
-                self.log(t("ndi_sources_refreshed", "✓ 已刷新 NDI 源列表，找到 {count} 個源").format(count=len(sources)))
-            else:
-                self.log(t("ndi_no_sources", "未找到可用的 NDI 源，請確保 NDI 源正在運行"), error=True)
-        except Exception as e:
-            self.log(t("ndi_refresh_failed", "✗ 刷新 NDI 源列表失敗: {error}").format(error=str(e)), error=True)
+        # 如果已經有 NDI 接收器，直接使用它的源列表
+        if self.ndi_capture and self.ndi_capture.receiver:
+            self._on_ndi_sources_found(self.ndi_capture.list_sources())
+            return
+        
+        # 上一次探測尚未完成時不重複啟動
+        if self._ndi_scanner is not None and self._ndi_scanner.isRunning():
+            return
+        
+        ndi_module = _load_backend("ndi")
+        if ndi_module is None:
+            self.log(t("ndi_not_installed_msg", "✗ NDI 未安裝，請先安裝: pip install cyndilib"), error=True)
+            return
+        
+        # 在後台線程探測，結果通過信號（隊列連接）回到主線程更新下拉框
+        self._ndi_scanner = NDISourceScanner(ndi_module, self)
+        self._ndi_scanner.sources_found.connect(self._on_ndi_sources_found)
+        self._ndi_scanner.scan_failed.connect(self._on_ndi_scan_failed)
+        self._ndi_scanner.start()
+    
+    def _on_ndi_sources_found(self, sources: list):
+        """NDI 源探測完成（主線程）"""
+        # 更新下拉框
+        self.ndi_source_combo.clear()
+        if sources:
+            self.ndi_source_combo.addItems(sources)
+            self.log(t("ndi_sources_refreshed", "✓ 已刷新 NDI 源列表，找到 {count} 個源").format(count=len(sources)))
+        else:
+            self.log(t("ndi_no_sources", "未找到可用的 NDI 源，請確保 NDI 源正在運行"), error=True)
+    
+    def _on_ndi_scan_failed(self, error: str):
+        """NDI 源探測失敗（主線程）"""
+        self.log(t("ndi_refresh_failed", "✗ 刷新 NDI 源列表失敗: {error}").format(error=error), error=True)
     
     def _frame_processor_loop(self):
         """
-        異步幀處理循環（多線程並行處理）
-        從隊列獲取幀，提交到檢測線程池進行並行處理
-        多個線程並行處理，提升高 FPS 下的處理能力
+        幀處理循環（單一線程）
+        從隊列阻塞獲取幀，直接執行顏色檢測並處理觸發
         """
-        thread_name = threading.current_thread().name
-        
         # 優化：提高線程優先級以確保及時調度（Windows）
         try:
             import win32api
             import win32process
             import win32con
             handle = win32api.GetCurrentThread()
-            win32process.SetThreadPriority(handle, win32process.THREAD_PRIORITY_ABOVE_NORMAL)
-            logger.info(f"Frame processor loop started with ABOVE_NORMAL priority: {thread_name}")
+            win32process.SetThreadPriority(handle, win32process.THREAD_PRIORITY_HIGHEST)
+            logger.info("Frame processor loop started with HIGHEST priority")
         except Exception as e:
-            logger.info(f"Frame processor loop started: {thread_name} (could not set priority: {e})")
+            logger.info(f"Frame processor loop started (could not set priority: {e})")
         
         while True:
             try:
-                # 從隊列獲取幀（非阻塞，快速獲取）
-                try:
-                    frame, receive_time = self.frame_processing_queue.get(timeout=0.01)
-                except Empty:
-                    continue
+                # 阻塞等待最新幀
+                frame, receive_time = self.frame_processing_queue.get()
                 
                 # 如果檢測未啟動，跳過處理
                 if not self.is_running:
+                    self._region_buffers.append(frame)
+                    continue
+                
+                result = self._detect_frame(frame, receive_time)
+                # 檢測結果不引用幀數據，歸還緩衝供擷取線程重用
+                self._region_buffers.append(frame)
+                if result is None:
                     continue
                 
-                # 提交到檢測線程池進行異步處理
-                # 不等待結果，立即處理下一個幀
-                self.detection_executor.submit(self._detect_frame_async, frame, receive_time)
+                # 發布最新結果；只在顯示狀態改變時通知 UI，避免高 FPS 時淹沒事件隊列
+                self.latest_detection_result = result
+                result_key = (result['mode'], result['state'], result['color_present'])
+                if result_key != self._last_emitted_detection_key:
+                    self._last_emitted_detection_key = result_key
+                    self.detection_bridge.result_ready.emit(result)
+                
+                if result['triggered']:
+                    self._handle_trigger(result)
                 
             except Exception as e:
-                log_exception(e, context=f"幀處理器錯誤 ({thread_name})", additional_info={
-                    "線程名稱": thread_name,
-                    "隊列大小": self.frame_processing_queue.qsize() if hasattr(self, 'frame_processing_queue') else "N/A"
+                log_exception(e, context="幀處理器錯誤", additional_info={
+                    "隊列大小": self.frame_processing_queue.qsize()
                 })
-                logger.error(f"Frame processor error ({thread_name}): {e}", exc_info=True)
+                logger.error(f"Frame processor error: {e}", exc_info=True)
                 time.sleep(0.001)  # 減少錯誤時的延遲
     
-    def _detect_frame_async(self, frame: np.ndarray, receive_time: float):
+    def _detect_frame(self, frame: np.ndarray, receive_time: float):
         """
-        異步顏色檢測（在線程池中執行）
+        顏色檢測（在幀處理線程中執行）
         
         Args:
             frame: 要檢測的幀
             receive_time: 接收時間戳
+        
+        Returns:
+            檢測結果字典，發生錯誤時返回 None
         """
         try:
-            with self.detection_lock:
-                # 執行顏色檢測
-                triggered, color_present = self.color_detector.detect(frame)
-                
-                # 獲取檢測狀態信息
-                detection_info = {
-                    'triggered': triggered,
-                    'color_present': color_present,
-                    'frame_time': receive_time,
-                    'mode': self.color_detector.mode,
-                    'state': self.color_detector.last_color_state if self.color_detector.mode == 1 else None
-                }
-                
-                # 將結果放入結果隊列
-                try:
-                    if self.detection_result_queue.full():
-                        try:
-                            self.detection_result_queue.get_nowait()  # 丟棄最舊的結果
-                        except Empty:
-                            pass
-                    self.detection_result_queue.put_nowait(detection_info)
-                except Exception as e:
-                    logger.debug(f"Result queue error: {e}")
-                    
+            # 執行顏色檢測
+            triggered, color_present = self.color_detector.detect(frame)
+            
+            # 獲取檢測狀態信息
+            return {
+                'triggered': triggered,
+                'color_present': color_present,
+                'frame_time': receive_time,
+                'mode': self.color_detector.mode,
+                'state': self.color_detector.last_color_state if self.color_detector.mode == 1 else None
+            }
         except Exception as e:
             log_exception(e, context="顏色檢測錯誤", additional_info={
-                "檢測模式": self.color_detector.mode if hasattr(self, 'color_detector') and self.color_detector else "N/A"
+                "檢測模式": self.color_detector.mode
             })
             logger.error(f"Detection error: {e}", exc_info=True)
+            return None
     
-    def _result_processor_loop(self):
-        """
-        異步結果處理循環
-        從結果隊列獲取檢測結果，觸發點擊等操作
-        """
-        # 優化：提高線程優先級以確保及時調度（Windows）
-        try:
-            import win32api
-            import win32process
-            import win32con
-            handle = win32api.GetCurrentThread()
-            win32process.SetThreadPriority(handle, win32process.THREAD_PRIORITY_HIGHEST)
-            logger.info("Result processor loop started with HIGHEST priority")
-        except Exception as e:
-            logger.info(f"Result processor loop started (could not set priority: {e})")
+    def _handle_trigger(self, result: dict):
+        """處理觸發結果，發送點擊"""
+        if not self.click_controller.can_trigger():
+            return
         
-        while True:
-            try:
-                # 從隊列獲取檢測結果（優化：減少 timeout 提高響應速度）
-                try:
-                    result = self.detection_result_queue.get(timeout=0.0001)  # 0.1ms
-                except Empty:
-                    continue
-                
-                # 處理檢測結果
-                if result['triggered']:
-                    # 觸發點擊（異步執行）
-                    if self.click_controller.can_trigger():
-                        message = ""
-                        if result['mode'] == 1:
-                            message = "顏色變化: 紅色 -> 綠色"
-                        else:
-                            message = f"檢測到目標顏色"
-                        
-                        # 優化：使用同步執行減少線程切換延遲
-                        if self.click_controller.execute_click(self.mouse, blocking=True):
-                            # 使用 QTimer 在主線程中更新 UI（線程安全）
-                            QTimer.singleShot(0, lambda: self.log(f"✓ {message}"))
-                        else:
-                            if not mouse_module.is_connected:
-                                QTimer.singleShot(0, lambda: self.log("滑鼠未連接，無法發送點擊", error=True))
-                
-            except Exception as e:
-                log_exception(e, context="結果處理器錯誤", additional_info={
-                    "結果隊列大小": self.detection_result_queue.qsize() if hasattr(self, 'detection_result_queue') else "N/A"
-                })
-                logger.error(f"Result processor error: {e}", exc_info=True)
-                time.sleep(0.01)
+        if result['mode'] == 1:
+            message = "顏色變化: 紅色 -> 綠色"
+        else:
+            message = f"檢測到目標顏色"
+        
+        # 優化：使用同步執行減少線程切換延遲
+        if self.click_controller.execute_click(self.mouse, blocking=True):
+            # 使用 QTimer 在主線程中更新 UI（線程安全）
+            QTimer.singleShot(0, lambda: self.log(f"✓ {message}"))
+        else:
+            if not mouse_module.is_connected:
+                QTimer.singleShot(0, lambda: self.log("滑鼠未連接，無法發送點擊", error=True))
     
     def test_move(self):
         """測試滑鼠移動"""
@@ -3518,6 +3374,10 @@ class MainWindow(QMainWindow):
                 self.color_detector.set_target_color(r, g, b)
                 self.log(f"啟動模式 2: 檢測 RGB({r},{g},{b})")
             
+            # 清除上一輪的檢測結果
+            self.latest_detection_result = None
+            self._last_emitted_detection_key = None
+            
             # 應用所有設置
             tolerance = self.tolerance_input.value()
             detection_size = self.detection_size_input.value()
@@ -3562,28 +3422,84 @@ class MainWindow(QMainWindow):
     def on_color_detected(self, message: str):
         """
         顏色檢測觸發（已棄用，保留用於兼容性）
-        現在檢測結果通過 _result_processor_loop 處理
+        現在檢測結果通過 _frame_processor_loop 處理
         """
-        # 這個方法現在主要用於信號連接，實際處理在結果處理線程中
+        # 這個方法現在主要用於信號連接，實際處理在幀處理線程中
         pass
     
+    def on_detection_result(self, result: dict):
+        """檢測顯示狀態改變時更新狀態標籤（主線程）"""
+        if not self.is_running:
+            return
+        
+        base_style = "padding: 20px; border-radius: 5px; color: #000; font-weight: bold;"
+        
+        if result['mode'] == 1:
+            state = result.get('state')
+            if state == "from":
+                _set_text_if_changed(self.detection_status_label, "檢測到起始顏色")
+                _set_style_if_changed(self.detection_status_label,
+                    base_style + "background-color: #ff5555; color: white;")
+                if self.debug_window:
+                    self.debug_window.set_detection_state("from")
+            elif state == "to":
+                _set_text_if_changed(self.detection_status_label, "檢測到目標顏色")
+                _set_style_if_changed(self.detection_status_label,
+                    base_style + "background-color: #55ff55; color: black;")
+                if self.debug_window:
+                    self.debug_window.set_detection_state("to")
+            else:
+                _set_text_if_changed(self.detection_status_label, "等待顏色變化...")
+                _set_style_if_changed(self.detection_status_label,
+                    "padding: 20px; background-color: #2D2D2D; border: 1px solid #444; border-radius: 5px; color: #888;")
+                if self.debug_window:
+                    self.debug_window.set_detection_state(None)
+        else:  # 模式 2
+            if result.get('color_present', False):
+                _set_text_if_changed(self.detection_status_label, t("target_color_present", "目標顏色存在"))
+                _set_style_if_changed(self.detection_status_label,
+                    base_style + "background-color: #ffff55; color: black;")
+                if self.debug_window:
+                    self.debug_window.set_detection_state("detected")
+            else:
+                _set_text_if_changed(self.detection_status_label, t("waiting_for_target_color", "等待目標顏色..."))
+                _set_style_if_changed(self.detection_status_label,
+                    "padding: 20px; background-color: #2D2D2D; border: 1px solid #444; border-radius: 5px; color: #888;")
+                if self.debug_window:
+                    self.debug_window.set_detection_state(None)
+    
+    def _adjust_update_interval(self):
+        """根據擷取 FPS 調整 UI 更新間隔（8~33 ms），未擷取時降低到 10 Hz"""
+        if self.capture_fps > 0:
+            interval = max(8, min(33, int(1000 / max(self.capture_fps, 30))))
+        else:
+            interval = 100
+        if self.update_timer.interval() != interval:
+            self.update_timer.setInterval(interval)
+    
     def update_display(self):
         """更新顯示（主線程）"""
+        # 窗口最小化或隱藏時沒有可見內容，跳過整個 UI 更新
+        if not self.isVisible() or self.isMinimized():
+            return
+        
         # 計算 UI FPS
         self.ui_update_count += 1
-        ui_elapsed = time.time() - self.ui_update_start_time
-        if ui_elapsed >= 1.0:  # 每秒更新一次
-            self.ui_fps = self.ui_update_count / ui_elapsed
+        now_ns = time.perf_counter_ns()
+        ui_elapsed_ns = now_ns - self.ui_update_start_ns
+        if ui_elapsed_ns >= 1_000_000_000:  # 每秒更新一次
+            self.ui_fps = self.ui_update_count * 1_000_000_000 / ui_elapsed_ns
             self.ui_update_count = 0
-            self.ui_update_start_time = time.time()
+            self.ui_update_start_ns = now_ns
+            self._adjust_update_interval()
         
         # 更新滑鼠狀態
         if mouse_module.is_connected:
-            self.mouse_status_label.setText(t("connected_status", "已連接"))
-            self.mouse_status_label.setStyleSheet("color: green; font-weight: bold;")
+            _set_text_if_changed(self.mouse_status_label, t("connected_status", "已連接"))
+            _set_style_if_changed(self.mouse_status_label, "color: green; font-weight: bold;")
         else:
-            self.mouse_status_label.setText(t("not_connected", "未連接"))
-            self.mouse_status_label.setStyleSheet("color: red; font-weight: bold;")
+            _set_text_if_changed(self.mouse_status_label, t("not_connected", "未連接"))
+            _set_style_if_changed(self.mouse_status_label, "color: red; font-weight: bold;")
         
         # 檢查調試窗口是否被用戶關閉
         if self.debug_window and not self.debug_window.is_window_open():
@@ -3592,101 +3508,45 @@ class MainWindow(QMainWindow):
         
         # 更新畫面和統計
         mode_data = self.capture_mode_combo.currentData()
-        is_connected = False
-        
-        if mode_data == "udp":
-            is_connected = self.udp_receiver is not None and self.udp_receiver.is_connected
-        elif mode_data == "capture_card":
-            is_connected = self.capture_card_camera is not None and self.capture_card_camera.cap is not None and self.capture_card_camera.cap.isOpened()
-        elif mode_data and mode_data.startswith("bettercam"):
-            is_connected = self.bettercam_camera is not None and self.bettercam_camera.running
-        elif mode_data == "mss":
-            is_connected = self.mss_capture is not None and self.mss_capture.running
-        elif mode_data == "dxgi":
-            is_connected = self.dxgi_capture is not None and self.dxgi_capture.running
+        is_connected = mode_data in _DISPLAY_MODES and _CONN_CHECKERS[mode_data](self)
         
         if is_connected:
-            # 從線程安全的顯示幀獲取（用於調試窗口）
-            with self.frame_lock:
-                display_frame = self.current_display_frame
-            
-            # 獲取最新的檢測結果（非阻塞，只取最新的）
-            latest_result = None
-            while True:
-                try:
-                    latest_result = self.detection_result_queue.get_nowait()
-                except Empty:
-                    break  # 獲取最新的結果後退出
+            display_frame = self.current_display_frame
             
             if display_frame is not None:
-                # 更新檢測狀態顯示（基於異步檢測結果）
-                if self.is_running and latest_result:
-                    base_style = "padding: 20px; border-radius: 5px; color: #000; font-weight: bold;"
-                    
-                    if latest_result['mode'] == 1:
-                        state = latest_result.get('state')
-                        if state == "from":
-                            self.detection_status_label.setText("檢測到起始顏色")
-                            self.detection_status_label.setStyleSheet(
-                                base_style + "background-color: #ff5555; color: white;")
-                            if self.debug_window:
-                                self.debug_window.set_detection_state("from")
-                        elif state == "to":
-                            self.detection_status_label.setText("檢測到目標顏色")
-                            self.detection_status_label.setStyleSheet(
-                                base_style + "background-color: #55ff55; color: black;")
-                            if self.debug_window:
-                                self.debug_window.set_detection_state("to")
-                        else:
-                            self.detection_status_label.setText("等待顏色變化...")
-                            self.detection_status_label.setStyleSheet(
-                                "padding: 20px; background-color: #2D2D2D; border: 1px solid #444; border-radius: 5px; color: #888;")
-                            if self.debug_window:
-                                self.debug_window.set_detection_state(None)
-                    else:  # 模式 2
-                        if latest_result.get('color_present', False):
-                            self.detection_status_label.setText(t("target_color_present", "目標顏色存在"))
-                            self.detection_status_label.setStyleSheet(
-                                base_style + "background-color: #ffff55; color: black;")
-                            if self.debug_window:
-                                self.debug_window.set_detection_state("detected")
-                        else:
-                            self.detection_status_label.setText(t("waiting_for_target_color", "等待目標顏色..."))
-                            self.detection_status_label.setStyleSheet(
-                                "padding: 20px; background-color: #2D2D2D; border: 1px solid #444; border-radius: 5px; color: #888;")
-                            if self.debug_window:
-                                self.debug_window.set_detection_state(None)
-                    
+                # 檢測狀態由 on_detection_result 更新，這裡只更新冷卻倒數
+                if self.is_running and self.latest_detection_result is not None:
                     # 更新冷卻倒數
                     cooldown_remaining = self.click_controller.get_cooldown_remaining()
                     if cooldown_remaining > 0:
-                        self.cooldown_label.setText(t("cooldown_remaining", "冷卻中: {seconds:.2f}秒").format(seconds=cooldown_remaining))
+                        _set_text_if_changed(self.cooldown_label, t("cooldown_remaining", "冷卻中: {seconds:.2f}秒").format(seconds=cooldown_remaining))
                     else:
-                        self.cooldown_label.setText("")
+                        _set_text_if_changed(self.cooldown_label, "")
                 elif self.is_running:
                     # 檢測運行中但還沒有結果
-                    self.detection_status_label.setText(t("detecting", "檢測中..."))
-                    self.detection_status_label.setStyleSheet(
+                    _set_text_if_changed(self.detection_status_label, t("detecting", "檢測中..."))
+                    _set_style_if_changed(self.detection_status_label,
                         "padding: 20px; background-color: #2D2D2D; border: 1px solid #444; border-radius: 5px; color: #888;")
                 else:
-                    self.detection_status_label.setText("未啟動")
-                    self.detection_status_label.setStyleSheet(
+                    _set_text_if_changed(self.detection_status_label, "未啟動")
+                    _set_style_if_changed(self.detection_status_label,
                         "padding: 20px; background-color: #1E1E1E; border: 1px dashed #444; border-radius: 5px; color: #666;")
-                    self.cooldown_label.setText("")
+                    _set_text_if_changed(self.cooldown_label, "")
                     if self.debug_window:
                         self.debug_window.set_detection_state(None)
                 
-                # 更新調試窗口設置
-                if self.debug_window:
+                # 更新調試窗口設置（僅在調試窗口運行時）
+                if self.debug_window and self.debug_window.is_running:
                     self.debug_window.set_detection_size(self.color_detector.detection_size)
                 
                 # 記錄幀時間
-                self.last_frame_time = time.time()
+                self.last_frame_ns = now_ns
             else:
                 # 檢查是否長時間沒有收到幀
-                if time.time() - self.last_frame_time > 3.0:
+                if now_ns - self.last_frame_ns > 3_000_000_000:
                     mode_text = self.capture_mode_combo.currentText()
-                    self.stats_label.setText(t("waiting_for_frame_data", "等待畫面數據...") + "\n" + t("confirm_capture_providing", "請確認 {mode} 正在提供畫面").format(mode=mode_text))
+                    texts = self._texts
+                    _set_text_if_changed(self.stats_label, texts.waiting_for_frame_data + "\n" + texts.confirm_capture_providing.format(mode=mode_text))
             
             # 更新統計信息
             try:
@@ -3724,35 +3584,30 @@ class MainWindow(QMainWindow):
                                 f"{t('buffer', '緩衝')}: {stats.get('buffer_size_bytes', 0)}{t('bytes', ' bytes')} | "
                                 f"{t('queue', '隊列')}: {stats.get('queue_size', 0)} | "
                                 f"{t('delay', '延遲')}: {stats.get('receive_delay_ms', 0):.1f}ms | {queue_info}")
-                elif mode_data in ["capture_card", "bettercam", "mss", "dxgi"]:
+                elif mode_data in _FRAME_COUNTER_MODES:
                     # 其他模式的簡單統計
                     queue_info = f"{t('detection_queue', '檢測隊列')}: {self.frame_processing_queue.qsize()}/{self.frame_processing_queue.maxsize}"
-                    elapsed = time.time() - self.frame_count_start_time
+                    # 單調時鐘的整數納秒，不受系統時間調整影響
+                    elapsed_ns = now_ns - self.frame_count_start_ns
+                    elapsed = elapsed_ns / 1_000_000_000
                     # 確保 elapsed 至少為 0.1 秒以避免除零錯誤和初始值問題
                     current_count = 0
                     fps = 0.0
-                    if elapsed < 0.1:
+                    if elapsed_ns < 100_000_000:
                         fps = 0.0
                     else:
-                        # 使用線程安全的方式讀取 frame_count
-                        if hasattr(self, '_frame_count_lock'):
-                            with self._frame_count_lock:
-                                current_count = self.frame_count
-                        else:
-                            current_count = self.frame_count
+                        current_count = self.frame_counter.value()
                         # 計算 FPS，確保不為負數
-                        fps = float(current_count) / elapsed if elapsed > 0 else 0.0
+                        fps = current_count * 1_000_000_000 / elapsed_ns
                         # 如果 frame_count 為 0 但已經過了較長時間，可能是沒有收到幀
-                        if current_count == 0 and elapsed > 1.0:
+                        if current_count == 0 and elapsed_ns > 1_000_000_000:
                             fps = 0.0
                     # 更新擷取 FPS（強制更新，確保值正確）
                     self.capture_fps = max(0.0, fps)
                     # 調試：每 5 秒記錄一次 FPS（僅在開發時使用）
-                    if not hasattr(self, '_last_fps_log_time'):
-                        self._last_fps_log_time = time.time()
-                    if time.time() - self._last_fps_log_time > 5.0:
+                    if now_ns - self._last_fps_log_ns > 5_000_000_000:
                         logger.debug(f"FPS 計算: frame_count={current_count}, elapsed={elapsed:.2f}s, fps={fps:.1f}, capture_fps={self.capture_fps:.1f}")
-                        self._last_fps_log_time = time.time()
+                        self._last_fps_log_ns = now_ns
                     # 構建統計文本，總是顯示 FPS
                     mode_name = self.capture_mode_combo.currentText()
                     stats_text = f"{t('capture_fps', '擷取 FPS')}: {fps:.1f} | {t('capture_mode', '擷取模式')}: {mode_name} | {queue_info}"
@@ -3768,78 +3623,78 @@ class MainWindow(QMainWindow):
                     mode_name = self.capture_mode_combo.currentText()
                     stats_text = f"{t('capture_mode', '擷取模式')}: {mode_name} | {queue_info}"
                 
-                self.stats_label.setText(stats_text)
+                _set_text_if_changed(self.stats_label, stats_text)
             except Exception as e:
                 logger.error(f"Failed to get stats: {e}")
         else:
             # 未連接時，設置 capture_fps 為 0
             self.capture_fps = 0.0
         
-        # 更新頂部 FPS 顯示（無論是否連接都更新，強制刷新）
-        if hasattr(self, 'fps_label'):
-            try:
-                # 確保值為浮點數且非負
-                ui_fps_val = max(0.0, float(self.ui_fps)) if hasattr(self, 'ui_fps') else 0.0
-                capture_fps_val = max(0.0, float(self.capture_fps)) if hasattr(self, 'capture_fps') else 0.0
-                fps_text = t("ui_fps_display", "UI FPS: {ui_fps:.1f} | 擷取FPS: {capture_fps:.1f}").format(
-                    ui_fps=ui_fps_val,
-                    capture_fps=capture_fps_val
-                )
-                self.fps_label.setText(fps_text)
-            except Exception as e:
-                logger.debug(f"FPS label update error: {e}")
-                # 即使出錯也嘗試更新
-                try:
-                    self.fps_label.setText(f"UI FPS: {self.ui_fps:.1f} | 擷取FPS: {self.capture_fps:.1f}")
-                except:
-                    pass
+        # 更新頂部 FPS 顯示（無論是否連接都更新，文字未變時跳過）
+        try:
+            # 確保值為浮點數且非負
+            fps_text = t("ui_fps_display", "UI FPS: {ui_fps:.1f} | 擷取FPS: {capture_fps:.1f}").format(
+                ui_fps=max(0.0, float(self.ui_fps)),
+                capture_fps=max(0.0, float(self.capture_fps))
+            )
+        except Exception as e:
+            logger.debug(f"FPS label update error: {e}")
+            # 翻譯格式有誤時使用默認格式
+            fps_text = f"UI FPS: {self.ui_fps:.1f} | 擷取FPS: {self.capture_fps:.1f}"
+        _set_text_if_changed(self.fps_label, fps_text)
     
     def log(self, message: str, error: bool = False):
-        """添加日誌"""
+        """添加日誌（先放入緩衝，約 33 毫秒內合併寫入日誌框）"""
         timestamp = time.strftime("%H:%M:%S")
         color = "#ff5555" if error else "#00E5FF" # 使用適合暗黑模式的顏色 (紅/青)
-        log_entry = f'<span style="color: {color};">[{timestamp}] {message}</span>'
-        self.log_text.append(log_entry)
+        self._log_queue.append(f'<span style="color: {color};">[{timestamp}] {message}</span>')
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log(self):
+        """把緩衝中的日誌一次寫入日誌框，並只滾動一次"""
+        if not self._log_queue:
+            return
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            while self._log_queue:
+                self.log_text.appendHtml(self._log_queue.popleft())
+        finally:
+            self.log_text.setUpdatesEnabled(True)
         
         # 自動滾動到底部
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
+    def changeEvent(self, event):
+        """窗口重新獲得焦點時檢查配置檔案是否被外部修改"""
+        super().changeEvent(event)
+        if event.type() == QEvent.ActivationChange and self.isActiveWindow():
+            self._reload_config_if_changed()
+    
     def closeEvent(self, event):
         """關閉窗口時清理資源"""
-        # 自動保存配置
+        # 自動保存配置（會一併寫入尚未刷新的修改）
         self.save_current_config()
         
         if self.is_running:
             self.toggle_detection()
         
+        # 等待進行中的 NDI 源探測結束，避免線程在運行時被銷毀
+        if self._ndi_scanner is not None:
+            self._ndi_scanner.wait(2000)
+        if self._local_ip_probe is not None:
+            self._local_ip_probe.wait(2000)
+        
         # 關閉調試窗口
         if self.debug_window:
             DebugWindowManager.destroy_window()
             self.debug_window = None
         
-        # 斷開所有連接
-        if self.udp_receiver:
-            self.udp_receiver.disconnect()
-        if self.capture_card_camera:
-            self.capture_card_camera.stop()
-        if self.bettercam_camera:
-            try:
-                self.bettercam_camera.stop()
-            except Exception as e:
-                log_exception(e, context="關閉窗口時停止 BetterCam", additional_info={
-                    "階段": "closeEvent"
-                })
-                logger.error(f"關閉 BetterCam 時出錯: {e}")
-            finally:
-                self.bettercam_camera = None
-        if self.mss_capture:
-            self.mss_capture.stop()
-            self.mss_capture = None
-        
-        # 關閉線程池
-        if hasattr(self, 'detection_executor') and self.detection_executor:
-            self.detection_executor.shutdown(wait=False, cancel_futures=True)
+        # 斷開所有連接（擷取源停止後，擷取循環線程會自行退出）
+        self._stop_all_capture_modes()
+        for thread in list(self._capture_threads):
+            thread.wait(1000)
         
         if self.mouse:
             Mouse.cleanup()
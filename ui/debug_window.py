@@ -13,6 +13,22 @@ from typing import Optional, Callable
 
 logger = logging.getLogger(__name__)
 
+# 信息項目位元（info_mask 中每個項目佔一位）
+INFO_FPS = 1 << 0
+INFO_RESOLUTION = 1 << 1
+INFO_DETECTION_SIZE = 1 << 2
+INFO_STATE = 1 << 3
+INFO_HOTKEYS = 1 << 4
+INFO_ALL = INFO_FPS | INFO_RESOLUTION | INFO_DETECTION_SIZE | INFO_STATE | INFO_HOTKEYS
+
+INFO_ITEM_BITS = {
+    'fps': INFO_FPS,
+    'resolution': INFO_RESOLUTION,
+    'detection_size': INFO_DETECTION_SIZE,
+    'state': INFO_STATE,
+    'hotkeys': INFO_HOTKEYS,
+}
+
 
 class DebugWindow:
     """
@@ -43,6 +59,7 @@ class DebugWindow:
         self.current_frame_size = None  # (width, height)
         self.window_resized = False
         self.always_on_top = False  # 窗口置頂
+        self.use_opengl = True  # 優先使用 OpenGL 窗口（不支持時自動退回）
         
         # 顯示設置
         self.show_info = True  # 顯示信息疊加層
@@ -51,14 +68,8 @@ class DebugWindow:
         self.capture_region = None  # 擷取區域 (left, top, right, bottom)，用於顯示邊界
         self.target_size = None  # 目標窗口大小 (width, height)，用於自動調整窗口大小
         
-        # 信息顯示開關（獨立控制每個項目）
-        self.info_items = {
-            'fps': True,
-            'resolution': True,
-            'detection_size': True,
-            'state': True,
-            'hotkeys': True
-        }
+        # 信息顯示開關（每個項目一個位元，繪製時只需一次整數 AND）
+        self.info_mask = INFO_ALL
         
         # 顏色檢測視覺化
         self.color_detector_callback: Optional[Callable] = None
@@ -68,6 +79,12 @@ class DebugWindow:
         # 顏色選擇器
         self.color_picker_callback: Optional[Callable] = None
         
+        # 預先分配的顯示緩衝區（幀尺寸改變時才重新分配）
+        self._display_buffer: Optional[np.ndarray] = None
+        # 窗口顯示區域大小（每秒更新一次）與當前縮放比例（顯示座標 = 原始座標 * scale）
+        self._window_image_size: Optional[tuple] = None
+        self._display_scale = 1.0
+        
         logger.info(f"DebugWindow initialized: {window_name}")
     
     def start(self):
@@ -156,6 +173,9 @@ class DebugWindow:
         Args:
             size: (width, height) 目標窗口大小
         """
+        # 大小未變時不重複調整窗口（resizeWindow 會觸發重新佈局）
+        if size == self.target_size:
+            return
         self.target_size = size
         # 如果窗口已創建，立即調整大小
         if self.window_created and self.target_size:
@@ -197,8 +217,22 @@ class DebugWindow:
             item: 項目名稱 ('fps', 'resolution', 'detection_size', 'state', 'hotkeys')
             visible: 是否顯示
         """
-        if item in self.info_items:
-            self.info_items[item] = visible
+        bit = INFO_ITEM_BITS.get(item)
+        if bit is None:
+            return
+        if visible:
+            self.info_mask |= bit
+        else:
+            self.info_mask &= ~bit
+    
+    def set_info_mask(self, mask: int):
+        """
+        一次設置所有信息項目的可見性
+        
+        Args:
+            mask: INFO_* 位元組合
+        """
+        self.info_mask = mask & INFO_ALL
     
     def set_color_picker_callback(self, callback: Optional[Callable]):
         """
@@ -245,6 +279,11 @@ class DebugWindow:
                         except:
                             pass
                 
+                # 顯示畫面可能已縮小，將點擊座標映射回原始幀
+                if self._display_scale < 1.0:
+                    x = int(x / self._display_scale)
+                    y = int(y / self._display_scale)
+                
                 if frame is not None and 0 <= y < frame.shape[0] and 0 <= x < frame.shape[1]:
                     # 獲取點擊位置的顏色（BGR 格式）
                     bgr_color = tuple(frame[y, x].tolist())
@@ -254,13 +293,26 @@ class DebugWindow:
             except Exception as e:
                 logger.error(f"Error in mouse callback: {e}")
     
+    def _create_window(self):
+        """創建顯示窗口，優先使用 OpenGL 後端（由 GPU 紋理上傳與縮放）"""
+        if self.use_opengl:
+            try:
+                cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL | cv2.WINDOW_OPENGL)
+                logger.info("Debug window using OpenGL backend")
+                return
+            except cv2.error as e:
+                # OpenCV 未編譯 OpenGL 支持時退回一般窗口
+                self.use_opengl = False
+                logger.info(f"OpenGL window not available, falling back to raster window: {e}")
+        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+    
     def _display_loop(self):
         """顯示循環（獨立線程）"""
         logger.info("Debug window display loop started")
         
             # 創建窗口（初始大小，會根據第一幀或目標大小調整）
         try:
-            cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+            self._create_window()
             # 如果有目標大小，使用目標大小；否則使用預設大小
             if self.target_size:
                 w, h = self.target_size
@@ -360,7 +412,25 @@ class DebugWindow:
         Returns:
             處理後的幀
         """
-        display_frame = frame.copy()
+        src_h, src_w = frame.shape[:2]
+        scale = self._get_display_scale(src_w, src_h)
+        if scale < 1.0:
+            display_shape = (max(1, int(src_h * scale)), max(1, int(src_w * scale))) + frame.shape[2:]
+        else:
+            display_shape = frame.shape
+        
+        # 重用顯示緩衝區，避免每幀分配新記憶體（imshow 會自行複製數據）
+        if (self._display_buffer is None or self._display_buffer.shape != display_shape
+                or self._display_buffer.dtype != frame.dtype):
+            self._display_buffer = np.empty(display_shape, dtype=frame.dtype)
+        display_frame = self._display_buffer
+        if scale < 1.0:
+            # 窗口小於原始畫面時先用 INTER_AREA 縮小，減少後續繪製與顯示的數據量
+            cv2.resize(frame, (display_shape[1], display_shape[0]), dst=display_frame,
+                       interpolation=cv2.INTER_AREA)
+        else:
+            np.copyto(display_frame, frame)
+        self._display_scale = scale
         h, w = display_frame.shape[:2]
         center_y, center_x = h // 2, w // 2
         
@@ -375,7 +445,7 @@ class DebugWindow:
         
         # 繪製檢測區域
         if self.show_crosshair:
-            size = self.detection_size
+            size = max(1, int(round(self.detection_size * scale)))
             
             # 根據檢測狀態選擇顏色
             if self.detection_state == "from":
@@ -413,30 +483,53 @@ class DebugWindow:
         
         # 添加信息疊加層
         if self.show_info:
-            self._draw_info_overlay(display_frame)
+            self._draw_info_overlay(display_frame, (src_w, src_h))
         
         return display_frame
     
-    def _draw_info_overlay(self, frame: np.ndarray):
+    def _get_display_scale(self, src_w: int, src_h: int) -> float:
+        """根據窗口顯示區域計算縮放比例（不放大）"""
+        if not self._window_image_size:
+            return 1.0
+        win_w, win_h = self._window_image_size
+        if win_w <= 0 or win_h <= 0:
+            return 1.0
+        return min(1.0, win_w / src_w, win_h / src_h)
+    
+    def _update_window_image_size(self):
+        """更新窗口顯示區域大小（僅在顯示線程中調用）"""
+        get_rect = getattr(cv2, "getWindowImageRect", None)
+        if get_rect is None:
+            return
+        try:
+            _, _, win_w, win_h = get_rect(self.window_name)
+            self._window_image_size = (win_w, win_h)
+        except Exception:
+            self._window_image_size = None
+    
+    def _draw_info_overlay(self, frame: np.ndarray, source_size: Optional[tuple] = None):
         """
         繪製信息疊加層
         
         Args:
             frame: 要繪製的幀（會被修改）
+            source_size: 原始幀大小 (width, height)，用於顯示解析度
         """
         h, w = frame.shape[:2]
+        src_w, src_h = source_size if source_size else (w, h)
+        
+        info_mask = self.info_mask
         
-        # 計算需要顯示的項目數量
-        visible_items = sum(1 for key in ['fps', 'resolution', 'detection_size', 'state'] 
-                           if self.info_items.get(key, True))
+        # 計算需要顯示的項目數量（快捷鍵提示在底部，不佔背景高度）
+        visible_items = bin(info_mask & (INFO_ALL & ~INFO_HOTKEYS)).count('1')
         
         # 動態調整背景高度
         bg_height = 20 + (visible_items * 25) + 10
         
-        # 半透明背景
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (10, 10), (350, bg_height), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
+        # 半透明背景（黑色 60% 疊加等同於將背景區域亮度乘以 0.4，只處理該區域）
+        background = frame[10:bg_height + 1, 10:351]
+        if background.size > 0:
+            background[:] = cv2.convertScaleAbs(background, alpha=0.4)
         
         # 文字信息
         font = cv2.FONT_HERSHEY_SIMPLEX
@@ -448,25 +541,25 @@ class DebugWindow:
         line_height = 25
         
         # FPS
-        if self.info_items.get('fps', True):
+        if info_mask & INFO_FPS:
             cv2.putText(frame, f"Display FPS: {self.display_fps:.1f}", 
                        (20, y_offset), font, font_scale, color, thickness)
             y_offset += line_height
         
         # 解析度
-        if self.info_items.get('resolution', True):
-            cv2.putText(frame, f"Resolution: {w}x{h}", 
+        if info_mask & INFO_RESOLUTION:
+            cv2.putText(frame, f"Resolution: {src_w}x{src_h}", 
                        (20, y_offset), font, font_scale, color, thickness)
             y_offset += line_height
         
         # 檢測區域
-        if self.info_items.get('detection_size', True):
+        if info_mask & INFO_DETECTION_SIZE:
             cv2.putText(frame, f"Detection Size: {self.detection_size}px", 
                        (20, y_offset), font, font_scale, color, thickness)
             y_offset += line_height
         
         # 檢測狀態
-        if self.info_items.get('state', True):
+        if info_mask & INFO_STATE:
             if self.detection_state:
                 state_text = f"State: {self.detection_state.upper()}"
                 state_color = (0, 255, 0) if self.detection_state in ["to", "detected"] else (0, 165, 255)
@@ -478,7 +571,7 @@ class DebugWindow:
             y_offset += line_height
         
         # 快捷鍵提示
-        if self.info_items.get('hotkeys', True):
+        if info_mask & INFO_HOTKEYS:
             cv2.putText(frame, "Press: 'I'-Info | 'C'-Crosshair | 'F'-Fullscreen | 'ESC'-Close", 
                        (20, h - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
     
@@ -564,6 +657,8 @@ class DebugWindow:
             self.display_fps = self.fps_counter / (current_time - self.last_fps_update)
             self.fps_counter = 0
             self.last_fps_update = current_time
+            # 窗口大小變化不頻繁，隨 FPS 統計每秒檢查一次
+            self._update_window_image_size()
     
     def is_window_open(self) -> bool:
         """檢查窗口是否仍然打開"""
@@ -6,6 +6,7 @@
 import json
 import os
 import logging
+import functools
 from typing import Dict, Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,8 @@ class LanguageManager:
         self.current_lang = DEFAULT_LANG
         self.translations: Dict[str, str] = {}
         self.available_languages: List[Tuple[str, str]] = []  # [(lang_code, lang_name), ...]
+        # 翻譯結果緩存（切換語言時清空）
+        self._cached_get = functools.lru_cache(maxsize=1024)(self._lookup)
         
         # 確保語言目錄存在
         if not os.path.exists(self.lang_dir):
@@ -102,6 +105,7 @@ class LanguageManager:
                         self.translations[key] = value
                 
                 self.current_lang = lang_code
+                self._cached_get.cache_clear()
                 logger.info(f"成功載入語言: {lang_code} ({lang_data.get('_language_name', lang_code)})")
                 return True
                 
@@ -123,6 +127,10 @@ class LanguageManager:
         Returns:
             str: 翻譯後的文本
         """
+        return self._cached_get(key, default)
+    
+    def _lookup(self, key: str, default: Optional[str]) -> str:
+        """在當前語言表中查找翻譯（未緩存）"""
         return self.translations.get(key, default if default is not None else key)
     
     def get_language_name(self, lang_code: str) -> str:
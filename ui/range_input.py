@@ -0,0 +1,168 @@
+"""
+範圍輸入控件模組
+提供帶滑條的最小 / 最大值輸入控件、輕量整數輸入框，以及建立數值輸入框的共用函數
+"""
+
+from functools import partial
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QSlider, QLineEdit
+from PyQt5.QtCore import Qt, pyqtSignal, QSignalBlocker
+from PyQt5.QtGui import QIntValidator
+from ui.language_manager import t
+
+
+def make_spin_box(value_range, keyboard_tracking=False) -> QSpinBox:
+    """
+    創建 QSpinBox（默認關閉鍵盤追蹤，按 Enter 或失焦時才發出 valueChanged）
+
+    Args:
+        value_range: (最小值, 最大值)
+        keyboard_tracking: 是否在每次按鍵時都發出 valueChanged
+    """
+    spin = QSpinBox()
+    spin.setRange(*value_range)
+    spin.setKeyboardTracking(keyboard_tracking)
+    return spin
+
+
+def set_value_silently(widget, value: int):
+    """設置數值但不發出 valueChanged（用於同步成對控件，避免信號來回反彈）"""
+    blocker = QSignalBlocker(widget)
+    widget.setValue(value)
+    blocker.unblock()
+
+
+class IntEdit(QLineEdit):
+    """
+    整數輸入框（QLineEdit + QIntValidator）
+
+    提供與 QSpinBox 相同的 value() / setValue() / valueChanged 介面，
+    但沒有上下按鈕的重複計時器，只在按 Enter 或失焦時解析一次
+    """
+    valueChanged = pyqtSignal(int)
+
+    def __init__(self, minimum: int, maximum: int, parent=None):
+        super().__init__(parent)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._value = minimum
+        self.setValidator(QIntValidator(minimum, maximum, self))
+        self.setText(str(minimum))
+        self.editingFinished.connect(self._on_editing_finished)
+
+    def value(self) -> int:
+        """返回當前數值"""
+        return self._value
+
+    def setValue(self, value: int):
+        """設置數值（超出範圍時截斷），數值改變時發出 valueChanged"""
+        value = max(self._minimum, min(int(value), self._maximum))
+        text = str(value)
+        if self.text() != text:
+            self.setText(text)
+        if value != self._value:
+            self._value = value
+            self.valueChanged.emit(value)
+
+    def _on_editing_finished(self):
+        self.setValue(int(self.text()))
+
+    def focusOutEvent(self, event):
+        # 輸入未完成（例如清空）時失焦，恢復為當前數值
+        if not self.hasAcceptableInput():
+            self.setText(str(self._value))
+        super().focusOutEvent(event)
+
+
+class RangeInput(QWidget):
+    """
+    帶有滑條的範圍輸入控件
+
+    輸入框可超過滑條上限；最小值和最大值互相約束，每次改變只發出一次 valueChanged(min, max)
+    """
+    valueChanged = pyqtSignal(int, int)
+
+    SLIDER_MAX = 500
+
+    def __init__(self, name: str, default_min: int, default_max: int, parent=None):
+        """
+        初始化範圍輸入控件
+
+        Args:
+            name: 控件名稱（用於提示）
+            default_min: 默認最小值
+            default_max: 默認最大值
+        """
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+
+        self.min_input, self.min_slider = self._add_row(
+            layout, t("min", "最小"), default_min,
+            f"{name}的最小值（可超過500）", f"{name}最小值滑條（0~500）")
+        self.max_input, self.max_slider = self._add_row(
+            layout, t("max", "最大"), default_max,
+            f"{name}的最大值（可超過500）", f"{name}最大值滑條（0~500）")
+
+        # 輸入框和滑條共用同一個同步入口
+        for widget, is_min in ((self.min_input, True), (self.min_slider, True),
+                               (self.max_input, False), (self.max_slider, False)):
+            widget.valueChanged.connect(partial(self._sync, is_min))
+
+    def _add_row(self, layout, label_text: str, default: int, input_tip: str, slider_tip: str):
+        """創建一行「標籤 + 輸入框 + 滑條」"""
+        row = QHBoxLayout()
+        row.setSpacing(8)
+
+        label = QLabel(label_text + ":")
+        label.setMinimumWidth(40)
+        edit = IntEdit(0, 99999)  # 輸入可以超過500
+        edit.setMaximumWidth(80)
+        edit.setValue(default)
+        edit.setToolTip(input_tip)
+        suffix = QLabel(t("ms", " ms").strip())
+
+        slider = QSlider(Qt.Horizontal)
+        slider.setRange(0, self.SLIDER_MAX)
+        slider.setValue(min(default, self.SLIDER_MAX))
+        slider.setToolTip(slider_tip)
+        # 拖動期間只更新輸入框顯示，放開滑條時才發出 valueChanged
+        slider.setTracking(False)
+        slider.sliderMoved.connect(lambda value: set_value_silently(edit, value))
+
+        row.addWidget(label)
+        row.addWidget(edit)
+        row.addWidget(suffix)
+        row.addWidget(slider)
+        row.addStretch()
+        layout.addLayout(row)
+        return edit, slider
+
+    def values(self):
+        """返回 (最小值, 最大值)"""
+        return self.min_input.value(), self.max_input.value()
+
+    def _sync(self, is_min: bool, value: int):
+        """
+        同步一端的輸入框和滑條，並約束另一端（最小值不超過最大值），最後發出一次 valueChanged
+
+        Args:
+            is_min: 改變的是否為最小值一端
+            value: 新數值（來自輸入框或滑條）
+        """
+        if is_min:
+            own_input, own_slider = self.min_input, self.min_slider
+            other_input, other_slider = self.max_input, self.max_slider
+            conflict = value > other_input.value()
+        else:
+            own_input, own_slider = self.max_input, self.max_slider
+            other_input, other_slider = self.min_input, self.min_slider
+            conflict = value < other_input.value()
+        # 同步時阻擋信號，滑條只顯示 0~500 範圍
+        set_value_silently(own_input, value)
+        set_value_silently(own_slider, min(value, self.SLIDER_MAX))
+        if conflict:
+            set_value_silently(other_input, value)
+            set_value_silently(other_slider, min(value, self.SLIDER_MAX))
+        self.valueChanged.emit(*self.values())
@@ -3,6 +3,7 @@
 負責檢測畫面中心顏色並判斷是否觸發
 """
 
+import cv2
 import numpy as np
 import logging
 from typing import Optional, Tuple
@@ -10,6 +11,43 @@ from PyQt5.QtCore import QObject, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
+# 可選：numba JIT 加速區域平均與範圍比較（未安裝時使用 cv2.mean + NumPy）
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 顏色範圍表的列索引
+RANGE_FROM = 0
+RANGE_TO = 1
+RANGE_TARGET = 2
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _region_mean_match(region, lows, highs, sample, matches):
+        """單次遍歷計算區域平均色（截斷為整數），並與所有顏色範圍比較"""
+        h, w = region.shape[0], region.shape[1]
+        count = h * w
+        sum_b = 0
+        sum_g = 0
+        sum_r = 0
+        for y in range(h):
+            for x in range(w):
+                sum_b += region[y, x, 0]
+                sum_g += region[y, x, 1]
+                sum_r += region[y, x, 2]
+        sample[0] = sum_b // count
+        sample[1] = sum_g // count
+        sample[2] = sum_r // count
+        for i in range(lows.shape[0]):
+            matches[i] = (lows[i, 0] <= sample[0] <= highs[i, 0] and
+                          lows[i, 1] <= sample[1] <= highs[i, 1] and
+                          lows[i, 2] <= sample[2] <= highs[i, 2])
+else:
+    _region_mean_match = None
+
 
 class ColorDetector(QObject):
     """顏色檢測器"""
@@ -33,31 +71,123 @@ class ColorDetector(QObject):
         
         # 檢測區域 (畫面中心的像素數)
         self.detection_size = 10
+        
+        # 顏色範圍表（SoA）：每列為一個顏色的 BGR 下界 / 上界，顏色或容差改變時就地更新
+        self._range_lows = np.zeros((3, 3), dtype=np.int16)
+        self._range_highs = np.zeros((3, 3), dtype=np.int16)
+        self._range_sample = np.zeros(3, dtype=np.int16)  # 重用的平均色緩衝區
+        self._range_matches = np.zeros(3, dtype=np.bool_)
+        self._update_bounds()
+        
+        # 平均色測量與模式判斷在設置時選定，檢測熱路徑不再分支
+        self._measure = self._measure_jit if _region_mean_match is not None else self._measure_cv2
+        self._detect_impl = self._make_detect_impl(self.mode)
+        
+        # 預先編譯 JIT 函數，避免第一幀檢測時的編譯延遲
+        if _region_mean_match is not None:
+            warmup = np.zeros((4, 4, 3), dtype=np.uint8)
+            for region in (warmup, warmup[1:3, 1:3]):  # 連續與切片視圖兩種佈局
+                _region_mean_match(region, self._range_lows, self._range_highs,
+                                   self._range_sample, self._range_matches)
+    
+    def _set_range(self, index: int, target_rgb):
+        """由 RGB 目標色與容差更新範圍表中的一列"""
+        r, g, b = (int(c) for c in target_rgb)
+        tolerance = int(self.tolerance)
+        self._range_lows[index] = (max(0, b - tolerance), max(0, g - tolerance), max(0, r - tolerance))
+        self._range_highs[index] = (min(255, b + tolerance), min(255, g + tolerance), min(255, r + tolerance))
+    
+    def _update_bounds(self):
+        """更新所有顏色的上下界"""
+        self._set_range(RANGE_FROM, self.color_from)
+        self._set_range(RANGE_TO, self.color_to)
+        self._set_range(RANGE_TARGET, self.target_color)
+    
+    def _match_ranges(self, bgr) -> np.ndarray:
+        """一次向量化比較平均色與所有顏色範圍，返回每列是否匹配"""
+        sample = self._range_sample
+        sample[:] = bgr
+        return ((self._range_lows <= sample) & (sample <= self._range_highs)).all(axis=1)
+    
+    def _measure_jit(self, region):
+        """JIT 路徑：平均與比較在一次遍歷中完成"""
+        _region_mean_match(region, self._range_lows, self._range_highs,
+                           self._range_sample, self._range_matches)
+        return self._range_sample, self._range_matches
+    
+    def _measure_cv2(self, region):
+        """cv2.mean 使用 SIMD 計算區域平均值，截斷為整數以對應 uint8 行為"""
+        mean_b, mean_g, mean_r = cv2.mean(region)[:3]
+        avg_color = (int(mean_b), int(mean_g), int(mean_r))
+        return avg_color, self._match_ranges(avg_color)
+    
+    def _make_detect_impl(self, mode: int):
+        """為指定模式生成專用的檢測函數"""
+        if mode == 1:
+            return self._detect_transition
+        if mode == 2:
+            return self._detect_target
+        return lambda region: (False, False)
+    
+    def _detect_transition(self, region) -> Tuple[bool, bool]:
+        """模式 1: 檢測顏色從紅色變為綠色"""
+        _, matches = self._measure(region)
+        is_from_color = bool(matches[RANGE_FROM])
+        is_to_color = bool(matches[RANGE_TO])
+        
+        current_state = None
+        if is_from_color:
+            current_state = "from"
+        elif is_to_color:
+            current_state = "to"
+        
+        # 檢測狀態變化
+        if self.last_color_state == "from" and current_state == "to":
+            self.last_color_state = current_state
+            self.color_changed.emit(f"顏色變化: 紅色 -> 綠色")
+            return True, is_to_color
+        
+        self.last_color_state = current_state
+        return False, is_to_color
+    
+    def _detect_target(self, region) -> Tuple[bool, bool]:
+        """模式 2: 檢測到特定顏色就觸發（支援冷卻後重複）"""
+        avg_color, matches = self._measure(region)
+        if matches[RANGE_TARGET]:
+            rgb = (int(avg_color[2]), int(avg_color[1]), int(avg_color[0]))
+            self.color_changed.emit(f"檢測到顏色: RGB{rgb}")
+            return True, True
+        return False, False
     
     def set_mode(self, mode: int):
         """設置檢測模式"""
         self.mode = mode
+        self._detect_impl = self._make_detect_impl(mode)
         self.last_color_state = None
         logger.info(f"Detection mode set to: {mode}")
     
     def set_color_from(self, r: int, g: int, b: int):
         """設置起始顏色 (RGB)"""
         self.color_from = np.array([r, g, b], dtype=np.uint8)
+        self._set_range(RANGE_FROM, self.color_from)
         logger.debug(f"Color from set to: RGB({r}, {g}, {b})")
     
     def set_color_to(self, r: int, g: int, b: int):
         """設置目標顏色 (RGB)"""
         self.color_to = np.array([r, g, b], dtype=np.uint8)
+        self._set_range(RANGE_TO, self.color_to)
         logger.debug(f"Color to set to: RGB({r}, {g}, {b})")
     
     def set_target_color(self, r: int, g: int, b: int):
         """設置模式2的目標顏色 (RGB)"""
         self.target_color = np.array([r, g, b], dtype=np.uint8)
+        self._set_range(RANGE_TARGET, self.target_color)
         logger.debug(f"Target color set to: RGB({r}, {g}, {b})")
     
     def set_tolerance(self, tolerance: int):
         """設置顏色容差"""
         self.tolerance = tolerance
+        self._update_bounds()
         logger.debug(f"Tolerance set to: {tolerance}")
     
     def color_matches(self, pixel_bgr, target_rgb, tolerance):
@@ -67,6 +197,22 @@ class ColorDetector(QObject):
         # 使用 numpy 的向量化運算，避免不必要的類型轉換
         return np.all(np.abs(pixel_rgb.astype(np.int16) - target_rgb.astype(np.int16)) <= tolerance)
     
+    def get_detection_region(self, frame: np.ndarray) -> np.ndarray:
+        """
+        獲取畫面中心的檢測區域（切片視圖，不複製數據）
+        
+        對返回的區域再次調用本方法會得到相同的區域，
+        因此可以先裁剪再傳給 detect()，減少跨線程複製的數據量
+        """
+        h, w = frame.shape[:2]
+        center_y, center_x = h // 2, w // 2
+        half_size = self.detection_size // 2
+        y1 = max(0, center_y - half_size)
+        y2 = min(h, center_y + half_size)
+        x1 = max(0, center_x - half_size)
+        x2 = min(w, center_x + half_size)
+        return frame[y1:y2, x1:x2]
+    
     def detect(self, frame: np.ndarray) -> Tuple[bool, bool]:
         """
         檢測畫面中心顏色
@@ -80,48 +226,12 @@ class ColorDetector(QObject):
         if frame is None or not self.enabled:
             return False, False
         
-        h, w = frame.shape[:2]
-        center_y, center_x = h // 2, w // 2
-        
         # 取得中心區域的平均顏色
-        half_size = self.detection_size // 2
-        y1 = max(0, center_y - half_size)
-        y2 = min(h, center_y + half_size)
-        x1 = max(0, center_x - half_size)
-        x2 = min(w, center_x + half_size)
-        
-        center_region = frame[y1:y2, x1:x2]
-        avg_color = np.mean(center_region, axis=(0, 1)).astype(np.uint8)
-        
-        if self.mode == 1:
-            # 模式 1: 檢測顏色從紅色變為綠色
-            is_from_color = self.color_matches(avg_color, self.color_from, self.tolerance)
-            is_to_color = self.color_matches(avg_color, self.color_to, self.tolerance)
-            
-            current_state = None
-            if is_from_color:
-                current_state = "from"
-            elif is_to_color:
-                current_state = "to"
-            
-            # 檢測狀態變化
-            if self.last_color_state == "from" and current_state == "to":
-                self.last_color_state = current_state
-                self.color_changed.emit(f"顏色變化: 紅色 -> 綠色")
-                return True, is_to_color
-            
-            self.last_color_state = current_state
-            return False, is_to_color
-            
-        elif self.mode == 2:
-            # 模式 2: 檢測到特定顏色就觸發（支援冷卻後重複）
-            if self.color_matches(avg_color, self.target_color, self.tolerance):
-                rgb = (avg_color[2], avg_color[1], avg_color[0])
-                self.color_changed.emit(f"檢測到顏色: RGB{rgb}")
-                return True, True
+        center_region = self.get_detection_region(frame)
+        if center_region.size == 0:
             return False, False
         
-        return False, False
+        return self._detect_impl(center_region)
     
     def reset(self):
         """重置檢測狀態"""
@@ -6,7 +6,9 @@
 import json
 import os
 import logging
-from typing import Dict, Any
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Tuple, Callable, List, Optional, Mapping
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,7 @@ DEFAULT_CONFIG = {
     "capture_fps": 240,
     "capture_device_index": 0,
     "capture_fourcc_preference": ["NV12", "YUY2", "MJPG"],
+    "capture_low_latency": True,  # 驅動幀緩衝設為 1
     "capture_range_x": 0,
     "capture_range_y": 0,
     "capture_offset_x": 0,
@@ -65,70 +68,219 @@ DEFAULT_CONFIG = {
     "trigger_cooldown_max": 100
 }
 
+# 範圍型延遲設置的前綴（對應 *_min / *_max 鍵）
+DELAY_RANGE_PREFIXES = ("press_delay", "release_delay", "trigger_cooldown")
+_DELAY_RANGE_KEYS = frozenset(
+    prefix + suffix for prefix in DELAY_RANGE_PREFIXES for suffix in ("_min", "_max")
+)
+
+
+def _fill_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
+    """補齊缺少的預設值（就地修改）"""
+    setdefault = config.setdefault
+    for key, value in DEFAULT_CONFIG.items():
+        setdefault(key, value)
+    return config
+
+
+def _migrate_legacy_delays(config: Dict[str, Any]):
+    """
+    將舊版單一延遲值展開為 *_min / *_max（僅在缺少範圍鍵時，就地修改）
+    
+    已有範圍鍵時以範圍鍵為準，不再用舊鍵擴大範圍：保存時舊鍵保留的是
+    早期寫入的值，若取 min / max 合併，用戶縮小範圍後會被舊值撐回去
+    """
+    for prefix in DELAY_RANGE_PREFIXES:
+        if prefix in config:
+            config.setdefault(prefix + "_min", config[prefix])
+            config.setdefault(prefix + "_max", config[prefix])
+
+
+def _compute_delay_ranges(config: Dict[str, Any]) -> Dict[str, Tuple[int, int]]:
+    """從配置計算各延遲範圍 (min, max)"""
+    delays = {}
+    for prefix in DELAY_RANGE_PREFIXES:
+        default = DEFAULT_CONFIG[prefix]
+        try:
+            lo = int(config.get(prefix + "_min", default))
+            hi = int(config.get(prefix + "_max", default))
+        except (TypeError, ValueError):
+            lo = hi = default
+        if lo > hi:
+            lo, hi = hi, lo
+        delays[prefix] = (lo, hi)
+    return delays
+
+
+def _coerce_delay_ranges(config: Dict[str, Any]):
+    """確保延遲範圍為整數且 min <= max（就地修改）"""
+    for prefix in DELAY_RANGE_PREFIXES:
+        min_key = prefix + "_min"
+        max_key = prefix + "_max"
+        try:
+            lo = int(config[min_key])
+            hi = int(config[max_key])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if lo > hi:
+            lo, hi = hi, lo
+        config[min_key] = lo
+        config[max_key] = hi
+
 
 class ConfigManager:
     """配置管理器"""
     
     def __init__(self, config_file: str = CONFIG_FILE):
         self.config_file = config_file
+        self.delays: Dict[str, Tuple[int, int]] = {}
+        self._mtime: Optional[float] = None
+        self._saved_payload: Optional[str] = None
+        self._snapshot: Optional[Mapping[str, Any]] = None
+        self._snapshot_dirty = True
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._reload_lock = threading.Lock()
+        self._write_lock = threading.Lock()
         self.config = self.load()
     
+    def _file_mtime(self) -> Optional[float]:
+        """獲取配置檔案修改時間（不存在時返回 None）"""
+        try:
+            return os.stat(self.config_file).st_mtime
+        except OSError:
+            return None
+    
     def load(self) -> Dict[str, Any]:
         """載入配置檔案"""
-        if os.path.exists(self.config_file):
+        self._mtime = self._file_mtime()
+        self._snapshot_dirty = True
+        if self._mtime is not None:
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
+                    # 向後兼容：舊版只有單一延遲值
+                    _migrate_legacy_delays(config)
                     # 合併預設值（處理新增的配置項）
                     merged_config = DEFAULT_CONFIG.copy()
                     merged_config.update(config)  # 用戶配置覆蓋預設值
+                    self.delays = _compute_delay_ranges(merged_config)
                     logger.info(f"Configuration loaded from {self.config_file}")
                     return merged_config
             except Exception as e:
                 logger.error(f"Failed to load config: {e}")
-                return DEFAULT_CONFIG.copy()
         else:
             logger.info("Config file not found, using default configuration")
-            return DEFAULT_CONFIG.copy()
+        self.delays = _compute_delay_ranges(DEFAULT_CONFIG)
+        return DEFAULT_CONFIG.copy()
     
     def save(self, config: Dict[str, Any] = None) -> bool:
         """保存配置檔案"""
         if config is not None:
-            # 合併傳入的配置和現有配置，避免丟失配置項
-            self.config.update(config)
-        
-        # 確保所有預設值都存在（處理新增的配置項）
-        for key, value in DEFAULT_CONFIG.items():
-            if key not in self.config:
-                self.config[key] = value
-        
+            # 合併傳入的配置和現有配置，避免丟失配置項（同時刷新延遲範圍表）
+            self.update(config)
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-            logger.info(f"Configuration saved to {self.config_file}")
-            return True
+            payload = self.serialize()
         except Exception as e:
-            logger.error(f"Failed to save config: {e}")
+            logger.error(f"Failed to serialize config: {e}")
             return False
+        if payload is None:
+            return True
+        return self.write_payload(payload)
+    
+    def serialize(self) -> Optional[str]:
+        """
+        補齊預設值並序列化當前配置（需在修改配置的線程調用）
+        
+        Returns:
+            JSON 文字；內容未變更且檔案未被外部修改時返回 None
+        
+        Raises:
+            序列化失敗時拋出 json.dumps 的異常（與「無需寫入」區分）
+        """
+        # 確保所有預設值都存在（處理新增的配置項），並校正延遲範圍
+        _fill_defaults(self.config)
+        _coerce_delay_ranges(self.config)
+        self._snapshot_dirty = True
+        
+        payload = json.dumps(self.config, indent=4, ensure_ascii=False)
+        # 內容未變更且檔案未被外部修改時跳過寫入
+        if payload == self._saved_payload and self._file_mtime() == self._mtime:
+            return None
+        return payload
+    
+    def write_payload(self, payload: str) -> bool:
+        """將 serialize() 的結果寫入檔案（可在背景線程調用，多次寫入依序進行）"""
+        with self._write_lock:
+            try:
+                # 先寫入暫存檔再原子替換，避免寫入中斷導致配置損壞
+                tmp_file = self.config_file + ".tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.config_file)
+                self._saved_payload = payload
+                self._mtime = self._file_mtime()
+                logger.info(f"Configuration saved to {self.config_file}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to save config: {e}")
+                return False
+    
+    def reload(self, force: bool = False) -> bool:
+        """檔案有變更時重新載入配置並通知監聽者，返回是否已重新載入"""
+        with self._reload_lock:
+            if not force and self._file_mtime() == self._mtime:
+                return False
+            self.config = self.load()
+        for callback in list(self._listeners):
+            try:
+                callback(self.config)
+            except Exception as e:
+                logger.error(f"Config change listener failed: {e}")
+        return True
+    
+    def on_change(self, callback: Callable[[Dict[str, Any]], None]):
+        """註冊配置重新載入後的回調"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
     
     def get(self, key: str, default: Any = None) -> Any:
         """獲取配置值"""
         return self.config.get(key, default)
     
+    def get_many(self, keys, default: Any = None) -> Dict[str, Any]:
+        """批量獲取配置值（缺少的鍵使用 default），返回 {鍵: 值}"""
+        config = self.config
+        return {key: config.get(key, default) for key in keys}
+    
+    def get_delay_range(self, prefix: str) -> Tuple[int, int]:
+        """獲取延遲範圍 (min, max)，prefix 為 press_delay / release_delay / trigger_cooldown"""
+        return self.delays[prefix]
+    
     def set(self, key: str, value: Any):
         """設置配置值"""
         self.config[key] = value
+        self._snapshot_dirty = True
+        if key in _DELAY_RANGE_KEYS:
+            self.delays = _compute_delay_ranges(self.config)
     
     def update(self, updates: Dict[str, Any]):
         """批量更新配置"""
         self.config.update(updates)
+        self._snapshot_dirty = True
+        if not _DELAY_RANGE_KEYS.isdisjoint(updates):
+            self.delays = _compute_delay_ranges(self.config)
     
     def reset_to_default(self):
         """重置為預設配置"""
         self.config = DEFAULT_CONFIG.copy()
+        self._snapshot_dirty = True
+        self.delays = _compute_delay_ranges(self.config)
         logger.info("Configuration reset to default")
     
-    def get_all(self) -> Dict[str, Any]:
-        """獲取所有配置"""
-        return self.config.copy()
+    def get_all(self) -> Mapping[str, Any]:
+        """獲取所有配置（唯讀快照，配置變更後才重建）"""
+        if self._snapshot_dirty or self._snapshot is None:
+            self._snapshot = MappingProxyType(dict(self.config))
+            self._snapshot_dirty = False
+        return self._snapshot
 
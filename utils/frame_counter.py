@@ -0,0 +1,37 @@
+"""
+幀計數器模組
+多個擷取線程遞增、單一讀取線程讀取和重置的無鎖計數器
+"""
+
+import itertools
+
+
+class FrameCounter:
+    """
+    無鎖幀計數器
+
+    itertools.count 的 next() 在 CPython 中是單一 C 調用，不會被其他線程打斷，
+    因此遞增無需加鎖。讀取同樣透過 next() 取得當前值，並扣除讀取方自身消耗的次數。
+    reset() 與 value() 只能在同一個讀取線程（主線程）中調用。
+    """
+
+    def __init__(self):
+        self._counter = itertools.count()
+        self._base = 0   # 重置後的第一個計數值
+        self._reads = 0  # 重置後讀取方消耗的計數次數
+        self.reset()
+
+    def increment(self):
+        """計數加一（任意線程）"""
+        next(self._counter)
+
+    def reset(self):
+        """計數歸零（僅讀取線程）"""
+        self._base = next(self._counter) + 1
+        self._reads = 0
+
+    def value(self) -> int:
+        """返回重置以來的計數（僅讀取線程）"""
+        count = next(self._counter) - self._base - self._reads
+        self._reads += 1
+        return count
@@ -0,0 +1,66 @@
+"""
+最新幀槽模組
+單一槽位的「最新值優先」交接容器，生產者覆蓋舊值，消費者只取最新值
+"""
+
+import threading
+from typing import Any, Optional
+
+
+class LatestSlot:
+    """最新值槽位（新值覆蓋未取走的舊值）"""
+
+    maxsize = 1
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._value = None
+        self._has_value = False
+        self.dropped = 0  # 被覆蓋（未處理）的值數量
+
+    def put(self, value: Any) -> Any:
+        """放入新值，覆蓋尚未取走的舊值；返回被覆蓋的舊值（沒有時返回 None），調用方可回收其緩衝區"""
+        with self._lock:
+            replaced = None
+            if self._has_value:
+                self.dropped += 1
+                replaced = self._value
+            self._value = value
+            self._has_value = True
+            self._event.set()
+        return replaced
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """
+        取出最新值（阻塞直到有值）
+
+        Raises:
+            TimeoutError: 超時仍無新值
+        """
+        while True:
+            if not self._event.wait(timeout):
+                raise TimeoutError("LatestSlot.get timed out")
+            with self._lock:
+                if self._has_value:
+                    value = self._value
+                    self._value = None
+                    self._has_value = False
+                    self._event.clear()
+                    return value
+                self._event.clear()
+
+    def clear(self):
+        """清空槽位"""
+        with self._lock:
+            self._value = None
+            self._has_value = False
+            self._event.clear()
+
+    def qsize(self) -> int:
+        """當前待處理值數量（0 或 1）"""
+        return 1 if self._has_value else 0
+
+    def empty(self) -> bool:
+        """槽位是否為空"""
+        return not self._has_value